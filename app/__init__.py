@@ -1,6 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import router
+from app.ai.helpers.llm_clients import warm_up_llm_clients
+from app.ai.helpers.precomputed_retrieval import load_precomputed_retrieval
+from app.utils.static_content import reload_static_content
+from app.utils.trait_norms_crud import trait_norms_seed
+from app.database.connection import SessionLocal
+from app.ai.helpers.chains import GPT_MODEL
+from app.fireflies.helpers import CURRENT_MODEL, CHUNK_EVALUATION_MODEL
 
 def create_app() -> FastAPI:
     app = FastAPI()
@@ -24,4 +31,28 @@ def create_app() -> FastAPI:
     
     app.include_router(router=router)
 
+    @app.on_event("startup")
+    async def warm_up_ai_clients():
+        warm_up_llm_clients([
+            (GPT_MODEL, 0),
+            (CHUNK_EVALUATION_MODEL, 0.3),
+            (CURRENT_MODEL, 0.3)
+        ])
+
+    @app.on_event("startup")
+    async def load_retrieval_index():
+        load_precomputed_retrieval()
+
+    @app.on_event("startup")
+    async def load_static_content():
+        reload_static_content()
+
+    @app.on_event("startup")
+    async def seed_trait_norms():
+        db = SessionLocal()
+        try:
+            trait_norms_seed(db)
+        finally:
+            db.close()
+
     return app
\ No newline at end of file
@@ -6,4 +6,14 @@ load_dotenv()
 ANTHROPIC_API_KEY=os.environ["ANTHROPIC_API_KEY"]
 OPENAI_API_KEY=os.environ["OPENAI_API_KEY"]
 PINECONE_API_KEY=os.environ["PINECONE_API_KEY"]
-USE_SERVERLESS=os.environ["USE_SERVERLESS"]
\ No newline at end of file
+USE_SERVERLESS=os.environ["USE_SERVERLESS"]
+
+# Retrieval cache in front of the vectorstore (query embeddings + top-k documents)
+RETRIEVAL_CACHE_TTL_SECONDS=int(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "86400"))
+RETRIEVAL_CACHE_MAX_ENTRIES=int(os.getenv("RETRIEVAL_CACHE_MAX_ENTRIES", "2048"))
+# How often each process re-reads the shared index version that the cached documents are keyed by
+RETRIEVAL_INDEX_VERSION_CHECK_SECONDS=int(os.getenv("RETRIEVAL_INDEX_VERSION_CHECK_SECONDS", "60"))
+
+# Vectorstore backend: "pinecone" (default) or "local" (NumPy index built by setup_local_vectorstore)
+VECTORSTORE_BACKEND=os.getenv("VECTORSTORE_BACKEND", "pinecone")
+LOCAL_VECTORSTORE_DIR=os.getenv("LOCAL_VECTORSTORE_DIR", "app/ai/data/local_vectorstore")
@@ -1,13 +1,10 @@
-import json
+from app.utils.static_content import get_static_content
 
 def get_initial_questions():
-  with open('app/ai/data/initial_questions.json') as json_file:
-    data = json.load(json_file)
-
-  return data
+  return get_static_content().initial_questions
 
 def get_initial_questions_with_answers(answers):
-  initial_questions = get_initial_questions()["initial_questions"]
+  initial_questions = get_initial_questions()
 
   data = ""
 
@@ -16,9 +13,9 @@ def get_initial_questions_with_answers(answers):
 
     #todo: see if adding options is necessary
     options = ""
-    for option in question["options_w_traits"]:
+    for option in question.options:
       options += f"""
-        - {option['name']} ({option['trait']})\n
+        - {option.name} ({option.trait})\n
       """
 
     data += f"""
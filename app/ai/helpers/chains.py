@@ -1,16 +1,16 @@
 
-from langchain_openai import ChatOpenAI
+import hashlib
 from langchain_core.output_parsers import JsonOutputParser
 from langchain.prompts import PromptTemplate
-from app.ai.const import OPENAI_API_KEY
 from app.ai.helpers.tokens import count_tokens
+from app.ai.helpers.llm_clients import get_llm
 
 # GPT_MODEL = "gpt-4-1106-preview"
 # GPT_MODEL = "gpt-3.5-turbo-0125"
 GPT_MODEL = "gpt-4o-2024-05-13"
 
 def generate_actions(prompt_template, inputs):
-  llm = ChatOpenAI(model=GPT_MODEL,  openai_api_key=OPENAI_API_KEY, temperature=0)
+  llm = get_llm(model=GPT_MODEL, temperature=0)
 
   chain = prompt_template | llm | JsonOutputParser()
 
@@ -18,10 +18,23 @@ def generate_actions(prompt_template, inputs):
 
   return response
 
-#data checker
-def check_user_input(company_size, industry, employee_role, role_description):
-  llm_model = ChatOpenAI(model=GPT_MODEL, openai_api_key=OPENAI_API_KEY, temperature=0)
+# Non-blocking version for async routes; awaits the OpenAI call instead of holding the event loop
+async def generate_actions_async(prompt_template, inputs):
+  llm = get_llm(model=GPT_MODEL, temperature=0)
+
+  chain = prompt_template | llm | JsonOutputParser()
+
+  response = await chain.ainvoke(inputs)
+
+  return response
 
+# Content address of a generation request: hash of the fully rendered prompt (template + all inputs)
+def prompt_fingerprint(prompt_template, inputs):
+  rendered_prompt = prompt_template.format(**inputs)
+  return hashlib.sha256(f"{GPT_MODEL}\n{rendered_prompt}".encode("utf-8")).hexdigest()
+
+#data checker
+def user_input_grader_prompt():
   prompt = PromptTemplate(
     template="""
       <|begin_of_text|>
@@ -44,8 +57,15 @@ def check_user_input(company_size, industry, employee_role, role_description):
       input_variables=["company_size", "industry", "employee_role", "role_description"],
     )
 
+  return prompt
+
+def check_user_input(company_size, industry, employee_role, role_description):
+  llm_model = get_llm(model=GPT_MODEL, temperature=0)
+
+  prompt = user_input_grader_prompt()
+
   input_grader = prompt | llm_model | JsonOutputParser()
   
   response =  input_grader.invoke({"company_size": company_size, "industry": industry, "employee_role": employee_role, "role_description": role_description})
 
-  return response
\ No newline at end of file
+  return response
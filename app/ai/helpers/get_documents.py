@@ -1,15 +1,16 @@
 from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
+from app.ai.helpers.llm_clients import get_llm
+from app.ai.helpers.retrieval_cache import cached_similarity_search, cached_similarity_search_async
+from app.ai.helpers.precomputed_retrieval import get_precomputed_docs
 from langchain_core.output_parsers import JsonOutputParser
 
 # GPT_MODEL = "gpt-4-1106-preview"
 # GPT_MODEL = "gpt-3.5-turbo-0125"
 GPT_MODEL = "gpt-4o-2024-05-13"
 
-from app.ai.const import OPENAI_API_KEY
 def grade_docs(trait, practice, retrieved_docs, filename, model=GPT_MODEL):
   # print("Grading Retrieved Docs")
-  llm_model = ChatOpenAI(model=model, openai_api_key=OPENAI_API_KEY, temperature=0)
+  llm_model = get_llm(model=model, temperature=0)
   prompt = PromptTemplate(
     template="""
       <|begin_of_text|>
@@ -47,7 +48,10 @@ def format_docs(docs):
 def get_docs(vectorstore, trait, practice):
   
   query = f"{trait} - {practice}"
-  retrieved_docs = vectorstore.similarity_search(query=query, k=3)
+  # Known trait-practice pairs are served from the precomputed index; others go to the vectorstore
+  retrieved_docs = get_precomputed_docs(query=query, k=3)
+  if retrieved_docs is None:
+    retrieved_docs = cached_similarity_search(vectorstore=vectorstore, query=query, k=3)
   retrieved_docs_string = ""
   for idx, doc in enumerate(retrieved_docs):
     # filename is for more context on what document it came from
@@ -71,4 +75,16 @@ def get_docs(vectorstore, trait, practice):
   else:
     final_docs = format_docs(filtered_docs)
     
-    return final_docs
\ No newline at end of file
+    return final_docs
+
+async def get_docs_async(vectorstore, trait, practice):
+  # Same as get_docs, but cache misses (query embedding and vector search) are awaited
+  query = f"{trait} - {practice}"
+  retrieved_docs = get_precomputed_docs(query=query, k=3)
+  if retrieved_docs is None:
+    retrieved_docs = await cached_similarity_search_async(vectorstore=vectorstore, query=query, k=3)
+
+  if len(retrieved_docs) == 0:
+    return ""
+  else:
+    return format_docs(retrieved_docs)
@@ -1,11 +1,29 @@
+import os
+import weakref
 from langchain_openai.embeddings import OpenAIEmbeddings
 from langchain_pinecone import PineconeVectorStore
+from app.ai.const import VECTORSTORE_BACKEND, LOCAL_VECTORSTORE_DIR
+from app.ai.helpers.local_vectorstore import LocalVectorStore
 
 EMBEDDING_MODEL = "text-embedding-ada-002"
 
-def get_vectorstore(index_name: str, embedding_model: str = EMBEDDING_MODEL):
+def get_local_vectorstore_path(index_name: str):
+  return os.path.join(LOCAL_VECTORSTORE_DIR, index_name)
+
+# (backend, index_name) of every vectorstore built here, so retrieval caches can key by the index
+_vectorstore_indexes = weakref.WeakKeyDictionary()
+
+def get_vectorstore_index(vectorstore):
+  return _vectorstore_indexes.get(vectorstore, (type(vectorstore).__name__, str(id(vectorstore))))
+
+def get_vectorstore(index_name: str, embedding_model: str = EMBEDDING_MODEL, backend: str = VECTORSTORE_BACKEND):
   # print("Retrieving Pinecone Vectorstore")
   embeddings = OpenAIEmbeddings(model=embedding_model)
-  pinecone_vectorstore = PineconeVectorStore.from_existing_index(index_name=index_name, embedding=embeddings)
-  
-  return pinecone_vectorstore
\ No newline at end of file
+
+  if backend == "local":
+    vectorstore = LocalVectorStore.load(get_local_vectorstore_path(index_name), embedding=embeddings)
+  else:
+    vectorstore = PineconeVectorStore.from_existing_index(index_name=index_name, embedding=embeddings)
+
+  _vectorstore_indexes[vectorstore] = (backend, index_name)
+  return vectorstore
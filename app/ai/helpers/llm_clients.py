@@ -0,0 +1,30 @@
+from threading import Lock
+from langchain_openai import ChatOpenAI
+from app.ai.const import OPENAI_API_KEY
+
+# Long-lived ChatOpenAI clients keyed by (model, temperature).
+# Each ChatOpenAI owns its own HTTP connection pool, so reusing them avoids a new TLS handshake per call.
+_llm_clients = {}
+_llm_clients_lock = Lock()
+
+def get_llm(model: str, temperature: float = 0):
+  key = (model, temperature)
+  llm = _llm_clients.get(key)
+
+  if llm is None:
+    with _llm_clients_lock:
+      llm = _llm_clients.get(key)
+      if llm is None:
+        llm = ChatOpenAI(model=model, openai_api_key=OPENAI_API_KEY, temperature=temperature)
+        _llm_clients[key] = llm
+
+  return llm
+
+def warm_up_llm_clients(configs):
+  # Build the clients up front (at app startup) so the first request does not pay for it
+  for model, temperature in configs:
+    get_llm(model=model, temperature=temperature)
+
+def clear_llm_clients():
+  with _llm_clients_lock:
+    _llm_clients.clear()
@@ -0,0 +1,47 @@
+from langchain_community.document_loaders import TextLoader, Docx2txtLoader, PyPDFLoader
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+def load_and_split_document(file_type: str, file_path: str):
+  # load text or pdf
+  # args: filename, text or pdf
+  """
+  if text:
+    loader = TextLoader
+  if pdf:
+    loader = PyPDFLoader
+  if docx:
+    loader = Docx2txtLoader
+  """
+  print(f"Loading {file_type} file: {file_path}...")
+  loader = None
+  if (file_type == 'text'):
+    loader = TextLoader(file_path)
+  elif(file_type == 'pdf'):
+    loader = PyPDFLoader(file_path)
+  elif(file_type == 'docs'):
+    loader = Docx2txtLoader(file_path)
+
+  documents = loader.load()
+  print("Document length:", len(documents))
+
+  # for each file content, decode and store filename as metadata
+  filename = file_path.split("\\")[-1].replace(".docx", "")
+  print("filename", filename)
+  for document in documents:
+    document.metadata['filename'] = filename
+
+    # todo if Jeremy gives a lot of docs per trait -- use as new metadata per document
+    # document.metadata['trait'] = ""
+
+
+  # Initialize the RecursiveCharacterTextSplitter for splitting text
+  # predefined length -- how many chars do we want per chunk
+  # overlap - character 0 - 1000, first document. Then, there's an overlap of +-150 characters between doc 1 and doc 2
+  print("Splitting text...")
+  text_splitter = RecursiveCharacterTextSplitter(separators=["\n\n", "\n"], chunk_size=1000, chunk_overlap=150)
+  chunked_documents = text_splitter.split_documents(documents)
+  print("Chunk sample", chunked_documents[0])
+
+  print('Length of chunks:', len(chunked_documents))
+
+  return filename, chunked_documents
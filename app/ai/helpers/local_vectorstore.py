@@ -0,0 +1,93 @@
+import os
+import json
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+EMBEDDINGS_FILE = "embeddings.npy"
+DOCUMENTS_FILE = "documents.json"
+
+class LocalVectorStore(VectorStore):
+  """In-process vectorstore: a matrix of L2-normalized embeddings searched by brute-force cosine similarity.
+
+  The training corpus is small (a few hundred chunks), so a single matrix-vector product is
+  faster than any network round trip. Saved indexes are memory-mapped from disk on load.
+  """
+
+  def __init__(self, embedding, vectors: np.ndarray, documents: list):
+    self._embedding = embedding
+    self._vectors = vectors
+    self._documents = documents
+
+  @property
+  def embeddings(self):
+    return self._embedding
+
+  @staticmethod
+  def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+  def add_texts(self, texts, metadatas=None, **kwargs):
+    texts = list(texts)
+    metadatas = metadatas or [{} for _ in texts]
+    vectors = self._normalize(self._embedding.embed_documents(texts))
+
+    # Memory-mapped matrices are read-only; appending builds a new in-memory matrix
+    self._vectors = vectors if len(self._documents) == 0 else np.vstack([self._vectors, vectors])
+    self._documents.extend(
+      Document(page_content=text, metadata=metadata) for text, metadata in zip(texts, metadatas)
+    )
+    return [str(idx) for idx in range(len(self._documents) - len(texts), len(self._documents))]
+
+  @classmethod
+  def from_texts(cls, texts, embedding, metadatas=None, **kwargs):
+    store = cls(embedding=embedding, vectors=np.empty((0, 0), dtype=np.float32), documents=[])
+    store.add_texts(texts, metadatas=metadatas)
+    return store
+
+  def similarity_search_with_score_by_vector(self, embedding, k: int = 4):
+    if len(self._documents) == 0:
+      return []
+
+    scores = self._vectors @ self._normalize(embedding)
+    k = min(k, len(self._documents))
+    # argpartition picks the top k in O(n); only those k get sorted
+    top_k = np.argpartition(-scores, k - 1)[:k]
+    top_k = top_k[np.argsort(-scores[top_k])]
+
+    return [(self._documents[idx], float(scores[idx])) for idx in top_k]
+
+  def similarity_search_by_vector(self, embedding, k: int = 4, **kwargs):
+    return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k=k)]
+
+  # Search is in-memory and sub-millisecond, so it runs inline instead of in an executor
+  async def asimilarity_search_by_vector(self, embedding, k: int = 4, **kwargs):
+    return self.similarity_search_by_vector(embedding, k=k)
+
+  def similarity_search_with_score(self, query: str, k: int = 4, **kwargs):
+    return self.similarity_search_with_score_by_vector(self._embedding.embed_query(query), k=k)
+
+  def similarity_search(self, query: str, k: int = 4, **kwargs):
+    return self.similarity_search_by_vector(self._embedding.embed_query(query), k=k)
+
+  def _select_relevance_score_fn(self):
+    return self._cosine_relevance_score_fn
+
+  def save(self, directory_path: str):
+    os.makedirs(directory_path, exist_ok=True)
+    np.save(os.path.join(directory_path, EMBEDDINGS_FILE), self._vectors)
+    with open(os.path.join(directory_path, DOCUMENTS_FILE), "w") as file:
+      json.dump(
+        [{"page_content": doc.page_content, "metadata": doc.metadata} for doc in self._documents],
+        file
+      )
+
+  @classmethod
+  def load(cls, directory_path: str, embedding):
+    vectors = np.load(os.path.join(directory_path, EMBEDDINGS_FILE), mmap_mode="r")
+    with open(os.path.join(directory_path, DOCUMENTS_FILE), "r") as file:
+      documents = [Document(page_content=doc["page_content"], metadata=doc["metadata"]) for doc in json.load(file)]
+
+    return cls(embedding=embedding, vectors=vectors, documents=documents)
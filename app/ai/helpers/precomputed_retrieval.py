@@ -0,0 +1,41 @@
+import os
+import json
+from langchain_core.documents import Document
+
+# Artifact written by app/ai/setup/setup_retrieval_index.py
+PRECOMPUTED_RETRIEVAL_PATH = "app/ai/data/precomputed_retrieval.json"
+
+# query ("{trait} - {practice}") -> list of Documents, loaded once at startup
+_precomputed_docs = {}
+_precomputed_k = None
+
+def load_precomputed_retrieval(path: str = PRECOMPUTED_RETRIEVAL_PATH):
+  global _precomputed_docs, _precomputed_k
+
+  if not os.path.exists(path):
+    print(f"No precomputed retrieval index at {path}; using live vectorstore retrieval")
+    _precomputed_docs, _precomputed_k = {}, None
+    return 0
+
+  with open(path, "r") as file:
+    data = json.load(file)
+
+  # Chunks are stored once and referenced by index from each query
+  chunks = [
+    Document(page_content=chunk["page_content"], metadata={"filename": chunk["filename"]})
+    for chunk in data["chunks"]
+  ]
+  _precomputed_docs = {
+    query: [chunks[idx] for idx in chunk_ids]
+    for query, chunk_ids in data["queries"].items()
+  }
+  _precomputed_k = data["k"]
+
+  print(f"Loaded precomputed retrieval for {len(_precomputed_docs)} trait-practice pairs")
+  return len(_precomputed_docs)
+
+# Returns None for unknown pairs (or a different k) so callers fall back to the vectorstore
+def get_precomputed_docs(query: str, k: int):
+  if k != _precomputed_k:
+    return None
+  return _precomputed_docs.get(query)
@@ -0,0 +1,132 @@
+import logging
+from threading import Lock
+from contextlib import closing
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.ai.const import RETRIEVAL_CACHE_TTL_SECONDS, RETRIEVAL_CACHE_MAX_ENTRIES
+from app.ai.helpers.get_vectorstore import get_vectorstore_index
+from app.database.connection import SessionLocal, SchedulerSessionLocal
+from app.database.models import Counters
+
+logger = logging.getLogger(__name__)
+
+# In-process LRU + TTL caches for vectorstore retrieval of a query string ("{trait} - {practice}").
+# Query embeddings only depend on the embedding model, so they are keyed by model and query.
+# Documents depend on the index, so they are keyed by backend, index name and index version.
+# The version is a row in counters shared by every process: the setup scripts bump it after
+# changing an index (bump_retrieval_index_version) and each process re-reads it in the scheduled
+# refresh_retrieval_index_versions_job, every RETRIEVAL_INDEX_VERSION_CHECK_SECONDS, so documents
+# cached before the change stop being served. Requests only read the in-memory copy.
+_embedding_cache = TTLCache(maxsize=RETRIEVAL_CACHE_MAX_ENTRIES, ttl=RETRIEVAL_CACHE_TTL_SECONDS)
+_documents_cache = TTLCache(maxsize=RETRIEVAL_CACHE_MAX_ENTRIES, ttl=RETRIEVAL_CACHE_TTL_SECONDS)
+_retrieval_cache_lock = Lock()
+_retrieval_cache_stats = {"embedding_hits": 0, "embedding_misses": 0, "documents_hits": 0, "documents_misses": 0}
+
+def _cache_get(cache, stat_name, key):
+  with _retrieval_cache_lock:
+    value = cache.get(key)
+    _retrieval_cache_stats[f"{stat_name}_hits" if value is not None else f"{stat_name}_misses"] += 1
+    return value
+
+def _cache_set(cache, key, value):
+  with _retrieval_cache_lock:
+    cache[key] = value
+
+INDEX_VERSION_COUNTER_PREFIX = "retrieval_index_version:"
+
+def _index_version_counter(backend, index_name):
+  return f"{INDEX_VERSION_COUNTER_PREFIX}{backend}:{index_name}"
+
+# (backend, index_name) -> version, as of the last refresh
+_index_versions = {}
+
+# No I/O: safe to call on the request path. 0 until a refresh has seen a bump of the index
+def retrieval_index_version(backend, index_name):
+  with _retrieval_cache_lock:
+    return _index_versions.get((backend, index_name), 0)
+
+# Reads every index version in one query
+def refresh_retrieval_index_versions(db):
+  rows = db.execute(
+    select(Counters.name, Counters.value).where(Counters.name.startswith(INDEX_VERSION_COUNTER_PREFIX))
+  ).all()
+
+  versions = {}
+  for name, value in rows:
+    backend, index_name = name[len(INDEX_VERSION_COUNTER_PREFIX):].split(":", 1)
+    versions[(backend, index_name)] = value
+
+  with _retrieval_cache_lock:
+    _index_versions.update(versions)
+
+# Scheduled job, off the event loop and on its own session (from the scheduler pool); on failure
+# the last known versions keep being served until the next run
+def refresh_retrieval_index_versions_job():
+  try:
+    with closing(SchedulerSessionLocal()) as db:
+      refresh_retrieval_index_versions(db)
+  except Exception:
+    logger.exception("Reading the retrieval index versions failed")
+
+def _embedding_key(vectorstore, query):
+  return (getattr(vectorstore.embeddings, "model", None), query)
+
+def _documents_key(vectorstore, query, k):
+  backend, index_name = get_vectorstore_index(vectorstore)
+  return (backend, index_name, retrieval_index_version(backend, index_name), k, query)
+
+def cached_similarity_search(vectorstore, query, k):
+  documents_key = _documents_key(vectorstore, query, k)
+  documents = _cache_get(_documents_cache, "documents", documents_key)
+  if documents is not None:
+    return documents
+
+  embedding_key = _embedding_key(vectorstore, query)
+  embedding = _cache_get(_embedding_cache, "embedding", embedding_key)
+  if embedding is None:
+    embedding = vectorstore.embeddings.embed_query(query)
+    _cache_set(_embedding_cache, embedding_key, embedding)
+
+  documents = vectorstore.similarity_search_by_vector(embedding=embedding, k=k)
+  _cache_set(_documents_cache, documents_key, documents)
+  return documents
+
+async def cached_similarity_search_async(vectorstore, query, k):
+  documents_key = _documents_key(vectorstore, query, k)
+  documents = _cache_get(_documents_cache, "documents", documents_key)
+  if documents is not None:
+    return documents
+
+  embedding_key = _embedding_key(vectorstore, query)
+  embedding = _cache_get(_embedding_cache, "embedding", embedding_key)
+  if embedding is None:
+    embedding = await vectorstore.embeddings.aembed_query(query)
+    _cache_set(_embedding_cache, embedding_key, embedding)
+
+  documents = await vectorstore.asimilarity_search_by_vector(embedding=embedding, k=k)
+  _cache_set(_documents_cache, documents_key, documents)
+  return documents
+
+# Call after an index's contents change (see setup_training_data / setup_local_vectorstore):
+# every process stops serving documents cached for the previous version after its next refresh
+def bump_retrieval_index_version(backend: str, index_name: str):
+  bump = pg_insert(Counters).values(name=_index_version_counter(backend, index_name), value=1)
+  with closing(SessionLocal()) as db:
+    version = db.execute(
+      bump.on_conflict_do_update(index_elements=[Counters.name], set_={"value": Counters.value + 1})
+      .returning(Counters.value)
+    ).scalar_one()
+    db.commit()
+
+  with _retrieval_cache_lock:
+    _index_versions[(backend, index_name)] = version
+  return version
+
+def get_retrieval_cache_stats():
+  with _retrieval_cache_lock:
+    return {
+      **_retrieval_cache_stats,
+      "embedding_entries": len(_embedding_cache),
+      "documents_entries": len(_documents_cache)
+    }
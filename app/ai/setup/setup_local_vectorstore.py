@@ -0,0 +1,35 @@
+import os
+from langchain_openai.embeddings import OpenAIEmbeddings
+from app.ai.helpers.load_documents import load_and_split_document
+from app.ai.helpers.local_vectorstore import LocalVectorStore
+from app.ai.helpers.get_vectorstore import EMBEDDING_MODEL, get_local_vectorstore_path
+from app.ai.helpers.retrieval_cache import bump_retrieval_index_version
+
+# Builds the on-disk NumPy index used when VECTORSTORE_BACKEND=local,
+# from the same training documents and chunking as setup_training_data.
+# Only the search is local: queries are still embedded with OpenAI (EMBEDDING_MODEL) at request
+# time, except for the trait - practice pairs served from the precomputed retrieval index.
+def setup_local_vectorstore(index_name: str, directory_path: str = "training_data"):
+  print(f"Setting up local vectorstore from {directory_path}")
+  chunked_documents = []
+  for filename in os.listdir(directory_path):
+    if filename.endswith(".docx"):
+      file_path = os.path.join(directory_path, filename)
+      _, file_chunks = load_and_split_document("docs", file_path)
+      chunked_documents.extend(file_chunks)
+
+  print("Embedding", len(chunked_documents), "chunks...")
+  embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
+  local_vectorstore = LocalVectorStore.from_documents(documents=chunked_documents, embedding=embeddings)
+
+  output_path = get_local_vectorstore_path(index_name)
+  local_vectorstore.save(output_path)
+  print(f"Local vectorstore saved to {output_path}")
+
+  # The running API processes stop serving retrievals cached from the previous index
+  bump_retrieval_index_version("local", index_name)
+
+
+# Guarded so importing this module does not rebuild the index (and spend embedding calls)
+if __name__ == "__main__":
+  setup_local_vectorstore(index_name="peak-ai")
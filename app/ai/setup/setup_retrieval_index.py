@@ -0,0 +1,42 @@
+import json
+from app.ai.helpers.get_vectorstore import get_vectorstore
+from app.ai.helpers.precomputed_retrieval import PRECOMPUTED_RETRIEVAL_PATH
+
+# Precomputes the top-k vectorstore context for every trait - practice pair that
+# /development-actions can ask for (practice_followup.json) and writes it to a local artifact.
+# Re-run after setup_training_data whenever the training documents change.
+def setup_retrieval_index(index_name: str, k: int = 3, output_path: str = PRECOMPUTED_RETRIEVAL_PATH):
+  with open("app/utils/data/practice_followup.json", "r") as file:
+    traits_practices = json.load(file)
+
+  vectorstore = get_vectorstore(index_name=index_name)
+
+  chunks = []
+  chunk_ids = {}
+  queries = {}
+
+  for trait, practices in traits_practices.items():
+    for practice in practices.values():
+      query = f"{trait} - {practice}"
+      print(f"Retrieving: {query}")
+      retrieved_docs = vectorstore.similarity_search(query=query, k=k)
+
+      query_chunk_ids = []
+      for doc in retrieved_docs:
+        chunk_key = (doc.metadata['filename'], doc.page_content)
+        if chunk_key not in chunk_ids:
+          chunk_ids[chunk_key] = len(chunks)
+          chunks.append({"filename": doc.metadata['filename'], "page_content": doc.page_content})
+        query_chunk_ids.append(chunk_ids[chunk_key])
+
+      queries[query] = query_chunk_ids
+
+  with open(output_path, "w") as file:
+    json.dump({"index_name": index_name, "k": k, "chunks": chunks, "queries": queries}, file, separators=(",", ":"))
+
+  print(f"Wrote {len(queries)} queries and {len(chunks)} unique chunks to {output_path}")
+
+
+# Guarded so importing this module does not rebuild the index (and spend embedding calls)
+if __name__ == "__main__":
+  setup_retrieval_index(index_name="peak-ai")
@@ -1,91 +1,134 @@
-import os 
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from app.ai.const import OPENAI_API_KEY, PINECONE_API_KEY
-from langchain_community.document_loaders import TextLoader, Docx2txtLoader, PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_pinecone import PineconeVectorStore
 from pinecone import Pinecone
 from langchain_openai.embeddings import OpenAIEmbeddings
-
-def add_document_to_vectorstore(index_name: str, file_type: str, file_path: str):
-  # load text or pdf
-  # args: name, filename, text or pdf
-  """
-  if text:
-    loader = TextLoader
-  if pdf:
-    loader = PyPDFLoader
-  if docx:
-    loader = Docx2txtLoader
-  """
-
-
+from app.ai.helpers.get_vectorstore import EMBEDDING_MODEL
+from app.ai.helpers.retrieval_cache import bump_retrieval_index_version
+from app.ai.helpers.load_documents import load_and_split_document
+
+# OpenAI accepts up to 2048 inputs per embeddings request; stay below it
+EMBEDDING_BATCH_SIZE = 1000
+# Pinecone recommends upserts of ~100 vectors per request
+UPSERT_BATCH_SIZE = 100
+LOAD_WORKERS = 4
+UPSERT_WORKERS = 4
+
+# Stores the content hash of every ingested file so unchanged guides are not re-embedded
+def get_manifest_path(index_name: str, directory_path: str):
+  return os.path.join(directory_path, f".{index_name}_manifest.json")
+
+def load_manifest(manifest_path: str):
+  if not os.path.exists(manifest_path):
+    return {}
+  with open(manifest_path, "r") as file:
+    return json.load(file)
+
+def save_manifest(manifest_path: str, manifest: dict):
+  with open(manifest_path, "w") as file:
+    json.dump(manifest, file, indent=2)
+
+def file_content_hash(file_path: str):
+  sha256 = hashlib.sha256()
+  with open(file_path, "rb") as file:
+    for block in iter(lambda: file.read(65536), b""):
+      sha256.update(block)
+  return sha256.hexdigest()
+
+def delete_namespace(index, namespace: str):
+  # Each guide lives in its own namespace; clear it so a re-ingested file does not leave stale chunks
+  try:
+    index.delete(delete_all=True, namespace=namespace)
+  except Exception as e:
+    # Namespace does not exist yet (first ingestion of this file)
+    print(f"Skipping delete of namespace {namespace}: {e}")
+
+def upsert_documents(index, namespace: str, chunked_documents: list, vectors: list):
+  # Same metadata layout as PineconeVectorStore (page content under "text") so retrieval is unchanged
+  records = [
+    {
+      "id": f"{namespace}-{i}",
+      "values": vector,
+      "metadata": {**document.metadata, "text": document.page_content}
+    }
+    for i, (document, vector) in enumerate(zip(chunked_documents, vectors))
+  ]
+
+  delete_namespace(index, namespace)
+  index.upsert(vectors=records, namespace=namespace, batch_size=UPSERT_BATCH_SIZE)
+  print(f"Upserted {len(records)} chunks into namespace {namespace}")
+
+def add_documents_to_vectorstore(index_name: str, file_type: str, file_paths: list):
   pc = Pinecone(api_key=PINECONE_API_KEY)
   if index_name not in pc.list_indexes().names():
     print("ERROR: Index does not exist. Please create the index first.")
     return None
+  index = pc.Index(index_name)
+
+  # Loading and splitting .docx files is CPU-bound, so it runs in a process pool
+  with ProcessPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+    loaded_files = list(executor.map(load_and_split_document, [file_type] * len(file_paths), file_paths))
+
+  # One embeddings call for every chunk of every changed file; the client splits it into EMBEDDING_BATCH_SIZE requests
+  print("Setting up embeddings...")
+  embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, chunk_size=EMBEDDING_BATCH_SIZE)
+  all_chunks = [document for _, chunked_documents in loaded_files for document in chunked_documents]
+  all_vectors = embeddings.embed_documents([document.page_content for document in all_chunks])
+
+  #todo: once jeremy gives documents for specific traits, add to namespace. but for now, namespace per file
+  with ThreadPoolExecutor(max_workers=UPSERT_WORKERS) as executor:
+    futures = []
+    offset = 0
+    for filename, chunked_documents in loaded_files:
+      vectors = all_vectors[offset:offset + len(chunked_documents)]
+      offset += len(chunked_documents)
+      futures.append(executor.submit(upsert_documents, index, filename, chunked_documents, vectors))
+
+    for future in futures:
+      future.result()
+
+  print("Documents successfully added to Pinecone...")
+  return index
 
 
-  print(f"Loading {file_type} file: {file_path}...")
-  loader = None
-  if (file_type == 'text'):
-    loader = TextLoader(file_path)
-  elif(file_type == 'pdf'):
-    loader = PyPDFLoader(file_path)
-  elif(file_type == 'docs'):
-    loader = Docx2txtLoader(file_path)
-
-  documents = loader.load()
-  print("Document length:", len(documents))
-
-  # for each file content, decode and store filename as metadata
-  filename = file_path.split("\\")[-1].replace(".docx", "")
-  print("filename", filename)
-  for document in documents:
-    document.metadata['filename'] = filename
-
-    # todo if Jeremy gives a lot of docs per trait -- use as new metadata per document
-    # document.metadata['trait'] = ""
-
-
-  # Initialize the RecursiveCharacterTextSplitter for splitting text
-  # predefined length -- how many chars do we want per chunk
-  # overlap - character 0 - 1000, first document. Then, there's an overlap of +-150 characters between doc 1 and doc 2
-  print("Splitting text...")
-  text_splitter = RecursiveCharacterTextSplitter(separators=["\n\n", "\n"], chunk_size=1000, chunk_overlap=150)
-  chunked_documents = text_splitter.split_documents(documents)
-  print("Chunk sample", chunked_documents[0])
-
-  print('Length of chunks:', len(chunked_documents))
-  
-  print("Setting up embeddings and vectorstore...")
-  embeddings = OpenAIEmbeddings()
-
-  #todo: once jeremy gives documents for specific traits, add to namespace. but for now, no namespace
-  pinecone = PineconeVectorStore.from_documents(
-    documents=chunked_documents,
-    embedding=embeddings,
-    index_name=index_name,
-    namespace=filename
-  )
-  
-  # only used for actual text not from a loaded file
-  # pinecone = PineconeVectorStore.from_texts(
-  #   documents=chunked_documents,
-  #   embedding=embeddings,
-  #   index_name=index_name,
-  #   namespace=""
-  # )
-
-  print("Document successfully added to Pinecone...")
-  return pinecone
-
-
-def setup_training_data(index_name:str, directory_path:str = "training_data"):
+def setup_training_data(index_name:str, directory_path:str = "training_data", force: bool = False):
   print(f"Setting up training data from {directory_path}")
+  manifest_path = get_manifest_path(index_name, directory_path)
+  manifest = {} if force else load_manifest(manifest_path)
+
+  current_hashes = {}
+  changed_files = []
   for filename in os.listdir(directory_path):
     if filename.endswith(".docx"):
       file_path = os.path.join(directory_path, filename)
-      add_document_to_vectorstore(index_name, "docs", file_path)
+      current_hashes[filename] = file_content_hash(file_path)
+      if manifest.get(filename) != current_hashes[filename]:
+        changed_files.append(file_path)
+
+  removed_files = [filename for filename in manifest if filename not in current_hashes]
+  print(f"{len(changed_files)} changed, {len(removed_files)} removed, {len(current_hashes) - len(changed_files)} unchanged")
+
+  if not changed_files and not removed_files:
+    return
+
+  if changed_files:
+    if add_documents_to_vectorstore(index_name, "docs", changed_files) is None:
+      return
+
+  if removed_files:
+    index = Pinecone(api_key=PINECONE_API_KEY).Index(index_name)
+    for filename in removed_files:
+      # Same namespace naming as load_and_split_document
+      delete_namespace(index, os.path.join(directory_path, filename).split("\\")[-1].replace(".docx", ""))
+
+  save_manifest(manifest_path, current_hashes)
+
+  # Index contents changed; the running API processes stop serving their cached retrievals
+  bump_retrieval_index_version("pinecone", index_name)
 
 
-setup_training_data(index_name="peak-ai")
\ No newline at end of file
+# Guarded so process-pool workers importing this module do not re-run the ingestion
+if __name__ == "__main__":
+  setup_training_data(index_name="peak-ai")
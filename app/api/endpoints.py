@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from app.api.routes.user import router as user_router
 from app.api.routes.traits import router as traits_router
@@ -12,6 +12,11 @@ from app.api.routes.progress_check import router as progress_check
 from app.api.routes.sprints import router as sprints
 from app.api.routes.development_actions import router as development_actions
 from app.api.routes.company import router as company_router
+from app.database.connection import engine, scheduler_engine, async_engine
+from app.database.pool_metrics import get_pool_stats
+from app.services.user_data_service import user_data_service
+from app.ai.helpers.retrieval_cache import get_retrieval_cache_stats
+from app.firebase.utils import verify_token
 
 router = APIRouter()
 router.include_router(router=user_router)
@@ -33,3 +38,24 @@ async def health_check():
     return { "message": "Peak Test App is running" }
   except Exception as error:
     raise HTTPException(status_code=400, detail=str(error))
+
+@router.get("/db-pool-stats")
+async def db_pool_stats(token = Depends(verify_token)):
+  try:
+    return {
+      "api": get_pool_stats(engine),
+      "api_async": get_pool_stats(async_engine.sync_engine),
+      "scheduler": get_pool_stats(scheduler_engine)
+    }
+  except Exception as error:
+    raise HTTPException(status_code=400, detail=str(error))
+
+@router.get("/cache-stats")
+async def cache_stats(token = Depends(verify_token)):
+  try:
+    return {
+      "user_data": user_data_service.get_cache_stats(),
+      "retrieval": get_retrieval_cache_stats()
+    }
+  except Exception as error:
+    raise HTTPException(status_code=400, detail=str(error))
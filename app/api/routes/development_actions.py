@@ -5,8 +5,8 @@ from typing import Annotated
 from app.schemas.models import DevelopmentActionsSchema
 from app.database.connection import get_db
 from app.ai.helpers.get_vectorstore import get_vectorstore
-from app.ai.helpers.get_documents import get_docs
-from app.ai.helpers.chains import generate_actions, check_user_input
+from app.ai.helpers.get_documents import get_docs_async
+from app.ai.helpers.chains import generate_actions_async, prompt_fingerprint
 from app.ai.data.format_initial_questions import get_initial_questions_with_answers
 from app.ai.data.traits_practices import get_ten_traits, get_chosen_traits, get_chosen_practices
 from app.utils.answers_crud import initial_questions_answers_all_forms_get_all
@@ -18,6 +18,7 @@ from app.utils.users_crud import get_user_company_details
 from app.utils.pending_actions_crud import pending_actions_create_one, pending_actions_read, pending_actions_clear_all, pending_actions_create_bulk
 from app.ai.helpers.prompts import DevelopmentActionsPrompts
 from app.services.user_data_service import user_data_service
+from app.utils.generated_actions_cache_crud import generated_actions_cache_get, generated_actions_cache_save
 
 db_dependency = Annotated[Session, Depends(get_db)]
 router = APIRouter(prefix="/development-actions", tags=["development-actions"])
@@ -50,7 +51,7 @@ async def get_actions(data: DevelopmentActionsSchema, db: db_dependency):
     chosen_trait, trait_practice, _, _ = user_data_service.get_trait_inputs(base_data, trait_type)
     
     # Get documents for the trait and practice
-    docs = get_docs(vectorstore=vectorstore, trait=chosen_trait, practice=trait_practice)
+    docs = await get_docs_async(vectorstore=vectorstore, trait=chosen_trait, practice=trait_practice)
     
     # Format context based on trait type
     context_label = "Strength Context" if trait_type == "strength" else "Weakness Context"
@@ -62,9 +63,13 @@ async def get_actions(data: DevelopmentActionsSchema, db: db_dependency):
     # Build AI inputs
     inputs = user_data_service.build_ai_inputs(base_data, trait_type, final_docs)
     
-    # Generate actions
+    # Generate actions, reusing a previous generation for the exact same prompt if cached
     prompt_template = DevelopmentActionsPrompts.initial_generation_prompt()
-    response = generate_actions(prompt_template=prompt_template, inputs=inputs)
+    fingerprint = prompt_fingerprint(prompt_template=prompt_template, inputs=inputs)
+    response = await generated_actions_cache_get(db=db, fingerprint=fingerprint)
+    if response is None:
+      response = await generate_actions_async(prompt_template=prompt_template, inputs=inputs)
+      await generated_actions_cache_save(db=db, fingerprint=fingerprint, response=response)
 
     # Create actions in bulk for better performance
     action_details = [action["details"] for action in response["actions"]]
@@ -98,7 +103,7 @@ async def regenerate_actions(data: DevelopmentActionsSchema, db: db_dependency):
     chosen_trait, trait_practice, _, _ = user_data_service.get_trait_inputs(base_data, trait_type)
     
     # Get documents for the trait and practice
-    docs = get_docs(vectorstore=vectorstore, trait=chosen_trait, practice=trait_practice)
+    docs = await get_docs_async(vectorstore=vectorstore, trait=chosen_trait, practice=trait_practice)
     
     # Format context based on trait type
     context_label = "Strength Context" if trait_type == "strength" else "Weakness Context"
@@ -112,7 +117,7 @@ async def regenerate_actions(data: DevelopmentActionsSchema, db: db_dependency):
     
     # Generate actions
     prompt_template = DevelopmentActionsPrompts.regeneration_prompt()
-    response = generate_actions(prompt_template=prompt_template, inputs=inputs)
+    response = await generate_actions_async(prompt_template=prompt_template, inputs=inputs)
 
     # Clear existing actions and create new ones in bulk
     await pending_actions_clear_all(db=db, user_id=user_id)
@@ -1,18 +1,26 @@
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Annotated
 from app.schemas.models import DataFormSchema
 from app.firebase.utils import verify_token
-from app.database.connection import get_db
-from app.utils.dev_plan_crud import dev_plan_create_get_one, dev_plan_update_is_finished_true
+from app.database.connection import get_db, get_async_db
+from app.utils.dev_plan_crud import dev_plan_create_get_one, dev_plan_update_is_finished_true, dev_plan_create_get_one_async
 from app.utils.dates_crud import add_dates, compute_second_sprint_dates, compute_colleague_message_dates
-from app.utils.sprints_crud import get_sprint_start_end_date, get_sprint_start_end_date_sprint_number
-from app.utils.traits_crud import chosen_traits_get
-from app.utils.answers_crud import answers_get_all
-from app.utils.practices_crud import chosen_personal_practices_get_all, personal_practice_category_get_one, chosen_practices_get
+from app.utils.sprints_crud import get_sprint_start_end_date_async, get_sprint_start_end_date_sprint_number_async
+from app.utils.traits_crud import chosen_traits_get, chosen_traits_get_async
+from app.utils.answers_crud import answers_get_all_async
+from app.utils.practices_crud import (
+  personal_practice_category_get_one,
+  chosen_practices_get,
+  personal_practice_category_get_one_async,
+  chosen_practices_get_async,
+  chosen_personal_practices_get_all_async
+)
 
 db_dependency = Annotated[Session, Depends(get_db)]
+async_db_dependency = Annotated[AsyncSession, Depends(get_async_db)]
 router = APIRouter(prefix="/development-plan", tags=["development-plan"])
 
 # Adds dates for Gantt chart shown in Sprint 1; this endpoint should ONLY called in sprint 1, in choosing mind body practice page
@@ -46,7 +54,7 @@ async def create_gantt_chart_dates(data: DataFormSchema, db: db_dependency, toke
 
 # Get Development Plan Gantt Chart
 @router.get("/gantt-chart-data")
-async def get_gantt_chart(db: db_dependency, user_id: str, token = Depends(verify_token)):
+async def get_gantt_chart(db: async_db_dependency, user_id: str, token = Depends(verify_token)):
   
   if token != user_id:
     raise HTTPException(
@@ -56,20 +64,20 @@ async def get_gantt_chart(db: db_dependency, user_id: str, token = Depends(verif
 
   try:
     # Get current dev plan
-    dev_plan = await dev_plan_create_get_one(user_id=user_id, db=db)
+    dev_plan = await dev_plan_create_get_one_async(user_id=user_id, db=db)
     dev_plan_id=dev_plan["dev_plan_id"]
 
-    chosen_traits = chosen_traits_get(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-    chosen_trait_practices_1 = await chosen_practices_get(db=db, user_id=user_id, sprint_number=1, dev_plan_id=dev_plan_id) # Chosen Practices for Sprint 1 
-    recommended_mind_body_category = await personal_practice_category_get_one(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-    sprint_1_dates = await get_sprint_start_end_date(db=db, user_id=user_id, sprint_id=chosen_trait_practices_1["chosen_strength_practice"][0].sprint_id)
+    chosen_traits = await chosen_traits_get_async(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
+    chosen_trait_practices_1 = await chosen_practices_get_async(db=db, user_id=user_id, sprint_number=1, dev_plan_id=dev_plan_id) # Chosen Practices for Sprint 1 
+    recommended_mind_body_category = await personal_practice_category_get_one_async(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
+    sprint_1_dates = await get_sprint_start_end_date_async(db=db, user_id=user_id, sprint_id=chosen_trait_practices_1["chosen_strength_practice"][0].sprint_id)
 
     # Get or Compute Sprint 2 start/end date
-    existing_sprint_2_dates = await get_sprint_start_end_date_sprint_number(db=db, user_id=user_id, sprint_number=2, dev_plan_id=dev_plan_id)
+    existing_sprint_2_dates = await get_sprint_start_end_date_sprint_number_async(db=db, user_id=user_id, sprint_number=2, dev_plan_id=dev_plan_id)
     if existing_sprint_2_dates:
       if existing_sprint_2_dates["start_date"]:
         sprint_2_dates = existing_sprint_2_dates
-        chosen_trait_practices_2 = await chosen_practices_get(db=db, user_id=user_id, sprint_number=2, dev_plan_id=dev_plan_id)
+        chosen_trait_practices_2 = await chosen_practices_get_async(db=db, user_id=user_id, sprint_number=2, dev_plan_id=dev_plan_id)
       else:
         sprint_2_dates = await compute_second_sprint_dates(start_to_mid_date=sprint_1_dates["end_date"], end_date=chosen_traits["chosen_strength"]["end_date"])
         chosen_trait_practices_2 = None
@@ -125,17 +133,17 @@ async def get_gantt_chart(db: db_dependency, user_id: str, token = Depends(verif
 
 # Get Details of Plan -- for Review Page
 @router.get("/review-details")
-async def get_review_details(user_id: str, sprint_number: int, db: db_dependency):
+async def get_review_details(user_id: str, sprint_number: int, db: async_db_dependency):
   try:
     # Get current dev plan
-    dev_plan = await dev_plan_create_get_one(user_id=user_id, db=db)
+    dev_plan = await dev_plan_create_get_one_async(user_id=user_id, db=db)
     dev_plan_id=dev_plan["dev_plan_id"]
 
     # Strength/Weakness
-    chosen_traits = chosen_traits_get(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
+    chosen_traits = await chosen_traits_get_async(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
 
     # Practice for Strength/Weakness
-    chosen_trait_practices = await chosen_practices_get(db=db, user_id=user_id, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
+    chosen_trait_practices = await chosen_practices_get_async(db=db, user_id=user_id, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
     if len(chosen_trait_practices['chosen_strength_practice']) == 0 :
       chosen_trait_practices['chosen_strength_practice'] = None
     if len(chosen_trait_practices['chosen_weakness_practice']) == 0:
@@ -144,13 +152,13 @@ async def get_review_details(user_id: str, sprint_number: int, db: db_dependency
     # Dev actions for each strength/weakness practice
     strength_form_name = f"{sprint_number}_STRENGTH_PRACTICE_QUESTIONS"
     weakness_form_name = f"{sprint_number}_WEAKNESS_PRACTICE_QUESTIONS"
-    strength_practice_dev_actions= await answers_get_all(db=db, user_id=user_id, form_name=strength_form_name, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
-    weakness_practice_dev_actions= await answers_get_all(db=db, user_id=user_id, form_name=weakness_form_name, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
+    strength_practice_dev_actions= await answers_get_all_async(db=db, user_id=user_id, form_name=strength_form_name, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
+    weakness_practice_dev_actions= await answers_get_all_async(db=db, user_id=user_id, form_name=weakness_form_name, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
 
     # Mind Body Practice category and Chosen Recommendations
-    recommended_mind_body_category = await personal_practice_category_get_one(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
+    recommended_mind_body_category = await personal_practice_category_get_one_async(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
     if recommended_mind_body_category:
-      chosen_recommendations = await chosen_personal_practices_get_all(db=db, user_id=user_id, recommended_mind_body_category_id=recommended_mind_body_category.id)
+      chosen_recommendations = await chosen_personal_practices_get_all_async(db=db, user_id=user_id, recommended_mind_body_category_id=recommended_mind_body_category.id)
     else:
       chosen_recommendations = None
     
@@ -169,7 +177,7 @@ async def get_review_details(user_id: str, sprint_number: int, db: db_dependency
   
 # Get Current Week
 @router.get("/current-week")
-async def get_current_week(user_id: str, db: db_dependency, token = Depends(verify_token)):
+async def get_current_week(user_id: str, db: async_db_dependency, token = Depends(verify_token)):
   
   if token != user_id:
     raise HTTPException(
@@ -178,7 +186,7 @@ async def get_current_week(user_id: str, db: db_dependency, token = Depends(veri
     )
   
   try:
-    dev_plan = await dev_plan_create_get_one(db=db, user_id=user_id)
+    dev_plan = await dev_plan_create_get_one_async(db=db, user_id=user_id)
 
     # Calculate current week number
     start_date = dev_plan["start_date"]
@@ -7,15 +7,16 @@ from app.firebase.utils import verify_token
 from app.utils.dev_plan_crud import dev_plan_get_current, dev_plan_clear_fields
 from app.utils.traits_crud import traits_create, traits_compute_tscore, chosen_traits_clear, chosen_traits_get
 from app.utils.answers_crud import answers_to_initial_questions_save, are_matching_answers
-from app.utils.update_traits import update_ave_std, increment_count
+from app.utils.update_traits import increment_count, update_trait_norms_job
 from app.utils.practices_crud import practices_and_chosen_practices_clear_all, personal_practice_category_and_chosen_personal_practices_clear_all
 from app.utils.pending_actions_crud import pending_actions_clear_all
 from app.utils.sprints_crud import sprint_get_current, sprint_clear_fields
 from app.utils.forms_crud import (
     forms_create_one_initial_questions_form, 
     form_initial_questions_with_options_get_all,
-    initial_questions_forms_with_questions_options_get_all,
-    delete_form_and_associations_form_name
+    initial_questions_form_id_get,
+    forms_delete_many_by_name,
+    DEV_PLAN_FORM_NAMES
 )
 
 
@@ -36,11 +37,11 @@ async def create_get_traits_and_form_questions_options(data: DataFormSchema, db:
     )
 
   try:
-    form_exists = initial_questions_forms_with_questions_options_get_all(db=db, name=form_name, user_id=user_id)
+    form_id = initial_questions_form_id_get(db=db, name=form_name, user_id=user_id)
     
     # return form schema with form_id if Form exists already
-    if form_exists:
-      return form_initial_questions_with_options_get_all(db=db, form_name=form_name, user_id=user_id, form_id=form_exists.id)
+    if form_id:
+      return form_initial_questions_with_options_get_all(db=db, form_name=form_name, user_id=user_id, form_id=form_id)
     
     # No initial qs form yet, create traits and new initial questions Form for user
     # Create new Traits for user
@@ -98,27 +99,23 @@ async def save_initial_questions_answers(answers: FormAnswerSchema, db: db_depen
             chosen_strength_id = chosen_traits["chosen_strength"]["id"]
             chosen_weakness_id = chosen_traits["chosen_weakness"]["id"]
             await practices_and_chosen_practices_clear_all(db=db, chosen_strength_id=chosen_strength_id, chosen_weakness_id=chosen_weakness_id, dev_plan_id=dev_plan_id, user_id=user_id)
-            # Clear 1_STRENGTH/WEAKNESS_PRACTICE_QUESTIONS
-            delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_STRENGTH_PRACTICE_QUESTIONS")
-            delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_WEAKNESS_PRACTICE_QUESTIONS")
-
             # Clear chosen_traits
             chosen_traits = chosen_traits_clear(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-            # Clear 1_STRENGTH/WEAKNESS_QUESTIONS
-            delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_STRENGTH_QUESTIONS")
-            delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_WEAKNESS_QUESTIONS")  
 
             # Clear personal_practice_category and chosen_personal_practices for certain dev plan id
             await personal_practice_category_and_chosen_personal_practices_clear_all(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-            # Clear 1_MIND_BODY_QUESTIONS
-            delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_MIND_BODY_QUESTIONS")
+
+            # Clear the dev plan's trait, practice and mind-body forms in one statement (cascades to their
+            # questions, options and answers)
+            forms_delete_many_by_name(db=db, dev_plan_id=dev_plan_id, form_names=DEV_PLAN_FORM_NAMES)
 
             # Clear pending actions
             await pending_actions_clear_all(db=db, user_id=user_id)
 
-    # Schedule the update operation as a background task if 10 additional inputs
+    # Trait norms are kept current by answers_to_initial_questions_save; every 10 inputs they are
+    # also recomputed exactly in a background task, which rescores every submitted user against them
     if increment_count(db=db, user_id=user_id):
-      background_tasks.add_task(update_ave_std, db)
+      background_tasks.add_task(update_trait_norms_job)
       
     return { "message": "Initial question answers saved and t-scores computed." }
   except Exception as error:
@@ -1,4 +1,3 @@
-import json
 from collections import defaultdict
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
@@ -8,7 +7,8 @@ from app.database.connection import get_db
 from app.firebase.utils import verify_token
 from app.utils.dev_plan_crud import dev_plan_create_get_one, dev_plan_update_personal_practice_category
 from app.utils.forms_crud import mind_body_form_questions_options_get_all, forms_with_questions_options_get_all, forms_create_one
-from app.utils.answers_crud import answers_save_one
+from app.utils.answers_crud import answers_upsert_many
+from app.utils.static_content import get_static_content
 from app.utils.practices_crud import (
     personal_practice_category_save_one, 
     personal_practice_category_get_one, 
@@ -45,14 +45,13 @@ async def create_get_personal_practices_form(data: DataFormSchema, db: db_depend
     if form_exists:
       return form_exists
     
-    with open("app/utils/data/mind_body_questions.json", "r") as file:
-      mind_body_questions = json.load(file)
+    mind_body_questions = get_static_content().mind_body_questions
 
     for category, questions_data in mind_body_questions.items():
       for q_data in questions_data:
-        question = q_data['question']
-        weight = q_data['weight']
-        q_options = q_data['options']
+        question = q_data.question
+        weight = q_data.weight
+        q_options = list(q_data.options)
 
         # Append data to respective arrays
         questions.append(question)
@@ -102,16 +101,10 @@ async def save_answers(answers: FormAnswerSchema, db: db_dependency, token = Dep
   }
 
   try:
-    for answer in answers.answers:
-      # Add all answers in DB 
-      await answers_save_one(
-        db=db,
-        form_id=form_id,
-        question_id=answer.question_id,
-        option_id=answer.option_id,
-        answer=answer.answer
-      )
+    # Add all answers in DB 
+    await answers_upsert_many(db=db, form_id=form_id, answers=answers.answers)
 
+    for answer in answers.answers:
       # Calculate the score for each answer; option_type would be the option_point, question_rank would be the weight
       score = int(answer.option_type) * int(answer.question_rank)
       # Add the score to the respective category
@@ -159,13 +152,12 @@ async def get_recommendations(user_id: str, db: db_dependency, token = Depends(v
     )
 
   try:
-    with open("app/utils/data/mind_body_practices.json", "r") as file:
-      mind_body_practices = json.load(file)
+    mind_body_practices = get_static_content().mind_body_practices
 
     dev_plan = await dev_plan_create_get_one(db=db, user_id=user_id)
     dev_plan_id = dev_plan["dev_plan_id"]
     category = await personal_practice_category_get_one(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-    recommendations = mind_body_practices[category.name]
+    recommendations = list(mind_body_practices[category.name])
     
     return { 
       "recommended_mind_body_category_id": category.id,
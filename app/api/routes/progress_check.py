@@ -8,7 +8,7 @@ from app.database.connection import get_db
 from app.firebase.utils import verify_token
 from app.utils.dev_plan_crud import dev_plan_create_get_one
 from app.utils.sprints_crud import sprint_create_get_one
-from app.utils.answers_crud import answers_get_all, answers_save_one
+from app.utils.answers_crud import answers_get_all, answers_upsert_many
 from app.utils.forms_crud import form_questions_options_get_all, forms_with_questions_options_sprint_id_get_all, forms_create_one
 
 db_dependency = Annotated[Session, Depends(get_db)]
@@ -95,7 +95,8 @@ async def get_development_progress_questions_strength_practice(db: db_dependency
         sprint_number=sprint_number,
         dev_plan_id=dev_plan_id
       )
-      await forms_create_one(db=db, form=form_data)
+      # Questions are the user's own development actions, so they are not shared templates
+      await forms_create_one(db=db, form=form_data, shared_questions=False)
 
       return forms_with_questions_options_sprint_id_get_all(db=db, name=form_name, user_id=user_id, sprint_id=sprint_id)
   except Exception as error:
@@ -182,7 +183,8 @@ async def get_development_progress_questions_weakness_practice(db: db_dependency
         sprint_number=sprint_number,
         dev_plan_id=dev_plan_id
       )
-      await forms_create_one(db=db, form=form_data)
+      # Questions are the user's own development actions, so they are not shared templates
+      await forms_create_one(db=db, form=form_data, shared_questions=False)
 
       return forms_with_questions_options_sprint_id_get_all(db=db, name=form_name, user_id=user_id, sprint_id=sprint_id)
   except Exception as error:
@@ -203,15 +205,8 @@ async def save_development_progress_answers(db: db_dependency, answers: FormAnsw
     )
 
   try:
-    for answer in answers.answers:
-      # Add all answers in DB 
-      await answers_save_one(
-        db=db,
-        form_id=form_id,
-        question_id=answer.question_id,
-        option_id=answer.option_id,
-        answer=answer.answer
-      )
+    # Add all answers in DB 
+    await answers_upsert_many(db=db, form_id=form_id, answers=answers.answers)
 
     return { "message": f"{form_name_parts[2].capitalize()} Development Actions Progress Check for Week {form_name_parts[-1]} Saved." }
   except Exception as error:
@@ -1,4 +1,3 @@
-import json
 from uuid import UUID
 from collections import defaultdict
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -9,7 +8,8 @@ from app.database.connection import get_db
 from app.firebase.utils import verify_token
 from app.utils.users_crud import get_one_user_id
 from app.utils.dates_crud import compute_second_sprint_dates
-from app.utils.answers_crud import answers_save_one, are_matching_answers
+from app.utils.answers_crud import answers_upsert_many, are_matching_answers
+from app.utils.static_content import get_static_content
 from app.utils.pending_actions_crud import pending_actions_clear_all
 from app.utils.dev_plan_crud import(
     dev_plan_create_get_one, 
@@ -24,7 +24,8 @@ from app.utils.forms_crud import(
     forms_create_one, 
     forms_with_questions_options_get_all, 
     forms_with_questions_options_sprint_id_get_all,
-    delete_form_and_associations_form_name
+    forms_delete_many_by_name,
+    DEV_PLAN_FORM_NAMES
 )
 from app.utils.sprints_crud import(
     sprint_create_get_one, 
@@ -135,20 +136,15 @@ async def save_traits_chosen(chosen_traits: ChosenTraitsSchema, db: db_dependenc
           chosen_strength_id = chosen_traits["chosen_strength"]["id"]
           chosen_weakness_id = chosen_traits["chosen_weakness"]["id"]
           await practices_and_chosen_practices_clear_all(db=db, chosen_strength_id=chosen_strength_id, chosen_weakness_id=chosen_weakness_id, dev_plan_id=dev_plan_id, user_id=user_id)
-          # Clear 1_STRENGTH/WEAKNESS_PRACTICE_QUESTIONS
-          delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_STRENGTH_PRACTICE_QUESTIONS")
-          delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_WEAKNESS_PRACTICE_QUESTIONS")
-
           # Clear chosen_traits
           chosen_traits = chosen_traits_clear(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-          # Clear 1_STRENGTH/WEAKNESS_QUESTIONS
-          delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_STRENGTH_QUESTIONS")
-          delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_WEAKNESS_QUESTIONS")  
 
           # Clear personal_practice_category and chosen_personal_practices for certain dev plan id
           await personal_practice_category_and_chosen_personal_practices_clear_all(db=db, user_id=user_id, dev_plan_id=dev_plan_id)
-          # Clear 1_MIND_BODY_QUESTIONS
-          delete_form_and_associations_form_name(db=db, dev_plan_id=dev_plan_id, form_name="1_MIND_BODY_QUESTIONS")
+
+          # Clear the dev plan's trait, practice and mind-body forms in one statement (cascades to their
+          # questions, options and answers)
+          forms_delete_many_by_name(db=db, dev_plan_id=dev_plan_id, form_names=DEV_PLAN_FORM_NAMES)
 
           # Clear pending actions
           await pending_actions_clear_all(db=db, user_id=user_id)
@@ -224,12 +220,9 @@ async def create_trait_form(user_id: str, trait: str, trait_type: str, dev_plan_
   ]
 
   try:
-    with open("app/utils/data/practice_followup.json", "r") as file:
-      traits_questions = json.load(file)
-
-    for rank, question in traits_questions.get(trait, {}).items():
-      questions.append(question)
-      ranks.append(rank)
+    for trait_question in get_static_content().trait_questions.get(trait, ()):
+      questions.append(trait_question.question)
+      ranks.append(trait_question.rank)
     
     form_data = form_questions_options_get_all(
       user_id=user_id,
@@ -296,15 +289,11 @@ async def save_traits_answers(answers: FormAnswerSchema, db: db_dependency, toke
   extent_answers = defaultdict(list)
 
   try:
+    # Add all answers in DB
+    await answers_upsert_many(db=db, form_id=form_id, answers=answers.answers)
+
     for answer in answers.answers:
-      # Add all answers in DB and in extent_answers dict
-      await answers_save_one(
-        db=db,
-        form_id=form_id,
-        question_id=answer.question_id,
-        option_id=answer.option_id,
-        answer=answer.answer
-      )
+      # Add all answers in extent_answers dict
       extent_answers[answer.answer].append(answer)
 
     # First, sort the "Not at All" or "To a Small Extent" answers  by rank
@@ -327,7 +316,7 @@ async def save_traits_answers(answers: FormAnswerSchema, db: db_dependency, toke
       recommended_practices += sorted_answers_3[:5 - len(recommended_practices)]
 
     # Clear if there are existing practices in DB
-    await practices_clear_existing(db=db, user_id=user_id, question_id=recommended_practices[0].question_id)
+    await practices_clear_existing(db=db, user_id=user_id, form_id=form_id)
 
     # Add each recommended practice in DB
     for practice in recommended_practices:
@@ -338,7 +327,8 @@ async def save_traits_answers(answers: FormAnswerSchema, db: db_dependency, toke
       
       await practice_save_one(
         db=db,
-        practice=practice_data
+        practice=practice_data,
+        form_id=form_id
       )
     
     return {'message': 'Answers and Recommended Practices saved.'}
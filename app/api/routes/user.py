@@ -15,7 +15,7 @@ from app.firebase.utils import verify_token
 from app.utils.users_crud import (
     create_user,
     update_user,
-    delete_user,
+    user_delete_all,
     get_one_user,
     get_one_user_id,
     get_all_users,
@@ -314,23 +314,26 @@ async def delete_user_account(user_id: str, db: db_dependency):
 
         # get the user ID (uid) from the database user object
         uid = user.id
+        email = user.email
 
+        # The company counts are committed together with the user's rows by user_delete_all
         company = get_company_by_id(db=db, company_id=user.company_id)
         if company:
             if user.user_type == 'admin' and company.admin_count > 0:
                 company.admin_count -= 1
             if user.user_type == 'member' and company.member_count > 0:
                 company.member_count -= 1
-            db.commit()
-            
+            db.flush()
+
+        # Delete the user and everything they own from the PostgreSQL database first, in one transaction;
+        # if it fails nothing is deleted and the Firebase account is kept, so the request can be retried
+        user_delete_all(db=db, user_id=uid)
+
         # Delete the user from Firebase Authentication
         auth.delete_user(uid=uid)
 
-        # Delete the user from the PostgreSQL database
-        delete_user(db=db, user_id=uid)
-
         return JSONResponse(
-            content={"message": f"Account successfully deleted for {user.email}", "success": True},
+            content={"message": f"Account successfully deleted for {email}", "success": True},
             status_code=200
         )
 
@@ -6,7 +6,7 @@ from app.database.connection import get_db
 from app.firebase.utils import verify_token
 from app.utils.dev_plan_crud import dev_plan_create_get_one
 from app.utils.forms_crud import forms_with_questions_options_get_all
-from app.utils.answers_crud import answers_save_one, answers_get_all, answers_clear_all
+from app.utils.answers_crud import answers_upsert_many, answers_get_all, answers_clear_all
 from app.schemas.models import FormAnswerSchema
 
 db_dependency = Annotated[Session, Depends(get_db)]
@@ -43,15 +43,8 @@ async def save_development_actions(answers: FormAnswerSchema, db: db_dependency,
     # Clear existing dev action answers - addresses case of going back and updating dev actions form
     await answers_clear_all(db=db, form_id=form_id)
 
-    for answer in answers.answers:
-      # Add all answers in DB 
-      await answers_save_one(
-        db=db,
-        form_id=form_id,
-        question_id=answer.question_id,
-        option_id=answer.option_id,
-        answer=answer.answer
-      )
+    # Add all answers in DB 
+    await answers_upsert_many(db=db, form_id=form_id, answers=answers.answers)
 
     return { "message": "Development Actions Saved" }
   except Exception as error:
@@ -13,6 +13,17 @@ FIREBASE_CONFIG_MEASUREMENTID= os.getenv("FIREBASE_CONFIG_MEASUREMENTID")
 
 #Postresql Connection Config
 SQLALCHEMY_DATABASE_URL=os.getenv('SQLALCHEMY_DATABASE_URL')
+# Same database through the asyncpg driver; derived from the sync URL unless set explicitly (see connection.py)
+SQLALCHEMY_ASYNC_DATABASE_URL=os.getenv('SQLALCHEMY_ASYNC_DATABASE_URL', SQLALCHEMY_DATABASE_URL)
+
+# Connection pool config; request traffic and the scheduler (cron jobs) get separate pools
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+DB_SCHEDULER_POOL_SIZE = int(os.getenv('DB_SCHEDULER_POOL_SIZE', '2'))
+DB_SCHEDULER_MAX_OVERFLOW = int(os.getenv('DB_SCHEDULER_MAX_OVERFLOW', '2'))
 
 #Email Credentials
 EMAIL_USERNAME = os.getenv('EMAIL_USERNAME')
@@ -37,6 +48,18 @@ REDIRECT_URI = 'http://localhost:5173/oauth2callback'
 # Fireflies API Key
 FIREFLIES_API_KEY = os.getenv('FIREFLIES_API_KEY')
 
+# Generated development actions cache (Postgres)
+GENERATED_ACTIONS_CACHE_TTL_HOURS = int(os.getenv('GENERATED_ACTIONS_CACHE_TTL_HOURS', '168'))
+GENERATED_ACTIONS_CACHE_MAX_ENTRIES = int(os.getenv('GENERATED_ACTIONS_CACHE_MAX_ENTRIES', '5000'))
+
+# Per-user data cache in UserDataService (LRU + TTL, per worker process).
+# Entries are evicted by CRUD domain events on write, so the TTL is only a backstop.
+USER_DATA_CACHE_TTL_SECONDS = int(os.getenv('USER_DATA_CACHE_TTL_SECONDS', '21600'))
+USER_DATA_CACHE_MAX_ENTRIES = int(os.getenv('USER_DATA_CACHE_MAX_ENTRIES', '1024'))
+
+# Shared initial questionnaire (questions + options) cached per process; the TTL is the only refresh after they are edited
+INITIAL_QUESTIONS_TEMPLATE_TTL_SECONDS = int(os.getenv('INITIAL_QUESTIONS_TEMPLATE_TTL_SECONDS', '3600'))
+
 # AI Evaluation Configuration
 AI_EVALUATION_CONCURRENCY_LIMIT = int(os.getenv('AI_EVALUATION_CONCURRENCY_LIMIT', '5'))
 AI_EVALUATION_TIMEOUT_SECONDS = int(os.getenv('AI_EVALUATION_TIMEOUT_SECONDS', '60'))
\ No newline at end of file
@@ -1,15 +1,85 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.const import SQLALCHEMY_DATABASE_URL
+from app.database.pool_metrics import TimedQueuePool
+from app.const import (
+    SQLALCHEMY_DATABASE_URL,
+    SQLALCHEMY_ASYNC_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_SCHEDULER_POOL_SIZE,
+    DB_SCHEDULER_MAX_OVERFLOW
+)
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+POOL_OPTIONS = {
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+# Request traffic
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=TimedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    **POOL_OPTIONS
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Cron jobs in main.py get their own small pool so the midnight email job cannot starve API requests
+scheduler_engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=TimedQueuePool,
+    pool_size=DB_SCHEDULER_POOL_SIZE,
+    max_overflow=DB_SCHEDULER_MAX_OVERFLOW,
+    **POOL_OPTIONS
+)
+SchedulerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=scheduler_engine)
+
+# The URL with its driver (postgres://, postgresql+psycopg2://, ...) replaced by asyncpg. asyncpg rejects
+# libpq's sslmode query parameter; its ssl connect argument takes the same values.
+def asyncpg_url_and_connect_args(database_url: str):
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+    connect_args = {}
+    sslmode = url.query.get("sslmode")
+    if sslmode is not None:
+        url = url.difference_update_query(["sslmode"])
+        connect_args["ssl"] = sslmode
+    return url, connect_args
+
+ASYNC_DATABASE_URL, ASYNC_CONNECT_ARGS = asyncpg_url_and_connect_args(SQLALCHEMY_ASYNC_DATABASE_URL)
+
+# Async engine (asyncpg) for routes that should not block the event loop on DB I/O
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=ASYNC_CONNECT_ARGS,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    **POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_scheduler_db():
+    db = SchedulerSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,222 @@
+from dataclasses import dataclass
+from typing import Tuple
+from sqlalchemy import text
+
+'''
+Versioned schema migrations for tables that already exist (Base.metadata.create_all only creates
+missing tables and never alters them).
+
+Applied versions are recorded in schema_migrations; pending migrations run in order, in one
+transaction, under an advisory lock so several workers starting together do not race. New tables
+and indexes are also declared on the models so fresh databases get them from create_all; the
+statements here must therefore tolerate objects that already exist. Never edit a migration that
+has shipped, append a new one.
+
+Plain indexes on tables that can be large go in concurrent_indexes instead of statements: a
+CREATE INDEX inside the migration transaction would block writes to the table for the whole build
+while the other workers wait on the lock. They are built with CREATE INDEX CONCURRENTLY after the
+transaction, by whichever worker gets the index lock (the others start without waiting), and are
+checked again on every start, so a build interrupted by a restart is redone. Unique indexes that
+ON CONFLICT relies on stay in statements, the code needs them as soon as the migration is recorded.
+'''
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: Tuple[str, ...]
+    # (index name, "table (columns)") pairs built by build_concurrent_indexes
+    concurrent_indexes: Tuple[Tuple[str, str], ...] = ()
+
+def _replace_foreign_key(table: str, column: str, referred_table: str, ondelete: str) -> str:
+    # Drops whatever foreign key constraint is on table(column), whatever it is named, and re-adds it
+    # under the default name with the ON DELETE action
+    return f"""
+        DO $$
+        DECLARE constraint_name TEXT;
+        BEGIN
+            FOR constraint_name IN
+                SELECT c.conname FROM pg_constraint c
+                JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+                WHERE c.conrelid = '{table}'::regclass AND c.contype = 'f' AND a.attname = '{column}'
+            LOOP
+                EXECUTE 'ALTER TABLE {table} DROP CONSTRAINT ' || quote_ident(constraint_name);
+            END LOOP;
+            ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey
+                FOREIGN KEY ({column}) REFERENCES {referred_table} (id) ON DELETE {ondelete};
+        END $$
+        """
+
+MIGRATIONS = (
+    Migration(1, "answers_unique_form_question", (
+        # Drop duplicate (form_id, question_id) answers left by the old select-then-insert
+        # save path, keeping one row each, then enforce uniqueness
+        """
+        DELETE FROM answers a
+        USING answers b
+        WHERE a.form_id = b.form_id
+          AND a.question_id = b.question_id
+          AND a.ctid < b.ctid
+          AND NOT EXISTS (
+            SELECT 1 FROM pg_indexes WHERE tablename = 'answers' AND indexname = 'uq_answers_form_question'
+          )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_answers_form_question ON answers (form_id, question_id)",
+    )),
+    Migration(2, "trait_norms_streaming_aggregates", (
+        # Existing rows are backfilled by trait_norms_seed
+        "ALTER TABLE trait_norms ADD COLUMN IF NOT EXISTS sample_count INTEGER",
+        "ALTER TABLE trait_norms ADD COLUMN IF NOT EXISTS m2 DOUBLE PRECISION",
+    )),
+    Migration(3, "counters_initial_answers", (
+        # Starts from the tracker's latest count (101 = the traits.json sample)
+        """
+        INSERT INTO counters (name, value)
+        SELECT 'initial_answers', COALESCE(MAX(count), 101) FROM initial_answer_tracker
+        ON CONFLICT (name) DO NOTHING
+        """,
+    )),
+    Migration(4, "composite_lookup_indexes", (), concurrent_indexes=(
+        # Foreign keys walked by the form/question/option/answer loaders
+        ("ix_questions_form_id", "questions (form_id)"),
+        ("ix_options_question_id", "options (question_id)"),
+        ("ix_answers_question_id", "answers (question_id)"),
+        ("ix_practices_chosen_trait_id", "practices (chosen_trait_id)"),
+        # Filters of the CRUD helpers, equality columns first
+        ("ix_forms_user_id_name_development_plan_id", "forms (user_id, name, development_plan_id)"),
+        ("ix_traits_user_id_t_score", "traits (user_id, t_score)"),
+        ("ix_chosen_traits_user_id_development_plan_id_trait_type", "chosen_traits (user_id, development_plan_id, trait_type)"),
+        ("ix_chosen_practices_user_id_development_plan_id_sprint_number", "chosen_practices (user_id, development_plan_id, sprint_number)"),
+        ("ix_sprints_user_id_development_plan_id_number", "sprints (user_id, development_plan_id, number)"),
+        ("ix_development_plan_user_id_number", "development_plan (user_id, number)"),
+        ("ix_personal_practice_category_user_id_development_plan_id", "personal_practice_category (user_id, development_plan_id)"),
+        ("ix_pending_actions_user_id", "pending_actions (user_id)"),
+    )),
+    Migration(5, "drop_unused_indexes", tuple(
+        f"DROP INDEX IF EXISTS {index_name}" for index_name in (
+            # Duplicates of the primary key indexes
+            "ix_forms_id", "ix_questions_id", "ix_options_id", "ix_answers_id", "ix_practices_id",
+            "ix_chosen_practices_id", "ix_traits_id", "ix_user_colleagues_survey_id", "ix_pending_actions_id",
+            # Free text never filtered on
+            "ix_questions_name", "ix_options_name", "ix_answers_answer", "ix_practices_name",
+            "ix_chosen_practices_name", "ix_pending_actions_action",
+            "ix_user_colleagues_survey_particularly_effective", "ix_user_colleagues_survey_more_effective",
+            # Low-selectivity or unfiltered columns, or only filtered next to a covering composite index
+            "ix_questions_option_type", "ix_questions_rank", "ix_options_type", "ix_options_trait_name",
+            "ix_forms_sprint_number", "ix_chosen_practices_sprint_number",
+            "ix_traits_name", "ix_traits_average", "ix_traits_standard_deviation", "ix_traits_total_raw_score", "ix_traits_t_score",
+            "ix_user_colleagues_survey_effective_leader", "ix_user_colleagues_survey_effective_strength_area",
+            "ix_user_colleagues_survey_effective_weakness_area",
+        )
+    )),
+    Migration(6, "question_templates", (
+        # form_questions itself is created by create_all; existing per-form questions keep their rows
+        "ALTER TABLE questions ADD COLUMN IF NOT EXISTS template_key VARCHAR",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_questions_template_key ON questions (template_key)",
+        """
+        INSERT INTO form_questions (form_id, question_id)
+        SELECT form_id, id FROM questions WHERE form_id IS NOT NULL
+        ON CONFLICT DO NOTHING
+        """,
+    )),
+    Migration(7, "cascading_form_deletes", (
+        # A form's answers, question links and per-form questions/options go with it
+        _replace_foreign_key("questions", "form_id", "forms", "CASCADE"),
+        _replace_foreign_key("form_questions", "form_id", "forms", "CASCADE"),
+        _replace_foreign_key("form_questions", "question_id", "questions", "CASCADE"),
+        _replace_foreign_key("options", "question_id", "questions", "CASCADE"),
+        _replace_foreign_key("answers", "form_id", "forms", "CASCADE"),
+        _replace_foreign_key("answers", "question_id", "questions", "CASCADE"),
+        _replace_foreign_key("answers", "option_id", "options", "CASCADE"),
+        # Rows that only point at a form lose the pointer
+        _replace_foreign_key("sprints", "strength_practice_form_id", "forms", "SET NULL"),
+        _replace_foreign_key("sprints", "weakness_practice_form_id", "forms", "SET NULL"),
+        _replace_foreign_key("chosen_traits", "form_id", "forms", "SET NULL"),
+        _replace_foreign_key("chosen_practices", "form_id", "forms", "SET NULL"),
+    ), concurrent_indexes=(
+        # The referential actions look rows up by these columns, one lookup per deleted row
+        ("ix_answers_option_id", "answers (option_id)"),
+        ("ix_sprints_strength_practice_form_id", "sprints (strength_practice_form_id)"),
+        ("ix_sprints_weakness_practice_form_id", "sprints (weakness_practice_form_id)"),
+        ("ix_chosen_traits_form_id", "chosen_traits (form_id)"),
+        ("ix_chosen_practices_form_id", "chosen_practices (form_id)"),
+    )),
+    Migration(8, "users_trait_norms_observed", (
+        # Nobody is marked observed until the next trait_norms_reconcile folds every submitted user in
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS trait_norms_observed BOOLEAN NOT NULL DEFAULT false",
+    )),
+    Migration(9, "form_questions_position", (
+        "ALTER TABLE form_questions ADD COLUMN IF NOT EXISTS position INTEGER",
+        # Existing links were inserted in question order, which ctid follows
+        """
+        UPDATE form_questions fq SET position = ordered.position
+        FROM (
+            SELECT ctid, row_number() OVER (PARTITION BY form_id ORDER BY ctid) - 1 AS position
+            FROM form_questions
+        ) ordered
+        WHERE fq.ctid = ordered.ctid AND fq.position IS NULL
+        """,
+    )),
+)
+
+# Arbitrary keys for the advisory locks, shared by every process running migrations
+MIGRATIONS_LOCK_ID = 72910431
+CONCURRENT_INDEXES_LOCK_ID = 72910432
+
+def apply_migrations(engine):
+    with engine.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATIONS_LOCK_ID})
+        connection.execute(text(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """
+        ))
+        applied_versions = set(connection.execute(text("SELECT version FROM schema_migrations")).scalars())
+
+        for migration in MIGRATIONS:
+            if migration.version in applied_versions:
+                continue
+            for statement in migration.statements:
+                connection.execute(text(statement))
+            connection.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": migration.version, "name": migration.name}
+            )
+            print(f"Applied migration {migration.version:04d} {migration.name}")
+
+    build_concurrent_indexes(engine)
+
+def build_concurrent_indexes(engine):
+    with engine.connect() as connection:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        if not connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": CONCURRENT_INDEXES_LOCK_ID}
+        ).scalar():
+            return
+
+        try:
+            for migration in MIGRATIONS:
+                for index_name, definition in migration.concurrent_indexes:
+                    is_valid = connection.execute(text(
+                        """
+                        SELECT i.indisvalid FROM pg_index i
+                        JOIN pg_class c ON c.oid = i.indexrelid
+                        WHERE c.relname = :index_name
+                        """
+                    ), {"index_name": index_name}).scalar_one_or_none()
+                    if is_valid:
+                        continue
+                    # A concurrent build that failed or was interrupted leaves an invalid index behind
+                    if is_valid is False:
+                        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+                    connection.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {definition}"))
+                    print(f"Built index {index_name}")
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": CONCURRENT_INDEXES_LOCK_ID}
+            )
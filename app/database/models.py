@@ -1,8 +1,10 @@
 import uuid
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Float
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, Float, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from app.database.connection import Base, engine
+from app.database.migrations import apply_migrations
+from app.database.uuid7 import uuid7
 from sqlalchemy.orm import relationship
 
 class Users(Base):
@@ -23,6 +25,8 @@ class Users(Base):
     acc_activated = Column(Boolean, default=False)
     user_type = Column(String, index=True)
     user_photo_url = Column(String, index=True)
+    # Whether the user's raw scores are currently counted in trait_norms
+    trait_norms_observed = Column(Boolean, nullable=False, default=False, server_default='false')
 
     traits = relationship('Traits', back_populates='users')
     chosen_traits = relationship('ChosenTraits', back_populates='users')
@@ -35,15 +39,22 @@ class Users(Base):
 class InitialAnswerTracker(Base):
     __tablename__ = 'initial_answer_tracker'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(String, ForeignKey("users.id"))
     count = Column(Integer, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
+# Named counters incremented atomically with UPDATE ... RETURNING
+class Counters(Base):
+    __tablename__ = 'counters'
+
+    name = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
 class UserColleagues(Base):
     __tablename__ = 'user_colleagues'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     email = Column(String, index=True)
     user_id = Column(String, ForeignKey("users.id"))
     development_plan_id = Column(UUID(as_uuid=True), ForeignKey("development_plan.id"))
@@ -56,22 +67,23 @@ class UserColleagues(Base):
 class UserColleaguesSurvey(Base):
     __tablename__ = 'user_colleagues_survey'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_colleague_id = Column(UUID(as_uuid=True), ForeignKey("user_colleagues.id"))
-    effective_leader = Column(Integer, index=True)
-    effective_strength_area = Column(Integer, index=True)
-    effective_weakness_area = Column(Integer, index=True)
-    particularly_effective = Column(String, index=True)
-    more_effective = Column(String, index=True)
+    effective_leader = Column(Integer)
+    effective_strength_area = Column(Integer)
+    effective_weakness_area = Column(Integer)
+    particularly_effective = Column(String)
+    more_effective = Column(String)
 
 class Sprints(Base):
     __tablename__ = 'sprints'
+    __table_args__ = (Index('ix_sprints_user_id_development_plan_id_number', 'user_id', 'development_plan_id', 'number'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     number = Column(Integer, index=True)
     user_id = Column(String, ForeignKey("users.id"))
-    strength_practice_form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"))
-    weakness_practice_form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"))
+    strength_practice_form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="SET NULL"), index=True)
+    weakness_practice_form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="SET NULL"), index=True)
     is_finished = Column(Boolean, default=False)
     start_date = Column(DateTime(timezone=True), index=True)
     end_date = Column(DateTime(timezone=True), index=True)
@@ -79,8 +91,9 @@ class Sprints(Base):
 
 class DevelopmentPlan(Base):
     __tablename__ = 'development_plan'
+    __table_args__ = (Index('ix_development_plan_user_id_number', 'user_id', 'number'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(String, ForeignKey("users.id"))
     number = Column(Integer, index=True)
     chosen_strength_id = Column(UUID(as_uuid=True), ForeignKey("chosen_traits.id"))
@@ -96,31 +109,35 @@ class DevelopmentPlan(Base):
     end_date = Column(DateTime(timezone=True), index=True)
     is_finished = Column(Boolean, default=False)
 
+# Deleting a form cascades in the database to its answers, question links and per-form questions/options;
+# sprints, chosen traits and chosen practices pointing at it are set to NULL
 class Forms(Base):
     __tablename__ = 'forms'
+    __table_args__ = (Index('ix_forms_user_id_name_development_plan_id', 'user_id', 'name', 'development_plan_id'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String, index=True)
     user_id = Column(String, ForeignKey("users.id"))
-    sprint_number = Column(Integer, index=True)
+    sprint_number = Column(Integer)
     sprint_id = Column(UUID(as_uuid=True), ForeignKey("sprints.id"))
     development_plan_id = Column(UUID(as_uuid=True), ForeignKey("development_plan.id"))
 
     users = relationship('Users', backref='forms', foreign_keys=[user_id])
-    questions = relationship('Questions', back_populates='forms')
-    answers = relationship('Answers', back_populates='forms') 
-    chosen_traits = relationship('ChosenTraits', back_populates='forms')
-    chosen_practices = relationship('ChosenPractices', back_populates='forms')
+    questions = relationship('Questions', secondary='form_questions', back_populates='forms', passive_deletes=True, order_by='FormQuestions.position')
+    answers = relationship('Answers', back_populates='forms', passive_deletes=True)
+    chosen_traits = relationship('ChosenTraits', back_populates='forms', passive_deletes=True)
+    chosen_practices = relationship('ChosenPractices', back_populates='forms', passive_deletes=True)
 
 class ChosenTraits(Base):
     __tablename__ = 'chosen_traits'
+    __table_args__ = (Index('ix_chosen_traits_user_id_development_plan_id_trait_type', 'user_id', 'development_plan_id', 'trait_type'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(String, ForeignKey("users.id"))
     name = Column(String, index=True)
     trait_id = Column(UUID(as_uuid=True), ForeignKey("traits.id"))
     trait_type = Column(String, index=True)
-    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"))
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="SET NULL"), index=True)
     t_score = Column(Integer, index=True)
     start_date = Column(DateTime(timezone=True), index=True)
     end_date = Column(DateTime(timezone=True), index=True)
@@ -135,51 +152,79 @@ class ChosenTraits(Base):
 class Questions(Base):
     __tablename__ = 'questions'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    name = Column(String, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name = Column(String)
     category = Column(String, index=True)
-    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"))
-    option_type = Column(String, index=True)
-    rank = Column(Integer, index=True, default=0)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), index=True)
+    option_type = Column(String)
+    rank = Column(Integer, default=0)
+    # Set on template questions (shared by forms through form_questions, form_id NULL): hash of the question and its options
+    template_key = Column(String, unique=True, index=True)
+
+    forms = relationship('Forms', secondary='form_questions', back_populates='questions')
+    options = relationship('Options', back_populates='questions', passive_deletes=True)
+    answers = relationship('Answers', back_populates='questions', passive_deletes=True)
+
+# Questions of each form: shared template questions, or per-form questions (form_id set) where the text is personalized
+class FormQuestions(Base):
+    __tablename__ = 'form_questions'
 
-    forms = relationship('Forms', back_populates='questions') 
-    options = relationship('Options', back_populates='questions')
-    answers = relationship('Answers', back_populates='questions')
+    form_id = Column(UUID(as_uuid=True), ForeignKey('forms.id', ondelete='CASCADE'), primary_key=True)
+    question_id = Column(UUID(as_uuid=True), ForeignKey('questions.id', ondelete='CASCADE'), primary_key=True, index=True)
+    # Order of the question in the form, as it was created
+    position = Column(Integer)
 
 class Traits(Base):
     __tablename__ = 'traits'
+    __table_args__ = (Index('ix_traits_user_id_t_score', 'user_id', 't_score'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String, ForeignKey("users.id"))
-    name = Column(String, index=True)
-    average = Column(Float, index=True)
-    standard_deviation = Column(Float, index=True)
-    total_raw_score = Column(Integer, index=True)
-    t_score = Column(Integer, index=True)
+    name = Column(String)
+    average = Column(Float)
+    standard_deviation = Column(Float)
+    total_raw_score = Column(Integer)
+    t_score = Column(Integer)
 
     users = relationship('Users', back_populates='traits')
     chosen_traits = relationship('ChosenTraits', back_populates='traits')
 
+# Population norms shared by every user's Traits; seeded from traits.json, version bumped on each update.
+# sample_count/average/m2 are Welford running aggregates of the users' raw scores.
+class TraitNorms(Base):
+    __tablename__ = 'trait_norms'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    name = Column(String, unique=True, index=True)
+    average = Column(Float)
+    standard_deviation = Column(Float)
+    sample_count = Column(Integer)
+    m2 = Column(Float)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
 class Options(Base):
     __tablename__ = 'options'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    name = Column(String, index=True)
-    type = Column(String, index=True)
-    trait_name = Column(String, index=True)
-    question_id = Column(UUID(as_uuid=True), ForeignKey('questions.id'))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name = Column(String)
+    type = Column(String)
+    trait_name = Column(String)
+    question_id = Column(UUID(as_uuid=True), ForeignKey('questions.id', ondelete='CASCADE'), index=True)
 
     questions = relationship('Questions', back_populates='options')
-    answers = relationship('Answers', back_populates='options')
+    answers = relationship('Answers', back_populates='options', passive_deletes=True)
 
 class Answers(Base):
     __tablename__ = 'answers'
+    # One answer per question per form; answers_upsert_many relies on it for ON CONFLICT
+    __table_args__ = (UniqueConstraint('form_id', 'question_id', name='uq_answers_form_question'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    form_id = Column(UUID(as_uuid=True), ForeignKey('forms.id'))
-    question_id = Column(UUID(as_uuid=True), ForeignKey('questions.id'))
-    option_id = Column(UUID(as_uuid=True), ForeignKey('options.id'))
-    answer = Column(String, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    form_id = Column(UUID(as_uuid=True), ForeignKey('forms.id', ondelete='CASCADE'))
+    question_id = Column(UUID(as_uuid=True), ForeignKey('questions.id', ondelete='CASCADE'), index=True)
+    option_id = Column(UUID(as_uuid=True), ForeignKey('options.id', ondelete='CASCADE'), index=True)
+    answer = Column(String)
 
     forms = relationship('Forms', back_populates='answers')
     questions = relationship('Questions', back_populates='answers')
@@ -188,10 +233,10 @@ class Answers(Base):
 class Practices(Base):
     __tablename__ = 'practices'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String, ForeignKey("users.id"))
-    chosen_trait_id = Column(UUID(as_uuid=True), ForeignKey("chosen_traits.id"))
-    name = Column(String, index=True)
+    chosen_trait_id = Column(UUID(as_uuid=True), ForeignKey("chosen_traits.id"), index=True)
+    name = Column(String)
     is_recommended = Column(Boolean, default=False)
 
     users = relationship('Users', back_populates='practices')
@@ -200,14 +245,15 @@ class Practices(Base):
 
 class ChosenPractices(Base):
     __tablename__ = 'chosen_practices'
+    __table_args__ = (Index('ix_chosen_practices_user_id_development_plan_id_sprint_number', 'user_id', 'development_plan_id', 'sprint_number'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String, ForeignKey("users.id"))
-    name = Column(String, index=True)
+    name = Column(String)
     practice_id = Column(UUID(as_uuid=True), ForeignKey("practices.id"))
     chosen_trait_id = Column(UUID(as_uuid=True), ForeignKey("chosen_traits.id"))
-    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"))
-    sprint_number = Column(Integer, index=True)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="SET NULL"), index=True)
+    sprint_number = Column(Integer)
     sprint_id = Column(UUID(as_uuid=True), ForeignKey("sprints.id"))
     development_plan_id = Column(UUID(as_uuid=True), ForeignKey("development_plan.id"))
 
@@ -218,8 +264,9 @@ class ChosenPractices(Base):
 
 class PersonalPracticeCategory(Base):
     __tablename__ = 'personal_practice_category'
+    __table_args__ = (Index('ix_personal_practice_category_user_id_development_plan_id', 'user_id', 'development_plan_id'),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(String, ForeignKey("users.id"))
     name = Column(String, index=True)
     start_date = Column(DateTime(timezone=True), index=True)
@@ -232,7 +279,7 @@ class PersonalPracticeCategory(Base):
 class ChosenPersonalPractices(Base):
     __tablename__ = 'chosen_personal_practices'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(String, ForeignKey("users.id"))
     name = Column(String, index=True)
     personal_practice_category_id = Column(UUID(as_uuid=True), ForeignKey("personal_practice_category.id"))
@@ -243,15 +290,24 @@ class ChosenPersonalPractices(Base):
 class PendingActions(Base):
     __tablename__ = 'pending_actions'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    user_id = Column(String, ForeignKey("users.id"))
-    action = Column(String, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(String, ForeignKey("users.id"), index=True)
+    action = Column(String)
     category = Column(String, index=True)
 
+class GeneratedActionsCache(Base):
+    __tablename__ = 'generated_actions_cache'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    fingerprint = Column(String, unique=True, nullable=False, index=True)
+    response = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    last_accessed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
 class Company(Base):
     __tablename__ = 'company'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     name = Column(String, index=True)
     member_count = Column(Integer, index=True)
     admin_count = Column(Integer, index=True)
@@ -272,4 +328,7 @@ class UserInvitation(Base):
     company = relationship("Company", back_populates="invitations")
     users = relationship("Users", back_populates="invitation")
 
-Base.metadata.create_all(engine)
\ No newline at end of file
+Base.metadata.create_all(engine)
+
+# create_all only creates missing tables; bring existing ones up to date
+apply_migrations(engine)
\ No newline at end of file
@@ -0,0 +1,65 @@
+import time
+import logging
+import threading
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to check out a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            # Only waits that ran out of pool_timeout; connect errors are not checkout timeouts
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+
+        waited = time.perf_counter() - started
+        with self._stats_lock:
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return connection
+
+    def stats(self):
+        with self._stats_lock:
+            checkouts = self._checkouts
+            return {
+                "pool_size": self.size(),
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                "overflow": max(self.overflow(), 0),
+                "total_checkouts": checkouts,
+                "checkout_timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait / checkouts * 1000, 3) if checkouts else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+def get_pool_stats(engine):
+    pool = engine.pool
+    if isinstance(pool, TimedQueuePool):
+        return pool.stats()
+
+    # Pools without wait-time instrumentation (e.g. the async engine's pool)
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+def log_pool_stats(name: str, engine):
+    logger.info("DB pool [%s]: %s", name, get_pool_stats(engine))
@@ -0,0 +1,36 @@
+import os
+import time
+import uuid
+import threading
+
+'''
+Time-ordered UUIDs (RFC 9562 version 7) for primary keys.
+
+48-bit Unix timestamp in milliseconds, then a 12-bit counter (rand_a, "method 1") and 62 random bits.
+New keys sort after existing ones, so inserts append to the right edge of the primary key B-tree
+instead of landing on random pages. The counter keeps keys generated in the same millisecond (or
+after a clock step backwards) increasing within the process.
+'''
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+def uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # Random start in the lower half leaves room to count up within the millisecond
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return uuid.UUID(int=(ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b)
@@ -4,10 +4,9 @@ import tiktoken
 import asyncio
 import time
 from .api_client import FirefliesAPIClient, FirefliesError
-from langchain_openai import ChatOpenAI
+from app.ai.helpers.llm_clients import get_llm
 from langchain_core.output_parsers import JsonOutputParser
 from langchain.prompts import PromptTemplate
-from app.ai.const import OPENAI_API_KEY
 from sqlalchemy.orm import Session
 from app.utils.dev_plan_crud import dev_plan_get_current
 from app.utils.traits_crud import chosen_traits_get
@@ -44,6 +43,8 @@ MODEL_PRICING = {
 
 # Current model in use - easy to switch when migrating to 4.1 nano
 CURRENT_MODEL = "gpt-4.1"  # Switched from "gpt-4o-mini"
+# Model used for per-chunk evaluation
+CHUNK_EVALUATION_MODEL = "gpt-4.1-nano"
 
 
 def get_model_pricing() -> Dict[str, float]:
@@ -440,11 +441,7 @@ async def evaluate_chunk_leadership_async(
             print(f"Warning: Could not fetch user traits: {str(e)}")
     
     # Use GPT-4o mini for cost efficiency
-    llm = ChatOpenAI(
-        model="gpt-4.1-nano",
-        openai_api_key=OPENAI_API_KEY,
-        temperature=0.3
-    )
+    llm = get_llm(model=CHUNK_EVALUATION_MODEL, temperature=0.3)
 
     prompt_template = PromptTemplate(
         template="""
@@ -1079,11 +1076,7 @@ Meeting Context:
         """
 
     # Use the current model for summarization
-    llm = ChatOpenAI(
-        model=CURRENT_MODEL,
-        openai_api_key=OPENAI_API_KEY,
-        temperature=0.3
-    )
+    llm = get_llm(model=CURRENT_MODEL, temperature=0.3)
 
     prompt_template = PromptTemplate(
         template="""
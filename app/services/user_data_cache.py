@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from typing import Any, Dict, Hashable, Optional
+from cachetools import TTLCache
+
+
+class _CountingTTLCache(TTLCache):
+    """TTLCache that reports LRU evictions (capacity) and TTL expirations to its owner"""
+
+    def __init__(self, maxsize: int, ttl: float, on_evict, on_expire):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_evict = on_evict
+        self._on_expire = on_expire
+
+    def popitem(self):
+        # Only called by Cache.__setitem__ when the cache is full
+        item = super().popitem()
+        self._on_evict()
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        if expired:
+            self._on_expire(len(expired))
+        return expired
+
+
+class UserDataCache:
+    """Bounded LRU + TTL cache of per-user data, keyed by (user_id, data_type).
+
+    Reads and writes are guarded by a threading lock (sync routes run in the threadpool);
+    get_or_load additionally holds a per-key asyncio lock so concurrent coroutines for the
+    same user share one load instead of all hitting the database. A key's load lock is reference
+    counted and dropped only when no coroutine holds or waits on it. Each user has a generation,
+    bumped on invalidation (and clear); a load that started before an invalidation is returned
+    to its caller but not cached, so it cannot put stale data back.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Hashable, asyncio.Lock] = {}
+        # Coroutines holding or waiting on each load lock; only touched from the event loop
+        self._load_lock_users: Dict[Hashable, int] = {}
+        self._generations: Dict[str, int] = {}
+        self._clear_generation = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+        self._cache = _CountingTTLCache(
+            maxsize=maxsize,
+            ttl=ttl,
+            on_evict=lambda: self._count("evictions"),
+            on_expire=lambda count: self._count("expirations", count)
+        )
+
+    # Called from inside cache operations, which already hold self._lock
+    def _count(self, stat: str, amount: int = 1) -> None:
+        self._stats[stat] += amount
+
+    def get(self, user_id: str, data_type: str) -> Optional[Any]:
+        with self._lock:
+            value = self._cache.get((user_id, data_type))
+            self._stats["hits" if value is not None else "misses"] += 1
+            return value
+
+    def set(self, user_id: str, data_type: str, value: Any) -> None:
+        with self._lock:
+            self._cache[(user_id, data_type)] = value
+
+    def _generation(self, user_id: str):
+        with self._lock:
+            return self._clear_generation, self._generations.get(user_id, 0)
+
+    async def get_or_load(self, user_id: str, data_type: str, loader):
+        """Return the cached value, or await loader() once per key and cache its result"""
+        value = self.get(user_id, data_type)
+        if value is not None:
+            return value
+
+        key = (user_id, data_type)
+        load_lock = self._load_locks.setdefault(key, asyncio.Lock())
+        self._load_lock_users[key] = self._load_lock_users.get(key, 0) + 1
+        try:
+            async with load_lock:
+                # Another coroutine may have loaded it while we waited
+                with self._lock:
+                    value = self._cache.get(key)
+                if value is not None:
+                    return value
+
+                generation = self._generation(user_id)
+                value = await loader()
+                with self._lock:
+                    if generation == (self._clear_generation, self._generations.get(user_id, 0)):
+                        self._cache[key] = value
+                return value
+        finally:
+            # locked() is not enough: a waiter woken by release() has not acquired the lock yet,
+            # and a new lock created for it would let a second load run
+            self._load_lock_users[key] -= 1
+            if self._load_lock_users[key] == 0:
+                del self._load_lock_users[key]
+                del self._load_locks[key]
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Drop every cached entry for a user; returns how many were removed"""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            keys = [key for key in list(self._cache.keys()) if key[0] == user_id]
+            for key in keys:
+                self._cache.pop(key, None)
+            self._stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear_generation += 1
+            # MutableMapping.clear() goes through popitem(), which would be counted as evictions
+            for key in list(self._cache.keys()):
+                self._cache.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._cache.expire()
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._cache),
+                "max_entries": self._cache.maxsize,
+                "ttl_seconds": self._cache.ttl,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0
+            }
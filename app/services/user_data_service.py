@@ -1,7 +1,5 @@
 from typing import Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from functools import lru_cache
-import time
 
 from app.utils.users_crud import get_user_company_details
 from app.utils.answers_crud import initial_questions_answers_all_forms_get_all
@@ -9,49 +7,94 @@ from app.utils.traits_crud import traits_get_top_bottom_five, chosen_traits_get
 from app.utils.dev_plan_crud import dev_plan_get_current
 from app.utils.sprints_crud import sprint_get_current
 from app.utils.practices_crud import chosen_practices_get
+from app.utils.user_context_crud import user_ai_context_get
+from app.database.models import Answers
+from app.schemas.models import UserCompanyDetailsSchema
 from app.ai.data.format_initial_questions import get_initial_questions_with_answers
 from app.ai.data.traits_practices import get_ten_traits, get_chosen_traits, get_chosen_practices
 from app.ai.helpers.get_vectorstore import get_vectorstore
+from app.ai.helpers.retrieval_cache import retrieval_index_version
+from app.ai.const import VECTORSTORE_BACKEND
+from app.const import USER_DATA_CACHE_TTL_SECONDS, USER_DATA_CACHE_MAX_ENTRIES
+from app.services.user_data_cache import UserDataCache
+from app.utils.domain_events import subscribe, USER_CONTEXT_CHANGED, USER_CONTEXT_RESET
 
 class UserDataService:
     def __init__(self):
         self._vectorstore_cache = {}
-        self._user_data_cache = {}
-        self._cache_ttl = 300  # 5 minutes cache TTL
+        self._user_data_cache = UserDataCache(maxsize=USER_DATA_CACHE_MAX_ENTRIES, ttl=USER_DATA_CACHE_TTL_SECONDS)
     
-    def _get_cache_key(self, user_id: str, data_type: str) -> str:
-        return f"{user_id}:{data_type}"
+    def invalidate_user(self, user_id: str) -> int:
+        """Drop all cached data for a user (e.g. after their answers, traits or plan change)"""
+        return self._user_data_cache.invalidate_user(str(user_id))
     
-    def _is_cache_valid(self, cache_entry: Dict) -> bool:
-        return time.time() - cache_entry.get('timestamp', 0) < self._cache_ttl
+    def clear_cache(self) -> None:
+        self._user_data_cache.clear()
     
-    def _get_cached_data(self, cache_key: str) -> Optional[Any]:
-        if cache_key in self._user_data_cache:
-            cache_entry = self._user_data_cache[cache_key]
-            if self._is_cache_valid(cache_entry):
-                return cache_entry['data']
-        return None
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self._user_data_cache.stats()
     
-    def _set_cached_data(self, cache_key: str, data: Any) -> None:
-        self._user_data_cache[cache_key] = {
-            'data': data,
-            'timestamp': time.time()
-        }
-    
-    def get_vectorstore(self, index_name: str = "peak-ai"):
-        """Get vectorstore with caching"""
-        if index_name not in self._vectorstore_cache:
-            self._vectorstore_cache[index_name] = get_vectorstore(index_name=index_name)
-        return self._vectorstore_cache[index_name]
+    def get_vectorstore(self, index_name: str = "peak-ai", backend: Optional[str] = None):
+        """Get vectorstore with caching; backend is "pinecone" or "local" (defaults to VECTORSTORE_BACKEND).
+        Rebuilt when the index version changes, so a rebuilt local index is reloaded from disk."""
+        backend = backend or VECTORSTORE_BACKEND
+        cache_key = (backend, index_name)
+        version = retrieval_index_version(backend, index_name)
+        cached = self._vectorstore_cache.get(cache_key)
+        if cached is None or cached[0] != version:
+            self._vectorstore_cache[cache_key] = (version, get_vectorstore(index_name=index_name, backend=backend))
+        return self._vectorstore_cache[cache_key][1]
     
     async def get_user_base_data(self, db: Session, user_id: str) -> Dict[str, Any]:
         """Get all basic user data needed for both endpoints"""
-        cache_key = self._get_cache_key(user_id, "base_data")
-        cached_data = self._get_cached_data(cache_key)
+        return await self._user_data_cache.get_or_load(
+            str(user_id), "base_data", lambda: self._load_user_base_data(db=db, user_id=user_id)
+        )
+    
+    async def _load_user_base_data(self, db: Session, user_id: str) -> Dict[str, Any]:
+        """Load base_data with a single statement (see user_ai_context_get)"""
+        context = user_ai_context_get(db=db, user_id=user_id)
+        
+        if context is None:
+            raise ValueError(f"User {user_id} does not exist")
+        if not context.initial_answers:
+            raise ValueError("Initial questions have not been answered")
+        if context.dev_plan_id is None:
+            raise ValueError("No current development plan")
+        if context.chosen_strength is None or context.chosen_weakness is None:
+            raise ValueError("Strength and weakness have not been chosen")
+        # Sprint 2 finished means there is no current sprint (see sprint_get_current)
+        if context.sprint_number == 2 and context.sprint_is_finished:
+            raise ValueError("No current sprint")
         
-        if cached_data:
-            return cached_data
+        company_details = UserCompanyDetailsSchema(
+            id=context.id,
+            company_size=context.company_size,
+            industry=context.industry,
+            role=context.role,
+            role_description=context.role_description
+        )
+        # get_initial_questions_with_answers reads .answer from each entry
+        answers_list = [Answers(answer=answer) for answer in context.initial_answers]
         
+        return {
+            'company_details': company_details,
+            'initial_questions_with_answers': get_initial_questions_with_answers(answers_list),
+            'strengths': context.strengths or [],
+            'weaknesses': context.weaknesses or [],
+            'chosen_strength': context.chosen_strength,
+            'chosen_weakness': context.chosen_weakness,
+            'strength_practice': context.strength_practice,
+            'weakness_practice': context.weakness_practice,
+            'dev_plan_id': context.dev_plan_id,
+            'current_sprint': {
+                'sprint_number': context.sprint_number,
+                'sprint_id': context.sprint_id
+            }
+        }
+    
+    async def _load_user_base_data_sequential(self, db: Session, user_id: str) -> Dict[str, Any]:
+        """Previous per-entity loader (~12 queries); kept as the baseline for benchmarks/user_context_queries.py"""
         # Fetch company details
         company_details = get_user_company_details(db=db, user_id=user_id)
         
@@ -97,9 +140,6 @@ class UserDataService:
             'current_sprint': current_sprint
         }
         
-        # Cache the data
-        self._set_cached_data(cache_key, base_data)
-        
         return base_data
     
     def get_trait_inputs(self, base_data: Dict[str, Any], trait_type: str) -> Tuple[str, str, str, list]:
@@ -140,3 +180,7 @@ class UserDataService:
 
 # Global instance
 user_data_service = UserDataService()
+
+# CRUD writes to a user's answers, traits, practices, dev plan or sprint evict their cached context
+subscribe(USER_CONTEXT_CHANGED, lambda user_id: user_data_service.invalidate_user(user_id))
+subscribe(USER_CONTEXT_RESET, lambda: user_data_service.clear_cache())
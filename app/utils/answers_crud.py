@@ -1,54 +1,83 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from typing import List
+from collections import Counter
+from sqlalchemy import func, select, update, values, column, String, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, aliased
+from app.utils.domain_events import user_context_changed
+from app.utils.trait_norms_crud import trait_norms_observe, trait_norms_unobserve
+from app.database.uuid7 import uuid7
 from app.database.models import Answers, Traits, Forms
-from app.schemas.models import FormAnswerSchema
+from app.schemas.models import FormAnswerSchema, AnswerSchema
 
 
 async def answers_to_initial_questions_save(db: Session, answers: FormAnswerSchema):
     form_id = answers.form_id
     user_id = answers.user_id
     
-    # Reset to null the total raw score always to account for case of resubmission of initial answer Form
-    user_traits = db.query(Traits).filter(Traits.user_id == user_id).all()
-    for trait in user_traits:
-        trait.total_raw_score = None
-    db.flush()
+    # Reset to null the total raw score always to account for case of resubmission of initial answer Form.
+    # RETURNING gives post-update values, so the scores being reset are read through a self-join
+    previous_traits = aliased(Traits)
+    previous_scores = db.execute(
+        update(Traits).where(
+            Traits.user_id == user_id,
+            previous_traits.id == Traits.id
+        ).values(total_raw_score=None).returning(Traits.name, previous_traits.total_raw_score)
+    ).all()
+    # A resubmission replaces the user's previous observation in the trait norms
+    if any(total_raw_score is not None for _, total_raw_score in previous_scores):
+        trait_norms_unobserve(db, user_id, {name: total_raw_score or 0 for name, total_raw_score in previous_scores})
     
-    for answer in answers.answers:
-        existing_answer = db.query(Answers).filter(
-            Answers.form_id == form_id,
-            Answers.question_id == answer.question_id
-        ).first()
-        
-        # Check if answer already exists
-        if existing_answer:
-            existing_answer.option_id = answer.option_id
-            existing_answer.answer = answer.answer
-            
-        else:
-            new_answer = Answers(
-                form_id=form_id,
-                question_id=answer.question_id,
-                option_id=answer.option_id,
-                answer=answer.answer
-            )
-
-            # Add Answer entry to db
-            db.add(new_answer)
-
-        # Increment user Trait total_raw_score by 1
-        user_trait = db.query(Traits).filter(
-            Traits.name == answer.trait_name,
-            Traits.user_id == user_id
-        ).first()
-
-        if user_trait:
-            user_trait.total_raw_score = func.coalesce(Traits.total_raw_score, 0) + 1
-            db.flush()
+    await answers_upsert_many(db=db, form_id=form_id, answers=answers.answers, commit=False)
+
+    # Increment user Trait total_raw_score by the number of answers for each trait, in one UPDATE ... FROM (VALUES ...)
+    trait_increments = Counter(answer.trait_name for answer in answers.answers if answer.trait_name)
+    if trait_increments:
+        increments = values(
+            column("name", String), column("increment", Integer), name="trait_increments"
+        ).data(list(trait_increments.items()))
+
+        db.execute(
+            update(Traits).where(
+                Traits.user_id == user_id,
+                Traits.name == increments.c.name
+            ).values(total_raw_score=func.coalesce(Traits.total_raw_score, 0) + increments.c.increment)
+        )
+        trait_norms_observe(db, user_id, trait_increments)
         
     db.commit()
+    user_context_changed(user_id=user_id)
     return { "message": "Initial question answers saved." }
 
+# Inserts or updates all answers of a form with a single INSERT ... ON CONFLICT (form_id, question_id) DO UPDATE
+async def answers_upsert_many(db: Session, form_id: str, answers: List[AnswerSchema], commit: bool = True):
+    # A statement cannot update the same row twice; like repeated answers_save_one calls, the last answer wins
+    answers_by_question = {answer.question_id: answer for answer in answers}
+    if not answers_by_question:
+        return
+
+    insert_answers = pg_insert(Answers).values([
+        {
+            "id": uuid7(),
+            "form_id": form_id,
+            "question_id": answer.question_id,
+            "option_id": answer.option_id,
+            "answer": answer.answer
+        } for answer in answers_by_question.values()
+    ])
+    db.execute(
+        insert_answers.on_conflict_do_update(
+            index_elements=[Answers.form_id, Answers.question_id],
+            set_={
+                "option_id": insert_answers.excluded.option_id,
+                "answer": insert_answers.excluded.answer
+            }
+        )
+    )
+
+    if commit:
+        db.commit()
+
 async def answers_save_one(db: Session, form_id: str, question_id: str, option_id: str, answer: str):
     # Check if answer already exists
     existing_answer = db.query(Answers).filter(
@@ -85,13 +114,19 @@ async def answers_clear_all(db: Session, form_id: str):
 
     db.commit()
 
-async def answers_get_all(db: Session, user_id: str, form_name: str, sprint_number: str, dev_plan_id: str):
-    form = db.query(Forms).filter(
+# Query shared by answers_get_all and answers_get_all_async
+def _form_with_answers_query(user_id: str, form_name: str, sprint_number: str, dev_plan_id: str):
+    return select(Forms).where(
         Forms.user_id == user_id, 
         Forms.name == form_name, 
         Forms.sprint_number == sprint_number,
         Forms.development_plan_id == dev_plan_id
-        ).options(joinedload(Forms.answers)).first()
+    ).options(joinedload(Forms.answers)).limit(1)
+
+async def answers_get_all(db: Session, user_id: str, form_name: str, sprint_number: str, dev_plan_id: str):
+    form = db.execute(
+        _form_with_answers_query(user_id=user_id, form_name=form_name, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
+    ).unique().scalars().first()
     
     if form:
         return form.answers
@@ -134,4 +169,16 @@ async def are_matching_answers(db: Session, user_id: str, form_name: str, sprint
         }
         return existing_answers_dict == new_answers_dict
 
-    return None
\ No newline at end of file
+    return None
+
+# ---- AsyncSession variants: awaited I/O for routes using get_async_db
+
+async def answers_get_all_async(db: AsyncSession, user_id: str, form_name: str, sprint_number: str, dev_plan_id: str):
+    result = await db.execute(
+        _form_with_answers_query(user_id=user_id, form_name=form_name, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
+    )
+    form = result.unique().scalars().first()
+
+    if form:
+        return form.answers
+    return None
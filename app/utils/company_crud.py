@@ -1,4 +1,4 @@
-from uuid import uuid4
+from app.database.uuid7 import uuid7
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func, case
 from app.database.models import Users, Forms, Traits, ChosenTraits, Questions, Options, Answers, Practices, DevelopmentPlan, Sprints, Company, UserColleagues, UserColleaguesSurvey
@@ -13,7 +13,7 @@ def create_company(db: Session, name: str, member_count: int, admin_count: int):
         return {"error": "A company with this name already exists."}
 
     db_company = Company(
-        id=uuid4(),  
+        id=uuid7(),  
         name=name,
         member_count=member_count,
         admin_count=admin_count
@@ -1,65 +1,49 @@
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.utils.domain_events import user_context_changed
 from app.database.models import DevelopmentPlan
 
-async def dev_plan_create_get_one(user_id: str, db: Session):
-    max_dev_plan_number = db.query(func.max(DevelopmentPlan.number)).filter(
-        DevelopmentPlan.user_id == user_id
-    ).scalar()
+# Queries and result shape shared by dev_plan_create_get_one and dev_plan_create_get_one_async
+def _max_dev_plan_number_query(user_id: str):
+    return select(func.max(DevelopmentPlan.number)).where(DevelopmentPlan.user_id == user_id)
 
-    if max_dev_plan_number is None:
-        first_dev_plan = DevelopmentPlan(
-            user_id=user_id,
-            number=1
-        )
-        db.add(first_dev_plan)
-        db.flush()
-        db.commit()
-        
-        return { 
-            "dev_plan_number": first_dev_plan.number, 
-            "dev_plan_id": first_dev_plan.id,
-            "start_date": first_dev_plan.start_date,
-            "end_date": first_dev_plan.end_date
-        }
-    
-    has_finished_dev_plan = db.query(DevelopmentPlan).filter(
+def _dev_plan_by_number_query(user_id: str, number: int):
+    return select(DevelopmentPlan).where(
         DevelopmentPlan.user_id == user_id,
-        DevelopmentPlan.number == max_dev_plan_number,
-        DevelopmentPlan.is_finished == True
-    ).first()
+        DevelopmentPlan.number == number
+    )
+
+# The user's first plan when they have none, the next one when the latest is finished
+def _dev_plan_to_create(user_id: str, latest_dev_plan):
+    if latest_dev_plan is None:
+        return DevelopmentPlan(user_id=user_id, number=1)
+    if latest_dev_plan.is_finished:
+        return DevelopmentPlan(user_id=user_id, number=latest_dev_plan.number + 1) # iterate by one
+    return None
+
+def _dev_plan_result(dev_plan):
+    return { 
+        "dev_plan_number": dev_plan.number, 
+        "dev_plan_id": dev_plan.id,
+        "start_date": dev_plan.start_date,
+        "end_date": dev_plan.end_date
+    }
 
-    if has_finished_dev_plan:
-        next_dev_plan = DevelopmentPlan(
-            user_id=user_id,
-            number=has_finished_dev_plan.number + 1 # iterate by one
-        )
-        db.add(next_dev_plan)
-        db.flush()
+async def dev_plan_create_get_one(user_id: str, db: Session):
+    max_dev_plan_number = db.execute(_max_dev_plan_number_query(user_id)).scalar()
+    latest_dev_plan = None
+    if max_dev_plan_number is not None:
+        latest_dev_plan = db.execute(_dev_plan_by_number_query(user_id, max_dev_plan_number)).scalars().first()
+
+    new_dev_plan = _dev_plan_to_create(user_id, latest_dev_plan)
+    if new_dev_plan is not None:
+        db.add(new_dev_plan)
         db.commit()
+        user_context_changed(user_id=user_id)
+        latest_dev_plan = new_dev_plan
 
-        dev_plan_number = next_dev_plan.number
-        dev_plan_id = next_dev_plan.id
-        start_date = next_dev_plan.start_date
-        end_date = next_dev_plan.end_date
-    else:
-        # get existing dev plan that is not finished
-        existing_dev_plan = db.query(DevelopmentPlan).filter(
-            DevelopmentPlan.user_id == user_id,
-            DevelopmentPlan.number == max_dev_plan_number
-        ).first()
-        
-        dev_plan_number = existing_dev_plan.number
-        dev_plan_id = existing_dev_plan.id
-        start_date = existing_dev_plan.start_date
-        end_date = existing_dev_plan.end_date
-    
-    return { 
-        "dev_plan_number": dev_plan_number, 
-        "dev_plan_id": dev_plan_id,
-        "start_date": start_date,
-        "end_date": end_date
-    }
+    return _dev_plan_result(latest_dev_plan)
 
 async def dev_plan_get_current(db: Session, user_id: str):
     # get max dev plan number of user
@@ -97,6 +81,7 @@ async def dev_plan_update_chosen_traits(user_id: str, chosen_strength_id: str, c
     existing_dev_plan.chosen_weakness_id = chosen_weakness_id
     
     db.commit()
+    user_context_changed(user_id=user_id)
 
 async def dev_plan_update_sprint(user_id: str, sprint_number: int, sprint_id: str, db: Session):
     dev_plan = await dev_plan_get_current(user_id=user_id, db=db)
@@ -111,6 +96,7 @@ async def dev_plan_update_sprint(user_id: str, sprint_number: int, sprint_id: st
         existing_dev_plan.sprint_2_id = sprint_id
     
     db.commit()
+    user_context_changed(user_id=user_id)
 
 async def dev_plan_update_chosen_strength_practice(user_id: str, sprint_number: int, chosen_strength_id: str, db: Session):
     dev_plan = await dev_plan_get_current(user_id=user_id, db=db)
@@ -125,6 +111,7 @@ async def dev_plan_update_chosen_strength_practice(user_id: str, sprint_number:
         existing_dev_plan.chosen_strength_practice_2_id = chosen_strength_id
     
     db.commit()
+    user_context_changed(user_id=user_id)
 
 async def dev_plan_update_chosen_weakness_practice(user_id: str, sprint_number: int, chosen_weakness_id: str, db: Session):
     dev_plan = await dev_plan_get_current(user_id=user_id, db=db)
@@ -139,6 +126,7 @@ async def dev_plan_update_chosen_weakness_practice(user_id: str, sprint_number:
         existing_dev_plan.chosen_weakness_practice_2_id = chosen_weakness_id
     
     db.commit()
+    user_context_changed(user_id=user_id)
 
 async def dev_plan_update_personal_practice_category(user_id: str, personal_practice_category_id: str, db: Session):
     dev_plan = await dev_plan_get_current(user_id=user_id, db=db)
@@ -176,6 +164,7 @@ async def dev_plan_update_is_finished_true(db: Session, user_id: str, dev_plan_i
             existing_dev_plan.is_finished = True
             db.flush()
             db.commit()
+            user_context_changed(user_id=user_id)
             return { "message": f"Development Plan ID {existing_dev_plan.id} is finished" }
         else:
             return { "message": f"Development Plan not yet complete" }
@@ -198,3 +187,21 @@ async def dev_plan_clear_fields(db: Session, user_id: str, dev_plan_id: str):
         existing_dev_plan.personal_practice_category_id = None
 
     db.commit()
+    user_context_changed(user_id=user_id)
+
+# ---- AsyncSession variants: awaited I/O for routes using get_async_db
+
+async def dev_plan_create_get_one_async(user_id: str, db: AsyncSession):
+    max_dev_plan_number = (await db.execute(_max_dev_plan_number_query(user_id))).scalar()
+    latest_dev_plan = None
+    if max_dev_plan_number is not None:
+        latest_dev_plan = (await db.execute(_dev_plan_by_number_query(user_id, max_dev_plan_number))).scalars().first()
+
+    new_dev_plan = _dev_plan_to_create(user_id, latest_dev_plan)
+    if new_dev_plan is not None:
+        db.add(new_dev_plan)
+        await db.commit()
+        user_context_changed(user_id=user_id)
+        latest_dev_plan = new_dev_plan
+
+    return _dev_plan_result(latest_dev_plan)
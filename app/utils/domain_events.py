@@ -0,0 +1,27 @@
+from collections import defaultdict
+
+# In-process domain events published by the CRUD layer after a write is committed.
+# Subscribers (e.g. caches) register at import time; handlers must be fast and must not raise.
+USER_CONTEXT_CHANGED = "user_context_changed"
+USER_CONTEXT_RESET = "user_context_reset"
+
+_handlers = defaultdict(list)
+
+def subscribe(event: str, handler):
+    _handlers[event].append(handler)
+
+def publish(event: str, **payload):
+    for handler in list(_handlers[event]):
+        try:
+            handler(**payload)
+        except Exception as error:
+            # A failing subscriber must never fail the write that triggered it
+            print(f"Domain event handler for {event} failed: {error}")
+
+# A user's AI context changed (answers, traits, chosen traits/practices, dev plan, sprint, company details)
+def user_context_changed(user_id):
+    publish(USER_CONTEXT_CHANGED, user_id=str(user_id))
+
+# Bulk write that touched every user's AI context (e.g. a rescore after the norms changed)
+def user_context_reset():
+    publish(USER_CONTEXT_RESET)
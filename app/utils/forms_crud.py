@@ -1,45 +1,77 @@
+import json
+import time
+import hashlib
+import threading
 from uuid import UUID
-from typing import Optional, List
-from sqlalchemy import delete
+from typing import Optional, List, Dict
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.future import select
-from app.database.models import Forms, Questions, Options, Answers
+from app.database.uuid7 import uuid7
+from app.database.models import Forms, Questions, Options, FormQuestions
 from app.schemas.models import FormSchema, QuestionSchema, OptionSchema
-
+from app.const import INITIAL_QUESTIONS_TEMPLATE_TTL_SECONDS
+
+# Forms of a development plan that are regenerated when the initial questions are answered again
+DEV_PLAN_FORM_NAMES = [
+    "1_STRENGTH_PRACTICE_QUESTIONS",
+    "1_WEAKNESS_PRACTICE_QUESTIONS",
+    "1_STRENGTH_QUESTIONS",
+    "1_WEAKNESS_QUESTIONS",
+    "1_MIND_BODY_QUESTIONS"
+]
+
+# Initial questions/options are shared rows (category INITIAL_QS), identical for every user,
+# so they are loaded once per process and stamped with each caller's form_id. The app never writes
+# them; after editing them in the database, processes pick the change up when the TTL expires.
+_initial_questions_template: Optional[List[QuestionSchema]] = None
+_initial_questions_template_loaded_at = 0.0
+_initial_questions_template_lock = threading.Lock()
+
+def initial_questions_template_get(db: Session) -> List[QuestionSchema]:
+  global _initial_questions_template, _initial_questions_template_loaded_at
+
+  with _initial_questions_template_lock:
+    is_fresh = time.monotonic() - _initial_questions_template_loaded_at < INITIAL_QUESTIONS_TEMPLATE_TTL_SECONDS
+    if _initial_questions_template is not None and is_fresh:
+      return _initial_questions_template
+
+  # One query: questions with their options joined
+  questions = db.query(Questions).options(
+    joinedload(Questions.options)
+  ).filter(Questions.category == 'INITIAL_QS').all()
+
+  template = [
+    QuestionSchema(
+      id=question.id,
+      name=question.name,
+      option_type=question.option_type,
+      options=[
+        OptionSchema(
+          id=option.id,
+          name=option.name,
+          type=option.type,
+          trait_name=option.trait_name,
+          question_id=option.question_id
+        ) for option in question.options
+      ]
+    ) for question in questions
+  ]
+
+  with _initial_questions_template_lock:
+    _initial_questions_template = template
+    _initial_questions_template_loaded_at = time.monotonic()
+
+  return template
 
 def form_initial_questions_with_options_get_all(db: Session, form_name: str, user_id: str, form_id: Optional[str]) -> FormSchema:
-  questions = db.query(Questions).filter(Questions.category == 'INITIAL_QS').all()
-  question_schemas = []
+  question_schemas = [
+    question.model_copy(update={"form_id": form_id})
+    for question in initial_questions_template_get(db=db)
+  ]
 
-  for question in questions:
-      # Initialize an empty list to hold OptionSchema instances for the current question
-      option_schemas = []
-      # Fetch options for the current question
-      options = db.query(Options).filter(Options.question_id == question.id).all()
-
-      for option in options:
-          # Create an OptionSchema instance for the current option
-          option_schema = OptionSchema(
-              id=option.id,
-              name=option.name,
-              type=option.type,
-              trait_name=option.trait_name,
-              question_id=option.question_id
-          )
-          # Append the OptionSchema instance to the list of option schemas
-          option_schemas.append(option_schema)
-      # Create a QuestionSchema instance for the current question with its options
-      question_schema = QuestionSchema(
-          id=question.id,
-          form_id=form_id,
-          name=question.name,
-          option_type=question.option_type,
-          options=option_schemas
-      )
-      # Append the QuestionSchema instance to the list of question schemas
-      question_schemas.append(question_schema)
-
-  # Create a FormSchema instance with the fetched questions and options
+  # Create a FormSchema instance with the shared questions and options
   form_data = FormSchema(
       id=form_id,
       name=form_name,
@@ -152,25 +184,146 @@ def form_questions_options_get_all(form_name: str, user_id: str, questions: List
   return form_data
 
 # Creating Form for other set of questions/options
-async def forms_create_one(db: Session, form: FormSchema):
-  db_form = Forms(name=form.name, user_id=form.user_id, sprint_number=form.sprint_number, sprint_id=form.sprint_id, development_plan_id=form.development_plan_id)
-  db.add(db_form)
-  db.flush()
+async def forms_create_one(db: Session, form: FormSchema, shared_questions: bool = True):
+  form_ids = await forms_create_many(db=db, forms=[form], shared_questions=shared_questions)
 
-  for question in form.questions:
-    db_question = Questions(name=question.name, form_id=db_form.id, option_type=question.option_type, category=question.category, rank=question.rank)
-    db.add(db_question)
-    db.flush()
+  # Return the created form with its questions and options
+  return { "form": form, "form_id": form_ids[0] }
+
+# Template questions are immutable, so their ids are cached per process by template key
+_question_template_ids: Dict[str, UUID] = {}
+_question_template_ids_lock = threading.Lock()
+
+def question_template_key(question: QuestionSchema) -> str:
+  content = [
+    question.name, question.category, question.option_type, question.rank,
+    [[option.name, option.type, option.trait_name] for option in question.options]
+  ]
+  return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+# Ids of the template questions for the given keys, inserting the missing templates and their options.
+# Does not commit; ids of templates created here are only cached by the caller after its commit.
+def question_templates_get_or_create(db: Session, questions_by_key: Dict[str, QuestionSchema]) -> Dict[str, UUID]:
+  with _question_template_ids_lock:
+    template_ids = {key: _question_template_ids[key] for key in questions_by_key if key in _question_template_ids}
+  missing = {key: question for key, question in questions_by_key.items() if key not in template_ids}
+  if not missing:
+    return template_ids
+
+  question_rows = {
+    key: {
+      "id": uuid7(),
+      "name": question.name,
+      "option_type": question.option_type,
+      "category": question.category,
+      "rank": question.rank,
+      "template_key": key
+    } for key, question in missing.items()
+  }
+  # A concurrent request may create the same template; ON CONFLICT waits for it and skips the row
+  created_keys = db.execute(
+    pg_insert(Questions).values(list(question_rows.values()))
+    .on_conflict_do_nothing(index_elements=[Questions.template_key])
+    .returning(Questions.template_key)
+  ).scalars().all()
+
+  option_rows = [
+    {
+      "id": uuid7(),
+      "name": option.name,
+      "type": option.type,
+      "trait_name": option.trait_name,
+      "question_id": question_rows[key]["id"]
+    } for key in created_keys for option in missing[key].options
+  ]
+  if option_rows:
+    db.execute(insert(Options), option_rows)
+
+  template_ids.update(db.execute(
+    select(Questions.template_key, Questions.id).where(Questions.template_key.in_(list(missing)))
+  ).all())
+  return template_ids
+
+'''
+Creating several Forms with their questions/options in one transaction.
+
+With shared_questions (default) the questions are canonical templates: each is stored once with its options
+and a form only gets form_questions links to it, so creating a form is one small INSERT into forms and one
+into form_questions once the templates exist. Pass shared_questions=False where the question text is
+personalized (e.g. the user's own development actions); those questions and options are copied per form.
+IDs are generated client-side so every table gets one multi-row INSERT.
+'''
+async def forms_create_many(db: Session, forms: List[FormSchema], shared_questions: bool = True) -> List[UUID]:
+  form_rows, question_rows, option_rows, link_rows = [], [], [], []
+
+  template_ids = {}
+  if shared_questions:
+    questions_by_key = {
+      question_template_key(question): question
+      for form in forms for question in form.questions or []
+    }
+    if questions_by_key:
+      template_ids = question_templates_get_or_create(db=db, questions_by_key=questions_by_key)
+
+  for form in forms:
+    form_id = uuid7()
+    form_rows.append({
+      "id": form_id,
+      "name": form.name,
+      "user_id": form.user_id,
+      "sprint_number": form.sprint_number,
+      "sprint_id": form.sprint_id,
+      "development_plan_id": form.development_plan_id
+    })
+
+    form_question_ids = []
+    for question in form.questions or []:
+      if shared_questions:
+        form_question_ids.append(template_ids[question_template_key(question)])
+        continue
+
+      question_id = uuid7()
+      question_rows.append({
+        "id": question_id,
+        "name": question.name,
+        "form_id": form_id,
+        "option_type": question.option_type,
+        "category": question.category,
+        "rank": question.rank
+      })
+      form_question_ids.append(question_id)
+
+      for option in question.options:
+        option_rows.append({
+          "id": uuid7(),
+          "name": option.name,
+          "type": option.type,
+          "trait_name": option.trait_name,
+          "question_id": question_id
+        })
+
+    # The same template twice in one form is linked once; position keeps the form's question order
+    link_rows.extend(
+      {"form_id": form_id, "question_id": question_id, "position": position}
+      for position, question_id in enumerate(dict.fromkeys(form_question_ids))
+    )
 
-    for option in question.options:
-      db_option = Options(name=option.name, type=option.type, trait_name=option.trait_name, question_id=db_question.id)
-      db.add(db_option)
+  # Parents first for the foreign keys
+  for model, rows in ((Forms, form_rows), (Questions, question_rows), (Options, option_rows), (FormQuestions, link_rows)):
+    if rows:
+      db.execute(insert(model), rows)
 
   # Commit the transaction to save all changes to the database
   db.commit()
 
-  # Return the created form with its questions and options
-  return { "form": form, "form_id": db_form.id }
+  with _question_template_ids_lock:
+    _question_template_ids.update(template_ids)
+
+  return [row["id"] for row in form_rows]
+
+# FOR INITIAL QUESTIONS - id of the user's form only; its questions/options come from the shared template
+def initial_questions_form_id_get(db: Session, name: str, user_id: str):
+  return db.query(Forms.id).filter(Forms.name == name, Forms.user_id == user_id).limit(1).scalar()
 
 # FOR INITIAL QUESTIONS - 1 form, all questions, all options for that question
 def initial_questions_forms_with_questions_options_get_all(db: Session, name: str, user_id: str):
@@ -198,9 +351,9 @@ def forms_with_questions_options_sprint_id_get_all(db: Session, name: str, user_
 
 # 1 form all questions, options, and answers
 def forms_with_questions_options_answers_get_all(db: Session, name: str, user_id: str):
+  # Questions may be shared templates, so their answers are not loaded through Questions.answers
   form = db.query(Forms).options(
-      joinedload(Forms.questions).subqueryload(Questions.options),
-      joinedload(Forms.questions).subqueryload(Questions.answers)
+      joinedload(Forms.questions).subqueryload(Questions.options)
   ).filter(Forms.user_id == user_id, Forms.name == name).first()
   
   form_type = FormSchema.from_orm(form)
@@ -215,80 +368,30 @@ def forms_get_one(db: Session, id: UUID):
   
   return db.query(Forms).filter_by(id=id).one()
 
-def delete_form_and_associations(db: Session, form_id: UUID):
-    # Find the form
-    form = db.execute(select(Forms).where(Forms.id == form_id)).scalar_one_or_none()
-    
-    if not form:
-        raise ValueError("Form not found")
-
-    # Find all questions associated with the form
-    questions = db.execute(
-        select(Questions).where(Questions.form_id == form_id)
-    ).scalars().all()
-
-    # Collect question IDs
-    question_ids = [question.id for question in questions]
-
-    # Delete answers associated with the form and its questions
-    db.execute(
-        delete(Answers).where((Answers.form_id == form_id))
-    )
-
-    # Delete options associated with each question
-    db.execute(
-        delete(Options).where(Options.question_id.in_(question_ids))
-    )
-
-    # Delete questions associated with the form
-    db.execute(
-        delete(Questions).where(Questions.form_id == form_id)
-    )
-
-    # Finally, delete the form itself
-    db.execute(
-        delete(Forms).where(Forms.id == form_id)
-    )
-
-    db.commit()
-
-def delete_form_and_associations_form_name(db: Session, form_name: str, dev_plan_id: str):
-    # Find the form
-    form = db.execute(select(Forms).where(
-       Forms.name == form_name,
-       Forms.development_plan_id == dev_plan_id
-    )).scalar_one_or_none()
-    
-    if not form:
-        return None
-
-    form_id = form.id
-    # Find all questions associated with the form
-    questions = db.execute(
-        select(Questions).where(Questions.form_id == form_id)
-    ).scalars().all()
-
-    # Collect question IDs
-    question_ids = [question.id for question in questions]
-
-    # Delete answers associated with the form and its questions
-    db.execute(
-        delete(Answers).where((Answers.form_id == form_id))
-    )
-
-    # Delete options associated with each question
-    db.execute(
-        delete(Options).where(Options.question_id.in_(question_ids))
-    )
-
-    # Delete questions associated with the form
-    db.execute(
-        delete(Questions).where(Questions.form_id == form_id)
-    )
-
-    # Finally, delete the form itself
-    db.execute(
-        delete(Forms).where(Forms.id == form_id)
+# Deletes any set of forms in one statement. The foreign keys cascade to their answers, question
+# links and per-form questions/options (shared template questions have no form_id and stay), and
+# null the sprint/chosen trait/chosen practice pointers. Returns the number of forms deleted.
+def forms_delete_many(db: Session, form_ids: List[UUID], commit: bool = True) -> int:
+    if not form_ids:
+        return 0
+
+    result = db.execute(delete(Forms).where(Forms.id.in_(form_ids)))
+    if commit:
+        db.commit()
+    return result.rowcount
+
+# Same, for forms of a development plan selected by name
+def forms_delete_many_by_name(db: Session, form_names: List[str], dev_plan_id: str, commit: bool = True) -> int:
+    result = db.execute(
+        delete(Forms).where(
+            Forms.name.in_(form_names),
+            Forms.development_plan_id == dev_plan_id
+        )
     )
+    if commit:
+        db.commit()
+    return result.rowcount
 
-    db.commit()
\ No newline at end of file
+def delete_form_and_associations(db: Session, form_id: UUID):
+    if not forms_delete_many(db=db, form_ids=[form_id]):
+        raise ValueError("Form not found")
@@ -0,0 +1,103 @@
+import logging
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.database.connection import SchedulerSessionLocal
+from app.database.models import GeneratedActionsCache
+from app.const import GENERATED_ACTIONS_CACHE_TTL_HOURS, GENERATED_ACTIONS_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# The cache is an optimization: read/write failures are logged and treated as a miss / skipped save,
+# never surfaced to the request.
+
+# Cache hits are recorded in memory and written to last_accessed_at in one UPDATE by the periodic
+# maintenance job, instead of a commit per hit
+_pending_touches = set()
+_pending_touches_lock = threading.Lock()
+
+def _cache_expiry_cutoff():
+    return datetime.now(timezone.utc) - timedelta(hours=GENERATED_ACTIONS_CACHE_TTL_HOURS)
+
+# Returns the cached generate_actions response for a prompt fingerprint, None if missing, expired or unreadable
+async def generated_actions_cache_get(db: Session, fingerprint: str):
+    try:
+        response = db.execute(
+            select(GeneratedActionsCache.response).where(
+                GeneratedActionsCache.fingerprint == fingerprint,
+                GeneratedActionsCache.created_at >= _cache_expiry_cutoff()
+            )
+        ).scalar_one_or_none()
+    except Exception:
+        logger.exception("Generated actions cache read failed")
+        db.rollback()
+        return None
+
+    if response is not None:
+        with _pending_touches_lock:
+            _pending_touches.add(fingerprint)
+
+    return response
+
+# Upsert on the unique fingerprint, so concurrent saves of the same prompt cannot conflict;
+# an expired entry for the same fingerprint gets refreshed in place
+async def generated_actions_cache_save(db: Session, fingerprint: str, response: dict):
+    statement = pg_insert(GeneratedActionsCache).values(fingerprint=fingerprint, response=response)
+    try:
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[GeneratedActionsCache.fingerprint],
+                set_={
+                    "response": statement.excluded.response,
+                    "created_at": func.now(),
+                    "last_accessed_at": func.now()
+                }
+            )
+        )
+        db.commit()
+    except Exception:
+        logger.exception("Generated actions cache save failed")
+        db.rollback()
+
+def _flush_touches(db: Session):
+    with _pending_touches_lock:
+        fingerprints = list(_pending_touches)
+        _pending_touches.clear()
+
+    if fingerprints:
+        db.execute(
+            update(GeneratedActionsCache)
+            .where(GeneratedActionsCache.fingerprint.in_(fingerprints))
+            .values(last_accessed_at=func.now())
+        )
+
+# Drops expired entries, then the least recently used ones above the size limit
+def generated_actions_cache_evict(db: Session):
+    _flush_touches(db)
+
+    db.execute(
+        delete(GeneratedActionsCache).where(GeneratedActionsCache.created_at < _cache_expiry_cutoff())
+    )
+
+    entry_count = db.query(func.count(GeneratedActionsCache.id)).scalar()
+    if entry_count > GENERATED_ACTIONS_CACHE_MAX_ENTRIES:
+        keep_ids = select(GeneratedActionsCache.id).order_by(
+            GeneratedActionsCache.last_accessed_at.desc()
+        ).limit(GENERATED_ACTIONS_CACHE_MAX_ENTRIES)
+
+        db.execute(
+            delete(GeneratedActionsCache).where(GeneratedActionsCache.id.not_in(keep_ids))
+        )
+
+    db.commit()
+
+# Scheduled job: writes the batched access times and evicts, on its own session (from the scheduler pool)
+def generated_actions_cache_maintenance_job():
+    try:
+        with closing(SchedulerSessionLocal()) as db:
+            generated_actions_cache_evict(db=db)
+    except Exception:
+        logger.exception("Generated actions cache maintenance failed")
@@ -1,26 +1,32 @@
 import random
 from uuid import UUID
-from sqlalchemy import delete
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.utils.domain_events import user_context_changed
 from app.database.models import Practices, Questions, ChosenTraits, ChosenPractices, PersonalPracticeCategory, ChosenPersonalPractices
 from app.schemas.models import PracticeSchema
 
-async def practice_save_one(db: Session, practice: PracticeSchema):
-    question_id = practice.question_id
-    question = db.query(Questions).filter(Questions.id == question_id).first()
-    chosen_trait = db.query(ChosenTraits).filter(ChosenTraits.form_id == question.form_id).first()
+# Trait questions are shared templates (no form_id), so the chosen trait is found by the answered form;
+# the practice is named after the question, read in the same query
+async def practice_save_one(db: Session, practice: PracticeSchema, form_id: str):
+    chosen_trait_id, question_name = db.execute(
+        select(ChosenTraits.id, Questions.name).where(
+            ChosenTraits.form_id == form_id,
+            Questions.id == practice.question_id
+        ).limit(1)
+    ).one()
     new_practice = Practices(
         user_id=practice.user_id,
-        chosen_trait_id=chosen_trait.id,
-        name=question.name
+        chosen_trait_id=chosen_trait_id,
+        name=question_name
     )
 
     db.add(new_practice)
     db.commit()
 
-async def practices_clear_existing(db: Session, question_id: str, user_id: str):
-    question = db.query(Questions).filter(Questions.id == question_id).first()
-    chosen_trait = db.query(ChosenTraits).filter(ChosenTraits.form_id == question.form_id).first()
+async def practices_clear_existing(db: Session, form_id: str, user_id: str):
+    chosen_trait = db.query(ChosenTraits).filter(ChosenTraits.form_id == form_id).first()
 
     existing_practices = db.query(Practices).filter(
         Practices.user_id == user_id,
@@ -59,6 +65,7 @@ async def practices_and_chosen_practices_clear_all(db: Session, chosen_strength_
     )))
 
     db.commit()
+    user_context_changed(user_id=user_id)
 
 async def practices_by_trait_type_get(db: Session, user_id: str, trait_type: str, dev_plan_id: str):
     chosen_trait_id = db.query(ChosenTraits.id).filter(
@@ -136,30 +143,36 @@ def chosen_practices_save_one(db: Session, user_id: str, name: str, practice_id:
         chosen_practice_id = chosen_practice.id
 
     db.commit()
+    user_context_changed(user_id=user_id)
 
     return { "chosen_practice_id": chosen_practice_id }
 
-async def chosen_practices_get(db: Session, user_id: str, sprint_number: int, dev_plan_id: str):
-    chosen_strength_practice = db.query(ChosenPractices).join(
+# Query and result shape shared by chosen_practices_get and chosen_practices_get_async
+def _chosen_practices_query(user_id: str, sprint_number: int, dev_plan_id: str):
+    return select(ChosenPractices, ChosenTraits.trait_type).join(
         ChosenTraits, ChosenPractices.chosen_trait_id == ChosenTraits.id
-    ).filter(
-        ChosenTraits.trait_type == "STRENGTH", 
+    ).where(
+        ChosenTraits.trait_type.in_(["STRENGTH", "WEAKNESS"]),
         ChosenPractices.user_id == user_id,
         ChosenPractices.sprint_number == sprint_number,
         ChosenPractices.development_plan_id == dev_plan_id
-    ).all()
+    )
 
-    chosen_weakness_practice = db.query(ChosenPractices).join(
-        ChosenTraits, ChosenPractices.chosen_trait_id == ChosenTraits.id
-    ).filter(
-        ChosenTraits.trait_type == "WEAKNESS", 
-        ChosenPractices.user_id == user_id,
-        ChosenPractices.sprint_number == sprint_number,
-        ChosenPractices.development_plan_id == dev_plan_id
-    ).all()
+def _chosen_practices_result(rows):
+    chosen_strength_practice = []
+    chosen_weakness_practice = []
+    for chosen_practice, trait_type in rows:
+        if trait_type == "STRENGTH":
+            chosen_strength_practice.append(chosen_practice)
+        else:
+            chosen_weakness_practice.append(chosen_practice)
 
     return { "chosen_strength_practice": chosen_strength_practice, "chosen_weakness_practice": chosen_weakness_practice }
 
+async def chosen_practices_get(db: Session, user_id: str, sprint_number: int, dev_plan_id: str):
+    rows = db.execute(_chosen_practices_query(user_id=user_id, sprint_number=sprint_number, dev_plan_id=dev_plan_id)).all()
+    return _chosen_practices_result(rows)
+
 
 async def personal_practice_category_save_one(db: Session, user_id: str, name: str, dev_plan_id: str):
     # check if user already has an existing category with same dev plan id
@@ -186,11 +199,15 @@ async def personal_practice_category_save_one(db: Session, user_id: str, name: s
 
     return{ "personal_practice_category_id": personal_practice_category_id }
 
-async def personal_practice_category_get_one(db: Session, user_id: str, dev_plan_id: str):
-    return db.query(PersonalPracticeCategory).filter(
+# Shared by personal_practice_category_get_one and personal_practice_category_get_one_async
+def _personal_practice_category_query(user_id: str, dev_plan_id: str):
+    return select(PersonalPracticeCategory).where(
         PersonalPracticeCategory.user_id == user_id,
         PersonalPracticeCategory.development_plan_id == dev_plan_id
-    ).first()
+    )
+
+async def personal_practice_category_get_one(db: Session, user_id: str, dev_plan_id: str):
+    return db.execute(_personal_practice_category_query(user_id=user_id, dev_plan_id=dev_plan_id)).scalars().first()
 
 async def chosen_personal_practices_clear_existing(db: Session, user_id: str, recommended_mind_body_category_id: str):
     # check existing 
@@ -232,8 +249,29 @@ async def chosen_personal_practices_save_one(db: Session, user_id: str, name: st
     db.add(new_personal_practice)
     db.commit()
 
-async def chosen_personal_practices_get_all(db: Session, user_id: str, recommended_mind_body_category_id: str):
-    return db.query(ChosenPersonalPractices).filter(
+def _chosen_personal_practices_query(user_id: str, recommended_mind_body_category_id: str):
+    return select(ChosenPersonalPractices).where(
         ChosenPersonalPractices.user_id == user_id, 
         ChosenPersonalPractices.personal_practice_category_id == recommended_mind_body_category_id
-    ).all()
\ No newline at end of file
+    )
+
+async def chosen_personal_practices_get_all(db: Session, user_id: str, recommended_mind_body_category_id: str):
+    return db.execute(
+        _chosen_personal_practices_query(user_id=user_id, recommended_mind_body_category_id=recommended_mind_body_category_id)
+    ).scalars().all()
+
+# ---- AsyncSession variants: awaited I/O for routes using get_async_db
+
+async def chosen_practices_get_async(db: AsyncSession, user_id: str, sprint_number: int, dev_plan_id: str):
+    result = await db.execute(_chosen_practices_query(user_id=user_id, sprint_number=sprint_number, dev_plan_id=dev_plan_id))
+    return _chosen_practices_result(result.all())
+
+async def personal_practice_category_get_one_async(db: AsyncSession, user_id: str, dev_plan_id: str):
+    result = await db.execute(_personal_practice_category_query(user_id=user_id, dev_plan_id=dev_plan_id))
+    return result.scalars().first()
+
+async def chosen_personal_practices_get_all_async(db: AsyncSession, user_id: str, recommended_mind_body_category_id: str):
+    result = await db.execute(
+        _chosen_personal_practices_query(user_id=user_id, recommended_mind_body_category_id=recommended_mind_body_category_id)
+    )
+    return result.scalars().all()
@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.utils.domain_events import user_context_changed
 from app.database.models import Sprints
 
 async def sprint_create_get_one(db: Session, user_id: str, dev_plan_id: str):
@@ -20,6 +22,7 @@ async def sprint_create_get_one(db: Session, user_id: str, dev_plan_id: str):
         db.add(first_sprint)
         db.flush()
         db.commit()
+        user_context_changed(user_id=user_id)
         
         return { 
             "sprint_number": first_sprint.number, 
@@ -46,6 +49,7 @@ async def sprint_create_get_one(db: Session, user_id: str, dev_plan_id: str):
             db.add(next_sprint)
             db.flush()
             db.commit()
+            user_context_changed(user_id=user_id)
 
             sprint_number = next_sprint.number
             sprint_id = next_sprint.id
@@ -121,6 +125,7 @@ async def sprint_update_is_finished_true(db: Session, user_id: str, sprint_id: s
         db.flush()
     
     db.commit()
+    user_context_changed(user_id=user_id)
     return { "message": f"Sprint {existing_sprint.number} with id {existing_sprint.id} is finished!" }
 
 async def sprint_update_second_sprint_dates(db: Session, user_id: str, sprint_id: str, dev_plan_id: str, start_date: datetime, end_date: datetime):
@@ -158,37 +163,44 @@ async def sprint_update_weakness_form_id(db: Session, user_id: str, sprint_id: s
 
     db.commit()
 
-# Get based on sprint_id
-async def get_sprint_start_end_date(db: Session, user_id: str, sprint_id: str):
-    existing_sprint =  db.query(Sprints).filter(
+# Queries and result shape shared by the get_sprint_start_end_date* functions and their async variants
+def _sprint_by_id_query(user_id: str, sprint_id: str):
+    return select(Sprints).where(
         Sprints.user_id == user_id,
         Sprints.id == sprint_id,
-    ).first()
+    )
+
+def _sprint_by_number_query(user_id: str, sprint_number: int, dev_plan_id: str):
+    return select(Sprints).where(
+        Sprints.user_id == user_id,
+        Sprints.number == sprint_number,
+        Sprints.development_plan_id == dev_plan_id
+    )
 
+# A missing sprint raises here (by id, callers expect the sprint to exist); the by-number
+# lookups check for None first
+def _sprint_dates(sprint):
     return {
-        "sprint_id": sprint_id, 
-        "sprint_number": existing_sprint.number, 
-        "start_date": existing_sprint.start_date,
-        "end_date": existing_sprint.end_date
+        "sprint_id": sprint.id, 
+        "sprint_number": sprint.number, 
+        "start_date": sprint.start_date,
+        "end_date": sprint.end_date
     }
 
+# Get based on sprint_id
+async def get_sprint_start_end_date(db: Session, user_id: str, sprint_id: str):
+    return _sprint_dates(db.execute(_sprint_by_id_query(user_id=user_id, sprint_id=sprint_id)).scalars().first())
+
 # Get based on sprint_number
 async def get_sprint_start_end_date_sprint_number(db: Session, user_id: str, sprint_number: int, dev_plan_id: str):
-    existing_sprint =  db.query(Sprints).filter(
-        Sprints.user_id == user_id,
-        Sprints.number == sprint_number,
-        Sprints.development_plan_id == dev_plan_id
-    ).first()
+    existing_sprint = db.execute(
+        _sprint_by_number_query(user_id=user_id, sprint_number=sprint_number, dev_plan_id=dev_plan_id)
+    ).scalars().first()
 
     if existing_sprint is None:
         return None
 
-    return {
-        "sprint_id": existing_sprint.id, 
-        "sprint_number": existing_sprint.number, 
-        "start_date": existing_sprint.start_date,
-        "end_date": existing_sprint.end_date
-    }
+    return _sprint_dates(existing_sprint)
 
 async def sprint_clear_fields(db: Session, user_id: str, sprint_id: str):
     existing_sprint = db.query(Sprints).filter(
@@ -200,4 +212,19 @@ async def sprint_clear_fields(db: Session, user_id: str, sprint_id: str):
         existing_sprint.strength_practice_form_id = None
         existing_sprint.weakness_practice_form_id = None
 
-    db.commit()
\ No newline at end of file
+    db.commit()
+
+# ---- AsyncSession variants: awaited I/O for routes using get_async_db
+
+async def get_sprint_start_end_date_async(db: AsyncSession, user_id: str, sprint_id: str):
+    result = await db.execute(_sprint_by_id_query(user_id=user_id, sprint_id=sprint_id))
+    return _sprint_dates(result.scalars().first())
+
+async def get_sprint_start_end_date_sprint_number_async(db: AsyncSession, user_id: str, sprint_number: int, dev_plan_id: str):
+    result = await db.execute(_sprint_by_number_query(user_id=user_id, sprint_number=sprint_number, dev_plan_id=dev_plan_id))
+    existing_sprint = result.scalars().first()
+
+    if existing_sprint is None:
+        return None
+
+    return _sprint_dates(existing_sprint)
@@ -0,0 +1,163 @@
+import json
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+'''
+Registry of the static JSON content under app/utils/data and app/ai/data.
+
+Everything is loaded, validated and frozen once (at startup, or lazily on first use)
+so request paths never re-open and re-parse the files. Call reload_static_content()
+after rewriting any of the files. The trait norms in traits.json only seed the
+trait_norms table; the live norms are read from there.
+'''
+
+TRAITS_PATH = "app/utils/data/traits.json"
+PRACTICE_FOLLOWUP_PATH = "app/utils/data/practice_followup.json"
+MIND_BODY_QUESTIONS_PATH = "app/utils/data/mind_body_questions.json"
+MIND_BODY_PRACTICES_PATH = "app/utils/data/mind_body_practices.json"
+INITIAL_QUESTIONS_PATH = "app/ai/data/initial_questions.json"
+
+@dataclass(frozen=True)
+class TraitNorms:
+    name: str
+    average: float
+    standard_deviation: float
+
+@dataclass(frozen=True)
+class TraitQuestion:
+    rank: str
+    question: str
+
+@dataclass(frozen=True)
+class MindBodyQuestion:
+    question: str
+    weight: int
+    options: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class InitialQuestionOption:
+    name: str
+    trait: str
+
+@dataclass(frozen=True)
+class InitialQuestion:
+    name: str
+    options: Tuple[InitialQuestionOption, ...]
+
+@dataclass(frozen=True)
+class StaticContent:
+    # Trait names in traits.json order; norms are indexed by name
+    traits: Tuple[str, ...]
+    trait_norms: Mapping[str, TraitNorms]
+    # trait -> practice follow-up questions ordered by rank
+    trait_questions: Mapping[str, Tuple[TraitQuestion, ...]]
+    # mind-body category -> questions / recommended practices
+    mind_body_questions: Mapping[str, Tuple[MindBodyQuestion, ...]]
+    mind_body_practices: Mapping[str, Tuple[str, ...]]
+    initial_questions: Tuple[InitialQuestion, ...]
+
+def _read_json(path: str):
+    with open(path, "r") as file:
+        return json.load(file)
+
+def _load_traits():
+    traits_data = _read_json(TRAITS_PATH)
+    traits = tuple(traits_data["traits"])
+
+    if not (len(traits) == len(traits_data["traits_avg"]) == len(traits_data["traits_std"])):
+        raise ValueError(f"{TRAITS_PATH}: traits, traits_avg and traits_std must have the same length")
+    if len(set(traits)) != len(traits):
+        raise ValueError(f"{TRAITS_PATH}: duplicate trait names")
+
+    trait_norms = {
+        name: TraitNorms(name=name, average=float(avg), standard_deviation=float(std))
+        for name, avg, std in zip(traits, traits_data["traits_avg"], traits_data["traits_std"])
+    }
+    return traits, MappingProxyType(trait_norms)
+
+def _load_trait_questions(traits: Tuple[str, ...]):
+    practice_followup = _read_json(PRACTICE_FOLLOWUP_PATH)
+
+    unknown_traits = set(practice_followup) - set(traits)
+    if unknown_traits:
+        raise ValueError(f"{PRACTICE_FOLLOWUP_PATH}: unknown traits {sorted(unknown_traits)}")
+
+    return MappingProxyType({
+        trait: tuple(
+            TraitQuestion(rank=rank, question=question)
+            for rank, question in sorted(questions.items(), key=lambda item: int(item[0]))
+        )
+        for trait, questions in practice_followup.items()
+    })
+
+def _load_mind_body():
+    questions_data = _read_json(MIND_BODY_QUESTIONS_PATH)
+    practices_data = _read_json(MIND_BODY_PRACTICES_PATH)
+
+    if set(questions_data) != set(practices_data):
+        raise ValueError(f"{MIND_BODY_QUESTIONS_PATH} and {MIND_BODY_PRACTICES_PATH} must have the same categories")
+
+    mind_body_questions = MappingProxyType({
+        category: tuple(
+            MindBodyQuestion(question=q_data["question"], weight=q_data["weight"], options=tuple(q_data["options"]))
+            for q_data in category_questions
+        )
+        for category, category_questions in questions_data.items()
+    })
+    mind_body_practices = MappingProxyType({
+        category: tuple(practices) for category, practices in practices_data.items()
+    })
+    return mind_body_questions, mind_body_practices
+
+def _load_initial_questions(traits: Tuple[str, ...]):
+    initial_questions = tuple(
+        InitialQuestion(
+            name=question["name"],
+            options=tuple(
+                InitialQuestionOption(name=option["name"], trait=option["trait"])
+                for option in question["options_w_traits"]
+            )
+        )
+        for question in _read_json(INITIAL_QUESTIONS_PATH)["initial_questions"]
+    )
+
+    unknown_traits = {option.trait for question in initial_questions for option in question.options} - set(traits)
+    if unknown_traits:
+        raise ValueError(f"{INITIAL_QUESTIONS_PATH}: unknown traits {sorted(unknown_traits)}")
+
+    return initial_questions
+
+def _build_static_content() -> StaticContent:
+    traits, trait_norms = _load_traits()
+    mind_body_questions, mind_body_practices = _load_mind_body()
+
+    return StaticContent(
+        traits=traits,
+        trait_norms=trait_norms,
+        trait_questions=_load_trait_questions(traits),
+        mind_body_questions=mind_body_questions,
+        mind_body_practices=mind_body_practices,
+        initial_questions=_load_initial_questions(traits)
+    )
+
+_static_content: Optional[StaticContent] = None
+_static_content_lock = threading.Lock()
+
+def reload_static_content() -> StaticContent:
+    """(Re)load every file; the new content is swapped in only if all of it validates"""
+    global _static_content
+    content = _build_static_content()
+    with _static_content_lock:
+        _static_content = content
+    return content
+
+def get_static_content() -> StaticContent:
+    content = _static_content
+    if content is None:
+        with _static_content_lock:
+            content = _static_content
+        if content is None:
+            content = reload_static_content()
+    return content
@@ -0,0 +1,151 @@
+from typing import Dict
+from sqlalchemy import select, update, values, column, func, String, Float
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.database.models import TraitNorms, Traits, Users
+from app.utils.static_content import get_static_content
+
+# Number of submissions the traits.json norms were computed from
+TRAIT_NORMS_SEED_COUNT = 101
+
+# Seeds the norms of traits.json for traits that have no row yet; existing (updated) norms are kept,
+# only rows without streaming aggregates get them backfilled from their current average/stdev
+def trait_norms_seed(db: Session):
+    trait_norms = get_static_content().trait_norms
+    insert_norms = pg_insert(TraitNorms).values([
+        {
+            "name": norms.name,
+            "average": norms.average,
+            "standard_deviation": norms.standard_deviation,
+            "sample_count": TRAIT_NORMS_SEED_COUNT,
+            "m2": norms.standard_deviation ** 2 * (TRAIT_NORMS_SEED_COUNT - 1)
+        } for norms in trait_norms.values()
+    ])
+
+    db.execute(
+        insert_norms.on_conflict_do_update(
+            index_elements=[TraitNorms.name],
+            set_={
+                "sample_count": TRAIT_NORMS_SEED_COUNT,
+                "m2": func.power(TraitNorms.standard_deviation, 2) * (TRAIT_NORMS_SEED_COUNT - 1)
+            },
+            where=TraitNorms.sample_count.is_(None)
+        )
+    )
+    db.commit()
+
+def _observations(observation: Dict[str, int]):
+    # Every trait is observed, traits the user did not pick count as 0
+    return values(
+        column("name", String), column("x", Float), name="observations"
+    ).data([(trait, float(observation.get(trait, 0))) for trait in get_static_content().traits])
+
+'''
+Welford update of every trait's norms with one user's raw scores, as a single UPDATE ... FROM (VALUES ...).
+The row locks serialize concurrent submissions and every SET expression reads the pre-update row:
+  n' = n + 1, mean' = mean + d/(n + 1), M2' = M2 + d^2 * n/(n + 1), stdev' = sqrt(M2'/n)   (d = x - mean)
+An empty observation (no trait scored) is not a submission and is skipped. The user is marked as
+observed. Does not commit, so it is atomic with the answers it is computed from.
+'''
+def trait_norms_observe(db: Session, user_id: str, observation: Dict[str, int]):
+    if not observation:
+        return
+
+    db.execute(update(Users).where(Users.id == user_id).values(trait_norms_observed=True))
+    observations = _observations(observation)
+    n = TraitNorms.sample_count
+    delta = observations.c.x - TraitNorms.average
+    m2 = TraitNorms.m2 + delta * delta * n / (n + 1)
+
+    db.execute(
+        update(TraitNorms)
+        .where(TraitNorms.name == observations.c.name)
+        .values(
+            sample_count=n + 1,
+            average=TraitNorms.average + delta / (n + 1),
+            m2=m2,
+            standard_deviation=func.sqrt(m2 / n),
+            version=TraitNorms.version + 1
+        )
+    )
+
+'''
+Reverse Welford update, used when a user resubmits so each user is counted once:
+  n' = n - 1, mean' = (n * mean - x)/(n - 1), M2' = M2 - d^2 * n/(n - 1), stdev' = sqrt(M2'/(n - 2))   (d = x - mean)
+Only applied if the user is marked as observed (scores saved before the incremental updates existed
+are not in the norms until a reconcile); clears the mark.
+'''
+def trait_norms_unobserve(db: Session, user_id: str, observation: Dict[str, int]):
+    was_observed = db.execute(
+        update(Users)
+        .where(Users.id == user_id, Users.trait_norms_observed.is_(True))
+        .values(trait_norms_observed=False)
+        .returning(Users.id)
+    ).first()
+    if was_observed is None:
+        return
+
+    observations = _observations(observation)
+    n = TraitNorms.sample_count
+    delta = observations.c.x - TraitNorms.average
+    m2 = func.greatest(TraitNorms.m2 - delta * delta * n / (n - 1), 0)
+
+    db.execute(
+        update(TraitNorms)
+        .where(TraitNorms.name == observations.c.name, n > 2)
+        .values(
+            sample_count=n - 1,
+            average=(TraitNorms.average * n - observations.c.x) / (n - 1),
+            m2=m2,
+            standard_deviation=func.sqrt(m2 / (n - 2)),
+            version=TraitNorms.version + 1
+        )
+    )
+
+'''
+Exact recomputation of the norms: the traits.json seed combined (Chan et al. parallel formula) with
+count/mean/M2 of the raw scores of every user who submitted, written in one UPDATE ... FROM.
+Corrects floating-point drift of the incremental updates and folds in submissions saved before they
+existed; a submission committed while this statement runs is picked up by the next run.
+'''
+def trait_norms_reconcile(db: Session):
+    trait_norms = get_static_content().trait_norms
+    seed = values(
+        column("name", String), column("n", Float), column("mean", Float), column("m2", Float), name="seed"
+    ).data([
+        (norms.name, float(TRAIT_NORMS_SEED_COUNT), norms.average, norms.standard_deviation ** 2 * (TRAIT_NORMS_SEED_COUNT - 1))
+        for norms in trait_norms.values()
+    ])
+
+    submitted_users = select(Traits.user_id).where(Traits.total_raw_score.isnot(None)).distinct()
+    raw_score = func.coalesce(Traits.total_raw_score, 0)
+    users = select(
+        Traits.name,
+        func.count().label("n"),
+        func.avg(raw_score).label("mean"),
+        (func.var_pop(raw_score) * func.count()).label("m2")
+    ).where(Traits.user_id.in_(submitted_users)).group_by(Traits.name).subquery("users")
+
+    combined = select(
+        seed.c.name,
+        (seed.c.n + func.coalesce(users.c.n, 0)).label("n"),
+        (seed.c.mean + func.coalesce(users.c.mean - seed.c.mean, 0) * func.coalesce(users.c.n, 0) / (seed.c.n + func.coalesce(users.c.n, 0))).label("mean"),
+        (seed.c.m2 + func.coalesce(users.c.m2, 0)
+            + func.coalesce(func.power(users.c.mean - seed.c.mean, 2) * seed.c.n * users.c.n / (seed.c.n + users.c.n), 0)).label("m2")
+    ).select_from(seed.outerjoin(users, users.c.name == seed.c.name)).subquery("combined")
+
+    result = db.execute(
+        update(TraitNorms)
+        .where(TraitNorms.name == combined.c.name)
+        .values(
+            sample_count=combined.c.n,
+            average=combined.c.mean,
+            m2=combined.c.m2,
+            standard_deviation=func.sqrt(combined.c.m2 / (combined.c.n - 1)),
+            version=TraitNorms.version + 1
+        )
+    )
+    # Every submitted user is now counted in the norms
+    db.execute(update(Users).where(Users.id.in_(submitted_users)).values(trait_norms_observed=True))
+    db.commit()
+    return result.rowcount
@@ -1,9 +1,12 @@
-import json
 from uuid import UUID
-from sqlalchemy import func, asc, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import func, asc, desc, select, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 from app.utils.forms_crud import delete_form_and_associations
-from app.database.models import Traits, ChosenTraits
+from app.utils.domain_events import user_context_changed, user_context_reset
+from app.utils.static_content import get_static_content
+from app.database.uuid7 import uuid7
+from app.database.models import Traits, TraitNorms, ChosenTraits
 from app.schemas.models import TraitsSchema, FormAnswerSchema, ChosenTraitsSchema
 
 # Creates set of Traits for a new User
@@ -11,36 +14,52 @@ def traits_create(db: Session, user_id: str):
     if db.query(Traits).filter(Traits.user_id == user_id).count() == 18:
         return "User competencies already exist"
     
-    with open("app/utils/data/traits.json", "r") as traits_json:
-        traits_data = json.load(traits_json)
+    trait_names = get_static_content().traits
     
-    trait_ids_names = []
-
-    for name, avg, std in zip(traits_data["traits"], traits_data["traits_avg"], traits_data["traits_std"]):
-        db_trait = Traits(
-            user_id=user_id, 
-            name=name, 
-            average=avg, 
-            standard_deviation=std
-        )
-        db.add(db_trait)
-        db.flush()
-        trait_ids_names.append((str(db_trait.id), db_trait.name))
+    # ids generated client-side so all 18 traits go in as one multi-row INSERT;
+    # norms are not copied per user, T-scores join trait_norms
+    trait_rows = [
+        {
+            "id": uuid7(),
+            "user_id": user_id,
+            "name": trait_name
+        } for trait_name in trait_names
+    ]
+    db.execute(insert(Traits), trait_rows)
 
     db.commit()
-    return trait_ids_names
+    return [(str(row["id"]), row["name"]) for row in trait_rows]
+
+# T-Score: (Count of Traits Choice - Avg)/Stdev*10+50, with Avg/Stdev from the shared trait_norms.
+# The incremental norm update of a submission only rescores that user; everyone else is rescored by
+# traits_rescore_all when update_trait_norms_job recomputes the norms.
+def _tscore_update():
+    return update(Traits).where(Traits.name == TraitNorms.name).values(
+        t_score=(func.coalesce(Traits.total_raw_score, 0) - TraitNorms.average) / TraitNorms.standard_deviation * 10 + 50
+    )
 
 # Compute T-Score for user Traits: used in Post Save Initial Answers endpoint
-# Formula: (Count of Traits Choice - Avg)/Stdev*10+50
 def traits_compute_tscore(db: Session, answers: FormAnswerSchema):
     user_id = answers.user_id
-    user_traits = db.query(Traits).filter(Traits.user_id == user_id).all()
+    db.execute(
+        _tscore_update().where(Traits.user_id == user_id)
+    )
 
-    if user_traits:
-        for trait in user_traits:
-            trait.t_score = (func.coalesce(Traits.total_raw_score, 0) - trait.average)/trait.standard_deviation * 10 + 50
+    db.commit()
+    user_context_changed(user_id=user_id)
+
+# Recompute the T-Scores of every user who submitted, in one UPDATE ... FROM trait_norms.
+# Users who have not answered the initial questions yet keep no score.
+def traits_rescore_all(db: Session):
+    submitted_traits = aliased(Traits)
+    submitted_users = select(submitted_traits.user_id).where(submitted_traits.total_raw_score.isnot(None)).distinct()
+    result = db.execute(
+        _tscore_update().where(Traits.user_id.in_(submitted_users))
+    )
 
     db.commit()
+    user_context_reset()
+    return result.rowcount
 
 def traits_get_top_bottom_five(db: Session, user_id: str):
     top_user_traits = db.query(Traits).filter(Traits.user_id == user_id).order_by(desc(Traits.t_score)).limit(5).all()
@@ -98,23 +117,27 @@ def chosen_traits_create(db: Session, user_id: str, trait_id: str, trait_name: s
         db.flush()
 
     db.commit()
+    user_context_changed(user_id=user_id)
 
-def chosen_traits_get(db: Session, user_id: str, dev_plan_id: str):
-    user_strength = db.query(ChosenTraits).filter(
-        ChosenTraits.user_id == user_id,
-        ChosenTraits.trait_type == "STRENGTH",
-        ChosenTraits.development_plan_id == dev_plan_id
-        ).first()
-    
-    user_weakness = db.query(ChosenTraits).filter(
+# Query and result shape shared by chosen_traits_get and chosen_traits_get_async
+def _chosen_traits_query(user_id: str, dev_plan_id: str):
+    return select(ChosenTraits).where(
         ChosenTraits.user_id == user_id,
-        ChosenTraits.trait_type == "WEAKNESS",
+        ChosenTraits.trait_type.in_(["STRENGTH", "WEAKNESS"]),
         ChosenTraits.development_plan_id == dev_plan_id
-        ).first()
-    
+    )
+
+def _chosen_traits_result(user_id: str, chosen_traits):
+    by_type = {}
+    for chosen_trait in chosen_traits:
+        by_type.setdefault(chosen_trait.trait_type, chosen_trait)
+
+    user_strength = by_type.get("STRENGTH")
+    user_weakness = by_type.get("WEAKNESS")
+
     if user_strength is None or user_weakness is None:
         return None
-    
+
     return {
         "user_id": user_id,
         "chosen_strength": {
@@ -131,6 +154,10 @@ def chosen_traits_get(db: Session, user_id: str, dev_plan_id: str):
         }
     }
 
+def chosen_traits_get(db: Session, user_id: str, dev_plan_id: str):
+    chosen_traits = db.execute(_chosen_traits_query(user_id=user_id, dev_plan_id=dev_plan_id)).scalars().all()
+    return _chosen_traits_result(user_id=user_id, chosen_traits=chosen_traits)
+
 def chosen_traits_clear(db: Session, user_id: str, dev_plan_id: str):
     user_strength = db.query(ChosenTraits).filter(
         ChosenTraits.user_id == user_id,
@@ -154,4 +181,11 @@ def chosen_traits_clear(db: Session, user_id: str, dev_plan_id: str):
         db.delete(user_weakness)
         db.flush()
     
-    db.commit()
\ No newline at end of file
+    db.commit()
+    user_context_changed(user_id=user_id)
+
+# ---- AsyncSession variants: awaited I/O for routes using get_async_db
+
+async def chosen_traits_get_async(db: AsyncSession, user_id: str, dev_plan_id: str):
+    result = await db.execute(_chosen_traits_query(user_id=user_id, dev_plan_id=dev_plan_id))
+    return _chosen_traits_result(user_id=user_id, chosen_traits=result.scalars().all())
@@ -0,0 +1,101 @@
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased
+from app.database.models import Users, Forms, FormQuestions, Answers, Traits, DevelopmentPlan, ChosenTraits, Sprints, ChosenPractices
+
+def _chosen_trait_name(user_id: str, dev_plan_id, trait_type: str):
+    return select(ChosenTraits.name).where(
+        ChosenTraits.user_id == user_id,
+        ChosenTraits.trait_type == trait_type,
+        ChosenTraits.development_plan_id == dev_plan_id
+    ).limit(1).scalar_subquery()
+
+def _chosen_practice_name(user_id: str, dev_plan_id, sprint_number, trait_type: str):
+    return select(ChosenPractices.name).join(
+        ChosenTraits, ChosenPractices.chosen_trait_id == ChosenTraits.id
+    ).where(
+        ChosenTraits.trait_type == trait_type,
+        ChosenPractices.user_id == user_id,
+        ChosenPractices.sprint_number == sprint_number,
+        ChosenPractices.development_plan_id == dev_plan_id
+    ).limit(1).scalar_subquery()
+
+def _five_trait_names(user_id: str, descending: bool):
+    # Same ordering as traits_get_top_bottom_five, kept inside the aggregate
+    order = Traits.t_score.desc() if descending else Traits.t_score.asc()
+    five_traits = select(Traits.name, Traits.t_score).where(
+        Traits.user_id == user_id
+    ).order_by(order).limit(5).subquery()
+
+    agg_order = five_traits.c.t_score.desc() if descending else five_traits.c.t_score.asc()
+    return select(func.json_agg(aggregate_order_by(five_traits.c.name, agg_order))).scalar_subquery()
+
+def _initial_answers(initial_form_id):
+    # format_initial_questions pairs answers with the initial questions by index, so they are
+    # aggregated in question order (the form's question positions), not in storage order
+    return select(
+        func.json_agg(aggregate_order_by(Answers.answer, FormQuestions.position))
+    ).select_from(Answers).join(
+        FormQuestions,
+        (FormQuestions.form_id == Answers.form_id) & (FormQuestions.question_id == Answers.question_id)
+    ).where(Answers.form_id == initial_form_id).scalar_subquery()
+
+'''
+Loads everything UserDataService.get_user_base_data needs in a single statement:
+company details, initial question answers, top/bottom five traits, the current dev plan,
+chosen traits, the current sprint and the chosen practices of that sprint.
+
+Mirrors the lookups of get_user_company_details, initial_questions_answers_all_forms_get_all,
+traits_get_top_bottom_five, dev_plan_get_current, chosen_traits_get, sprint_get_current and
+chosen_practices_get, which together cost about a dozen round trips.
+'''
+def user_ai_context_get(db: Session, user_id: str):
+    # Current dev plan: highest number for the user, only if not finished
+    max_dev_plan = aliased(DevelopmentPlan)
+    current_plan = select(DevelopmentPlan.id).where(
+        DevelopmentPlan.user_id == user_id,
+        DevelopmentPlan.is_finished == False,
+        DevelopmentPlan.number == select(func.max(max_dev_plan.number)).where(
+            max_dev_plan.user_id == user_id
+        ).scalar_subquery()
+    ).limit(1).cte("current_plan")
+    current_plan_id = select(current_plan.c.id).scalar_subquery()
+
+    # Current sprint: highest number under the current dev plan
+    max_sprint = aliased(Sprints)
+    current_sprint = select(Sprints.id, Sprints.number, Sprints.is_finished).where(
+        Sprints.user_id == user_id,
+        Sprints.development_plan_id == current_plan_id,
+        Sprints.number == select(func.max(max_sprint.number)).where(
+            max_sprint.user_id == user_id,
+            max_sprint.development_plan_id == current_plan_id
+        ).scalar_subquery()
+    ).limit(1).cte("current_sprint")
+    # No sprint yet means sprint 1 (see sprint_get_current)
+    sprint_number = func.coalesce(select(current_sprint.c.number).scalar_subquery(), 1)
+
+    initial_form_id = select(Forms.id).where(
+        Forms.user_id == user_id,
+        Forms.name == "1_INITIAL_QUESTIONS"
+    ).limit(1).scalar_subquery()
+
+    query = select(
+        Users.id,
+        Users.company_size,
+        Users.industry,
+        Users.role,
+        Users.role_description,
+        _initial_answers(initial_form_id).label("initial_answers"),
+        _five_trait_names(user_id, descending=True).label("strengths"),
+        _five_trait_names(user_id, descending=False).label("weaknesses"),
+        current_plan_id.label("dev_plan_id"),
+        _chosen_trait_name(user_id, current_plan_id, "STRENGTH").label("chosen_strength"),
+        _chosen_trait_name(user_id, current_plan_id, "WEAKNESS").label("chosen_weakness"),
+        select(current_sprint.c.id).scalar_subquery().label("sprint_id"),
+        sprint_number.label("sprint_number"),
+        select(current_sprint.c.is_finished).scalar_subquery().label("sprint_is_finished"),
+        _chosen_practice_name(user_id, current_plan_id, sprint_number, "STRENGTH").label("strength_practice"),
+        _chosen_practice_name(user_id, current_plan_id, sprint_number, "WEAKNESS").label("weakness_practice")
+    ).where(Users.id == user_id)
+
+    return db.execute(query).first()
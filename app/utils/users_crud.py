@@ -1,7 +1,12 @@
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, DateTime
-from app.database.models import Users, Forms, Traits, ChosenTraits, Questions, Options, Answers, Practices, DevelopmentPlan, Sprints, Company, UserInvitation
+from sqlalchemy import select, update, delete, DateTime
+from app.utils.domain_events import user_context_changed
+from app.utils.trait_norms_crud import trait_norms_unobserve
+from app.database.models import (
+    Users, Forms, Traits, ChosenTraits, Practices, ChosenPractices, DevelopmentPlan, Sprints, Company, UserInvitation,
+    UserColleagues, UserColleaguesSurvey, PersonalPracticeCategory, ChosenPersonalPractices, PendingActions, InitialAnswerTracker
+)
 from app.schemas.models import UserCompanyDetailsSchema
 from datetime import datetime, timezone
 
@@ -14,6 +19,7 @@ def update_user_company_details(db: Session, user_id: str, company_size: str, in
         db_user.role = role
         db_user.role_description = role_description
         db.commit()
+        user_context_changed(user_id=user_id)
 
     return db_user
 
@@ -76,45 +82,47 @@ def update_user(db: Session, user_id=None, email=None, first_name=None, last_nam
 
     return db_user
 
-def delete_user(db: Session, user_id):
-    db_user = db.query(Users).filter(Users.id == user_id).first()
-    
-    # Query all related entries for the user
-    # Query all Forms except initial questions form
-    if db_user:
-        forms = db.query(Forms).filter(Forms.user_id == db_user.id, Forms.name != '1_INITIAL_QUESTIONS').all()
-        for form in forms:
-            questions = db.query(Questions).filter(Questions.form_id == form.id).all()
-            for question in questions:
-                options = db.query(Options).filter(Options.question_id == question.id).all()
-                answers = db.query(Answers).filter(Answers.form_id == form.id, Answers.question_id == question.id).all()
-                for option, answer in zip(options, answers):
-                    db.delete(answer)
-                    db.delete(option)
-                
-                db.delete(question)
-            db.delete(form)
-
-        chosen_traits = db.query(ChosenTraits).filter(ChosenTraits.user_id == db_user.id).all()
-        for chosen_trait in chosen_traits:
-            practices = db.query(Practices).filter(Practices.id == chosen_trait.practice_id).all()
-            for practice in practices:
-                db.delete(practice)
-                db.delete(chosen_trait)
-
-        traits = db.query(Traits).filter(Traits.user_id == db_user.id).all()
-        development_plans = db.query(DevelopmentPlan).filter(DevelopmentPlan.user_id == db_user.id).all()
-        for trait in traits:
-            db.delete(trait)
-        for dp in development_plans:
-            db.delete(dp)
-    
-        db.delete(db_user)
-        db.commit()
+'''
+Deletes a user and everything they own in one transaction, with one statement per table, children
+before parents. The development plan's pointers to chosen traits/practices, sprints and the personal
+practice category are cleared first because those rows point back at the plan. Deleting the forms
+cascades to their questions, options and answers. The user's raw scores leave the trait norms, as on
+a resubmission of the initial questions. Returns False if the user does not exist.
+'''
+def user_delete_all(db: Session, user_id: str) -> bool:
+    db.execute(
+        update(DevelopmentPlan).where(DevelopmentPlan.user_id == user_id).values(
+            chosen_strength_id=None,
+            chosen_weakness_id=None,
+            sprint_1_id=None,
+            chosen_strength_practice_1_id=None,
+            chosen_weakness_practice_1_id=None,
+            sprint_2_id=None,
+            chosen_strength_practice_2_id=None,
+            chosen_weakness_practice_2_id=None,
+            personal_practice_category_id=None
+        )
+    )
+    db.execute(delete(UserColleaguesSurvey).where(
+        UserColleaguesSurvey.user_colleague_id.in_(select(UserColleagues.id).where(UserColleagues.user_id == user_id))
+    ))
+    for model in (UserColleagues, Forms, ChosenPersonalPractices, PersonalPracticeCategory, ChosenPractices, Practices, ChosenTraits):
+        db.execute(delete(model).where(model.user_id == user_id))
+
+    deleted_scores = db.execute(
+        delete(Traits).where(Traits.user_id == user_id).returning(Traits.name, Traits.total_raw_score)
+    ).all()
+    if any(total_raw_score is not None for _, total_raw_score in deleted_scores):
+        trait_norms_unobserve(db, user_id, {name: total_raw_score or 0 for name, total_raw_score in deleted_scores})
 
-        return True
-    
-    return False
+    for model in (Sprints, DevelopmentPlan, PendingActions, InitialAnswerTracker):
+        db.execute(delete(model).where(model.user_id == user_id))
+    db.execute(update(UserInvitation).where(UserInvitation.user_id == user_id).values(user_id=None))
+    deleted_users = db.execute(delete(Users).where(Users.id == user_id)).rowcount
+
+    db.commit()
+    user_context_changed(user_id=user_id)
+    return deleted_users > 0
 
 def get_all_user_dashboard(db: Session, company_id: str):
     result = db.execute(
@@ -0,0 +1,96 @@
+"""
+Per-form insert latency for the 1_MIND_BODY_QUESTIONS and trait follow-up forms.
+
+Compares the previous row-by-row insert (flush per question) with forms_create_many
+(three multi-row INSERTs), against the database in SQLALCHEMY_DATABASE_URL.
+Every created form is deleted again afterwards.
+
+Usage: python -m benchmarks.form_creation <user_id> [runs]
+"""
+import sys
+import time
+import asyncio
+from app.database.connection import SessionLocal
+from app.database.models import Forms, Questions, Options
+from app.schemas.models import FormSchema
+from app.utils.forms_crud import (
+    forms_create_many,
+    mind_body_form_questions_options_get_all,
+    form_questions_options_get_all,
+    delete_form_and_associations
+)
+from app.utils.static_content import get_static_content
+
+LIKERT_OPTIONS = ["Not at All", "To a Small Extent", "To a Moderate Extent", "To a Large Extent", "To the Fullest Extent"]
+
+def mind_body_form(user_id: str) -> FormSchema:
+    questions, weights, options, categories = [], [], [], []
+    for category, category_questions in get_static_content().mind_body_questions.items():
+        for q_data in category_questions:
+            questions.append(q_data.question)
+            weights.append(q_data.weight)
+            options.append(list(q_data.options))
+            categories.append(category)
+
+    return mind_body_form_questions_options_get_all(
+        user_id=user_id, form_name="1_MIND_BODY_QUESTIONS", option_type="multiple_choice",
+        categories=categories, questions=questions, options=options, weights=weights
+    )
+
+def trait_form(user_id: str) -> FormSchema:
+    trait, trait_questions = next(iter(get_static_content().trait_questions.items()))
+    return form_questions_options_get_all(
+        user_id=user_id, form_name="1_STRENGTH_QUESTIONS", option_type="likert_scale", category="TRAITS_QS",
+        questions=[q.question for q in trait_questions], ranks=[q.rank for q in trait_questions],
+        options=LIKERT_OPTIONS, trait_name=trait
+    )
+
+# Previous forms_create_one body: one flush (round trip) per question
+async def forms_create_row_by_row(db, forms):
+    form_ids = []
+    for form in forms:
+        db_form = Forms(name=form.name, user_id=form.user_id, sprint_number=form.sprint_number, sprint_id=form.sprint_id, development_plan_id=form.development_plan_id)
+        db.add(db_form)
+        db.flush()
+
+        for question in form.questions:
+            db_question = Questions(name=question.name, form_id=db_form.id, option_type=question.option_type, category=question.category, rank=question.rank)
+            db.add(db_question)
+            db.flush()
+
+            for option in question.options:
+                db.add(Options(name=option.name, type=option.type, trait_name=option.trait_name, question_id=db_question.id))
+
+        db.commit()
+        form_ids.append(db_form.id)
+    return form_ids
+
+async def measure(create, form: FormSchema, runs: int):
+    timings = []
+    db = SessionLocal()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            form_ids = await create(db, [form])
+            timings.append((time.perf_counter() - started) * 1000)
+
+            for form_id in form_ids:
+                delete_form_and_associations(db=db, form_id=form_id)
+    finally:
+        db.close()
+
+    timings.sort()
+    return {"median_ms": round(timings[len(timings) // 2], 2), "min_ms": round(timings[0], 2)}
+
+async def main(user_id: str, runs: int):
+    for form in [mind_body_form(user_id), trait_form(user_id)]:
+        option_count = sum(len(question.options) for question in form.questions)
+        print(f"{form.name} ({len(form.questions)} questions, {option_count} options)")
+        print(f"  row by row: {await measure(forms_create_row_by_row, form, runs)}")
+        print(f"  bulk:       {await measure(lambda db, forms: forms_create_many(db=db, forms=forms), form, runs)}")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 20))
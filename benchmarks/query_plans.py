@@ -0,0 +1,161 @@
+"""
+Query-plan regression check for the hot CRUD lookups.
+
+Seeds a synthetic dataset (users with dev plans, sprints, forms, questions, options,
+answers, traits, chosen traits and practices), runs ANALYZE, then EXPLAINs each hot
+query and fails if the planner reads the queried table with a sequential scan.
+Everything runs in one transaction against SQLALCHEMY_DATABASE_URL and is rolled
+back, so the database is left untouched.
+
+Usage: python -m benchmarks.query_plans [users]
+Also run by tests/test_query_plans.py when a database is configured.
+"""
+import sys
+import json
+from sqlalchemy import text
+from app.database.connection import engine
+# Importing the models runs create_all and the migrations, so the indexes exist
+import app.database.models  # noqa: F401
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO users (id, email)
+    SELECT 'qp-user-' || g, 'qp-user-' || g || '@example.com' FROM generate_series(1, :users) g
+    """,
+    """
+    INSERT INTO development_plan (id, user_id, number, is_finished)
+    SELECT gen_random_uuid(), u.id, n, n = 1
+    FROM users u, generate_series(1, 2) n WHERE u.id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO sprints (id, user_id, development_plan_id, number, is_finished)
+    SELECT gen_random_uuid(), dp.user_id, dp.id, n, false
+    FROM development_plan dp, generate_series(1, 2) n WHERE dp.user_id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO forms (id, name, user_id, development_plan_id)
+    SELECT gen_random_uuid(), form_name, dp.user_id, dp.id
+    FROM development_plan dp,
+         unnest(ARRAY['1_STRENGTH_QUESTIONS', '1_WEAKNESS_QUESTIONS', '1_MIND_BODY_QUESTIONS',
+                      '1_STRENGTH_PRACTICE_QUESTIONS', '1_WEAKNESS_PRACTICE_QUESTIONS']) form_name
+    WHERE dp.user_id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO questions (id, name, form_id, category, rank)
+    SELECT gen_random_uuid(), 'Question ' || n, f.id, 'QP', n
+    FROM forms f, generate_series(1, 5) n WHERE f.user_id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO options (id, name, type, question_id)
+    SELECT gen_random_uuid(), 'Option ' || n, n::text, q.id
+    FROM questions q, generate_series(1, 4) n WHERE q.category = 'QP'
+    """,
+    """
+    INSERT INTO answers (id, form_id, question_id, answer)
+    SELECT gen_random_uuid(), q.form_id, q.id, 'Answer' FROM questions q WHERE q.category = 'QP'
+    """,
+    """
+    INSERT INTO traits (id, user_id, name, total_raw_score, t_score)
+    SELECT gen_random_uuid(), u.id, 'Trait ' || n, n % 7, 40 + n
+    FROM users u, generate_series(1, 18) n WHERE u.id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO chosen_traits (id, user_id, name, trait_type, development_plan_id)
+    SELECT gen_random_uuid(), dp.user_id, 'Trait ' || trait_type, trait_type, dp.id
+    FROM development_plan dp, unnest(ARRAY['STRENGTH', 'WEAKNESS']) trait_type
+    WHERE dp.user_id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO practices (id, user_id, chosen_trait_id, name)
+    SELECT gen_random_uuid(), ct.user_id, ct.id, 'Practice ' || n
+    FROM chosen_traits ct, generate_series(1, 5) n WHERE ct.user_id LIKE 'qp-user-%'
+    """,
+    """
+    INSERT INTO chosen_practices (id, user_id, name, chosen_trait_id, sprint_number, development_plan_id)
+    SELECT gen_random_uuid(), ct.user_id, 'Practice 1', ct.id, n, ct.development_plan_id
+    FROM chosen_traits ct, generate_series(1, 2) n WHERE ct.user_id LIKE 'qp-user-%'
+    """,
+]
+
+ANALYZED_TABLES = [
+    "users", "development_plan", "sprints", "forms", "questions", "options",
+    "answers", "traits", "chosen_traits", "practices", "chosen_practices"
+]
+
+# name -> (table that must not be sequentially scanned, query)
+HOT_QUERIES = {
+    "forms_with_questions_options_get_all": ("forms", """
+        SELECT * FROM forms WHERE name = '1_STRENGTH_QUESTIONS' AND user_id = :user_id AND development_plan_id = :dev_plan_id
+    """),
+    "questions_by_form": ("questions", "SELECT * FROM questions WHERE form_id = :form_id"),
+    "options_by_question": ("options", "SELECT * FROM options WHERE question_id = :question_id"),
+    "answers_by_question": ("answers", "SELECT * FROM answers WHERE question_id = :question_id"),
+    "traits_get_top_bottom_five": ("traits", """
+        SELECT * FROM traits WHERE user_id = :user_id ORDER BY t_score DESC LIMIT 5
+    """),
+    "chosen_traits_get": ("chosen_traits", """
+        SELECT * FROM chosen_traits WHERE user_id = :user_id AND trait_type = 'STRENGTH' AND development_plan_id = :dev_plan_id
+    """),
+    "practices_by_chosen_trait": ("practices", "SELECT * FROM practices WHERE chosen_trait_id = :chosen_trait_id"),
+    "chosen_practices_get": ("chosen_practices", """
+        SELECT * FROM chosen_practices WHERE user_id = :user_id AND sprint_number = 1 AND development_plan_id = :dev_plan_id
+    """),
+    "sprint_get_current": ("sprints", """
+        SELECT * FROM sprints WHERE user_id = :user_id AND development_plan_id = :dev_plan_id AND number = 2
+    """),
+    "dev_plan_get_current": ("development_plan", """
+        SELECT max(number) FROM development_plan WHERE user_id = :user_id
+    """),
+}
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+def seq_scanned_tables(connection, query: str, parameters: dict):
+    plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {query}"), parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return {
+        node.get("Relation Name") for node in plan_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan"
+    }
+
+# name -> (table, True if the planner avoids a sequential scan of it)
+def check_hot_query_plans(users: int):
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            for statement in SEED_STATEMENTS:
+                connection.execute(text(statement), {"users": users})
+            for table in ANALYZED_TABLES:
+                connection.execute(text(f"ANALYZE {table}"))
+
+            sample = connection.execute(text(
+                """
+                SELECT f.user_id, f.development_plan_id AS dev_plan_id, f.id AS form_id,
+                       q.id AS question_id, ct.id AS chosen_trait_id
+                FROM forms f
+                JOIN questions q ON q.form_id = f.id
+                JOIN chosen_traits ct ON ct.development_plan_id = f.development_plan_id
+                WHERE f.user_id = 'qp-user-' || (:users / 2)
+                LIMIT 1
+                """
+            ), {"users": users}).mappings().one()
+
+            return {
+                name: (table, table not in seq_scanned_tables(connection, query, dict(sample)))
+                for name, (table, query) in HOT_QUERIES.items()
+            }
+        finally:
+            transaction.rollback()
+
+def main(users: int) -> bool:
+    results = check_hot_query_plans(users)
+    for name, (table, ok) in results.items():
+        print(f"{'ok' if ok else 'SEQ SCAN':>8}  {name} ({table})")
+    return all(ok for _, ok in results.values())
+
+if __name__ == "__main__":
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000) else 1)
@@ -0,0 +1,58 @@
+"""
+Query count and latency of the development-actions user context loaders.
+
+Compares UserDataService._load_user_base_data_sequential (one query per entity)
+with _load_user_base_data (single statement via user_ai_context_get) for one user,
+against the database in SQLALCHEMY_DATABASE_URL. Bypasses the user data cache.
+
+Usage: python -m benchmarks.user_context_queries <user_id> [runs]
+"""
+import sys
+import time
+import asyncio
+from sqlalchemy import event
+from app.database.connection import engine, SessionLocal
+from app.services.user_data_service import user_data_service
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+async def measure(loader, user_id: str, runs: int):
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    timings = []
+    try:
+        for _ in range(runs):
+            db = SessionLocal()
+            try:
+                started = time.perf_counter()
+                await loader(db=db, user_id=user_id)
+                timings.append((time.perf_counter() - started) * 1000)
+            finally:
+                db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+    timings.sort()
+    return {
+        "queries_per_load": counter.count / runs,
+        "median_ms": round(timings[len(timings) // 2], 2),
+        "min_ms": round(timings[0], 2)
+    }
+
+async def main(user_id: str, runs: int):
+    for name, loader in [
+        ("sequential", user_data_service._load_user_base_data_sequential),
+        ("single statement", user_data_service._load_user_base_data)
+    ]:
+        print(f"{name:>16}: {await measure(loader, user_id, runs)}")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 20))
@@ -0,0 +1,104 @@
+"""
+Insert throughput and primary-key index size of uuid4 vs uuid7 keys on an answers-shaped table.
+
+Creates two scratch tables (bench_answers_uuid4, bench_answers_uuid7) with the answers
+columns, seeds each with <seed_rows> rows in SQL (random keys for uuid4, keys with an
+increasing timestamp for uuid7), then inserts <batches> batches of 1000 rows generated
+by the application (uuid.uuid4 vs app.database.uuid7) and reports rows/s and the size
+of each primary key index. Runs against SQLALCHEMY_DATABASE_URL; the tables are dropped
+at the end.
+
+Usage: python -m benchmarks.uuid_primary_keys [seed_rows] [batches]
+"""
+import sys
+import time
+import uuid
+from sqlalchemy import text
+from app.database.connection import engine
+from app.database.uuid7 import uuid7
+
+BATCH_SIZE = 1000
+
+# Same layout as a uuid7: 48-bit millisecond timestamp over the random bits of gen_random_uuid
+SQL_UUID7 = """
+    encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    placing substring(int8send((extract(epoch from now()) * 1000)::bigint - :seed_rows + g) from 3)
+                    from 1 for 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+"""
+
+KEY_GENERATORS = {
+    "uuid4": ("gen_random_uuid()", uuid.uuid4),
+    "uuid7": (SQL_UUID7, uuid7),
+}
+
+def table_name(key_type: str):
+    return f"bench_answers_{key_type}"
+
+def create_and_seed(connection, key_type: str, seed_rows: int):
+    table = table_name(key_type)
+    sql_key, _ = KEY_GENERATORS[key_type]
+    connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    connection.execute(text(
+        f"""
+        CREATE TABLE {table} (
+            id UUID PRIMARY KEY,
+            form_id UUID,
+            question_id UUID,
+            option_id UUID,
+            answer VARCHAR
+        )
+        """
+    ))
+    connection.execute(text(
+        f"""
+        INSERT INTO {table} (id, form_id, question_id, option_id, answer)
+        SELECT {sql_key}, gen_random_uuid(), gen_random_uuid(), gen_random_uuid(), 'Seed answer ' || g
+        FROM generate_series(1, :seed_rows) g
+        """
+    ), {"seed_rows": seed_rows})
+    connection.execute(text(f"ANALYZE {table}"))
+
+def measure_inserts(connection, key_type: str, batches: int):
+    table = table_name(key_type)
+    _, generate_key = KEY_GENERATORS[key_type]
+    statement = text(f"INSERT INTO {table} (id, form_id, question_id, option_id, answer) VALUES (:id, :form_id, :question_id, :option_id, :answer)")
+
+    elapsed = 0.0
+    for _ in range(batches):
+        rows = [
+            {"id": generate_key(), "form_id": uuid.uuid4(), "question_id": uuid.uuid4(), "option_id": uuid.uuid4(), "answer": "Benchmark answer"}
+            for _ in range(BATCH_SIZE)
+        ]
+        started = time.perf_counter()
+        with connection.begin():
+            connection.execute(statement, rows)
+        elapsed += time.perf_counter() - started
+
+    with connection.begin():
+        index_bytes = connection.execute(text(f"SELECT pg_relation_size('{table}_pkey')")).scalar()
+    return {
+        "rows_per_s": round(batches * BATCH_SIZE / elapsed),
+        "pkey_index_mb": round(index_bytes / 1024 / 1024, 1)
+    }
+
+def main(seed_rows: int, batches: int):
+    with engine.connect() as connection:
+        try:
+            for key_type in KEY_GENERATORS:
+                with connection.begin():
+                    create_and_seed(connection, key_type, seed_rows)
+                print(f"{key_type}: {measure_inserts(connection, key_type, batches)}")
+        finally:
+            with connection.begin():
+                for key_type in KEY_GENERATORS:
+                    connection.execute(text(f"DROP TABLE IF EXISTS {table_name(key_type)}"))
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    )
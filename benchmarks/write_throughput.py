@@ -0,0 +1,111 @@
+"""
+Write throughput of form materialization and answer upserts, with and without the
+single-column indexes dropped by migration 5 (drop_unused_indexes).
+
+Creates 1_MIND_BODY_QUESTIONS forms with forms_create_many and saves an answer for
+every question of the form (found through form_questions, shared template questions have
+no form_id) with answers_upsert_many, against the database in SQLALCHEMY_DATABASE_URL.
+With --legacy-indexes the dropped indexes are recreated for the run and dropped again
+afterwards, giving the "before" numbers. Every created form is deleted again.
+
+Usage: python -m benchmarks.write_throughput <user_id> [runs] [--legacy-indexes]
+"""
+import sys
+import time
+import asyncio
+from sqlalchemy import text
+from app.database.connection import engine, SessionLocal
+from app.schemas.models import AnswerSchema
+from app.utils.forms_crud import forms_create_many, delete_form_and_associations
+from app.utils.answers_crud import answers_upsert_many
+from benchmarks.form_creation import mind_body_form
+
+# Indexes removed by migration 5: table -> indexed columns (ix_<table>_<column>)
+LEGACY_INDEXES = {
+    "forms": ["id", "sprint_number"],
+    "questions": ["id", "name", "option_type", "rank"],
+    "options": ["id", "name", "type", "trait_name"],
+    "answers": ["id", "answer"],
+}
+
+def set_legacy_indexes(enabled: bool):
+    with engine.begin() as connection:
+        for table, columns in LEGACY_INDEXES.items():
+            for column in columns:
+                if enabled:
+                    connection.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})"))
+                else:
+                    connection.execute(text(f"DROP INDEX IF EXISTS ix_{table}_{column}"))
+
+# Rows in the tables forms_create_many writes to. Only the first run creates the shared
+# question templates, later runs write the form and its form_questions links
+def count_form_rows(db) -> int:
+    return db.execute(text(
+        "SELECT (SELECT count(*) FROM forms) + (SELECT count(*) FROM form_questions)"
+        " + (SELECT count(*) FROM questions) + (SELECT count(*) FROM options)"
+    )).scalar()
+
+async def measure(user_id: str, runs: int):
+    form = mind_body_form(user_id)
+    create_timings, upsert_timings = [], []
+    created_rows, upserted_rows = 0, 0
+    db = SessionLocal()
+    try:
+        for _ in range(runs):
+            rows_before = count_form_rows(db)
+            started = time.perf_counter()
+            form_id = (await forms_create_many(db=db, forms=[form]))[0]
+            create_timings.append(time.perf_counter() - started)
+            created_rows += count_form_rows(db) - rows_before
+
+            questions = db.execute(
+                text(
+                    "SELECT q.id AS question_id, min(o.id::text) AS option_id FROM questions q"
+                    " JOIN form_questions fq ON fq.question_id = q.id"
+                    " JOIN options o ON o.question_id = q.id"
+                    " WHERE fq.form_id = :form_id GROUP BY q.id"
+                ),
+                {"form_id": form_id}
+            ).all()
+            answers = [
+                AnswerSchema(question_id=row.question_id, option_id=row.option_id, answer="Benchmark answer")
+                for row in questions
+            ]
+            if not answers:
+                raise RuntimeError(f"No questions found for form {form_id}, nothing to upsert")
+
+            started = time.perf_counter()
+            await answers_upsert_many(db=db, form_id=form_id, answers=answers)
+            upsert_timings.append(time.perf_counter() - started)
+            upserted_rows += len(answers)
+
+            delete_form_and_associations(db=db, form_id=form_id)
+    finally:
+        db.close()
+
+    create_median = sorted(create_timings)[len(create_timings) // 2]
+    upsert_median = sorted(upsert_timings)[len(upsert_timings) // 2]
+    # Throughput from the rows actually written over the total time, not an assumed row count
+    return {
+        "forms_create_median_ms": round(create_median * 1000, 2),
+        "forms_create_rows_per_s": round(created_rows / sum(create_timings)),
+        "answers_upsert_median_ms": round(upsert_median * 1000, 2),
+        "answers_upsert_rows_per_s": round(upserted_rows / sum(upsert_timings))
+    }
+
+async def main(user_id: str, runs: int, legacy_indexes: bool):
+    if legacy_indexes:
+        set_legacy_indexes(True)
+    try:
+        label = "with legacy indexes" if legacy_indexes else "current indexes"
+        print(f"{label}: {await measure(user_id, runs)}")
+    finally:
+        if legacy_indexes:
+            set_legacy_indexes(False)
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(main(args[0], int(args[1]) if len(args) > 1 else 20, "--legacy-indexes" in sys.argv))
@@ -1,16 +1,25 @@
 import uvicorn
 import os
+import logging
 import fastapi
 from app import create_app
 from dotenv import load_dotenv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from httpx import AsyncClient
-from datetime import timezone
-from app.database.connection import get_db
+from datetime import datetime, timezone
+from contextlib import closing
+from app.database.connection import SchedulerSessionLocal, engine, scheduler_engine, async_engine
+from app.database.pool_metrics import log_pool_stats
+from app.utils.generated_actions_cache_crud import generated_actions_cache_maintenance_job
+from app.ai.helpers.retrieval_cache import refresh_retrieval_index_versions_job
+from app.ai.const import RETRIEVAL_INDEX_VERSION_CHECK_SECONDS
 from app.email.colleague_emails import user_colleague_week_5_9_emails, user_colleague_week_12_emails
 from app.email.user_emails import user_weekly_email
 
 load_dotenv()
+# Library loggers stay at WARNING; the app's own INFO records (e.g. the DB pool stats) are shown
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logging.getLogger("app").setLevel(logging.INFO)
 print("Started App:", os.environ.get("APP_NAME", "Peak Test App"))
 
 app: fastapi.FastAPI = create_app()
@@ -21,16 +30,28 @@ async def check_user_activity():
         await client.get("/accounts/check-if-active")
 
 async def send_emails_job():
-    db = next(get_db())
-    await user_weekly_email(db=db)
-    await user_colleague_week_5_9_emails(db=db) # DISABLED: No longer sending week 5 and 9 emails in 4-week cycle
-    await user_colleague_week_12_emails(db=db)
+    with closing(SchedulerSessionLocal()) as db:
+        await user_weekly_email(db=db)
+        await user_colleague_week_5_9_emails(db=db) # DISABLED: No longer sending week 5 and 9 emails in 4-week cycle
+        await user_colleague_week_12_emails(db=db)
+    log_pool_stats("scheduler", scheduler_engine)
+
+def log_db_pool_stats_job():
+    log_pool_stats("api", engine)
+    log_pool_stats("api-async", async_engine.sync_engine)
+    log_pool_stats("scheduler", scheduler_engine)
 
 scheduler = AsyncIOScheduler()
 # Run check_user_activity every 3 weeks
 scheduler.add_job(check_user_activity, "interval", weeks=3)
 # Run the send_emails job to run daily
 scheduler.add_job(send_emails_job, "cron", hour=0, minute=0, timezone=timezone.utc) # fOR PRODUCTION: Run at midnight UTC daily
+# Log connection pool usage every 15 minutes
+scheduler.add_job(log_db_pool_stats_job, "interval", minutes=15)
+# Write batched cache access times and evict expired / least recently used generated actions every 15 minutes
+scheduler.add_job(generated_actions_cache_maintenance_job, "interval", minutes=15)
+# Re-read the retrieval index versions that cached documents and vectorstores are keyed by (first run at startup)
+scheduler.add_job(refresh_retrieval_index_versions_job, "interval", seconds=RETRIEVAL_INDEX_VERSION_CHECK_SECONDS, next_run_time=datetime.now(timezone.utc))
 # FOR DEV TESTING: Run the send_emails job every 2 minutes (aligned with week progression)
 # scheduler.add_job(send_emails_job, "cron", minute="*/2", timezone=timezone.utc) # FOR TESTING
 
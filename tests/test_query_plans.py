@@ -0,0 +1,26 @@
+"""
+Fails when a hot CRUD lookup regresses to a sequential scan (see benchmarks/query_plans.py).
+Needs a Postgres database in SQLALCHEMY_DATABASE_URL; skipped otherwise.
+"""
+import os
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+if not os.getenv("SQLALCHEMY_DATABASE_URL"):
+    pytest.skip("SQLALCHEMY_DATABASE_URL is not set", allow_module_level=True)
+
+from sqlalchemy.exc import OperationalError
+
+try:
+    # Importing connects to the database and runs the migrations
+    from benchmarks.query_plans import check_hot_query_plans
+except OperationalError as error:
+    pytest.skip(f"Database is not reachable: {error}", allow_module_level=True)
+
+
+def test_hot_queries_avoid_sequential_scans():
+    results = check_hot_query_plans(users=2000)
+
+    seq_scans = {name: table for name, (table, ok) in results.items() if not ok}
+    assert not seq_scans, f"Sequential scans in hot queries: {seq_scans}"